@@ -4,37 +4,334 @@ Handles both chat and voice interviews with real AI
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import heapq
+import itertools
 import logging
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 import json
+import re
 import uuid
 
+import numpy as np
+
 try:
     import openai
+    from openai import AsyncOpenAI
+    import httpx
     _openai_available = True
 except ImportError:
     _openai_available = False
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _http2_available = True
+except ImportError:
+    _http2_available = False
+
 try:
     from transformers import pipeline, AutoTokenizer, AutoModel
     import torch
-    import numpy as np
-    from sklearn.metrics.pairwise import cosine_similarity
+    from torch import nn
     _ml_available = True
 except ImportError:
     _ml_available = False
 
-from backend.database.sql_database import SessionLocal
-from backend.database.mongo_database import get_mongo_client
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
+try:
+    from numba import njit
+    _numba_available = True
+except ImportError:
+    _numba_available = False
+
+from backend.database.mongo_database import get_async_mongo_client
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 try:
     from backend.models.sql_models import InterviewSession, InterviewMessage, Candidate
 except ImportError:
     InterviewSession = InterviewMessage = Candidate = None
 from backend.utils.config import settings
+from backend.utils.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on in-flight OpenAI requests per agent
+LLM_MAX_CONCURRENCY = 16
+# Number of completed prompts kept in the dedup cache
+LLM_CACHE_SIZE = 1024
+# MongoDB duplicate key error code; a retried insert of an already stored document
+DUPLICATE_KEY_ERROR = 11000
+# Sessions whose running score vectors are kept in memory
+SCORE_VECTOR_CACHE_SIZE = 4096
+# Pooled connections kept open to the OpenAI API
+LLM_MAX_CONNECTIONS = 100
+# Worker threads for blocking model inference
+INFERENCE_WORKERS = 4
+# Debounce window (seconds) for coalescing session writes to MongoDB
+SESSION_FLUSH_DELAY = 0.25
+# Upper bound (seconds) on the backoff between retries of a failed session write
+SESSION_FLUSH_MAX_RETRY_DELAY = 30.0
+# Buffered message exchanges are inserted once this many are queued...
+MESSAGE_BATCH_SIZE = 50
+# ...or after this many seconds, whichever comes first
+MESSAGE_FLUSH_INTERVAL = 1.0
+
+# Number of recent candidate responses quoted in the evaluation summary
+SUMMARY_SAMPLE_SIZE = 5
+# Characters of each response kept for the summary prompt
+SUMMARY_SAMPLE_CHARS = 200
+
+# Top-level session fields a conversation turn may change
+SESSION_TURN_FIELDS = (
+    "current_question_index", "current_question", "status", "completed_at",
+    "recent_samples", "recent_samples_text"
+)
+
+# Word tokens and non-empty sentence segments, used for communication metrics
+_WORD_RE = re.compile(r"\w+")
+_SENT_RE = re.compile(r"[^.!?\s][^.!?]*")
+
+# Responses with fewer word tokens than this skip model-based analysis
+SHORT_RESPONSE_TOKENS = 5
+
+# Question category keywords, in priority order (first matching category wins)
+QUESTION_CATEGORY_KEYWORDS = {
+    "technical": ("technical", "code", "algorithm", "database", "system"),
+    "behavioral": ("time when", "situation", "experience", "example"),
+    "situational": ("would you", "how would", "what would"),
+}
+
+TECHNICAL_KEYWORDS = (
+    "algorithm", "database", "api", "framework", "architecture",
+    "scalability", "performance", "security", "testing", "deployment",
+    "microservices", "cloud", "devops", "agile", "scrum"
+)
+
+FLOW_INDICATORS = (
+    "first", "second", "then", "next", "finally", "however", "therefore",
+    "because", "since", "although", "moreover", "furthermore"
+)
+
+CONFIDENCE_PHRASES = {
+    "confident": (
+        "i am confident", "i know", "definitely", "certainly", "absolutely",
+        "i have experience", "i successfully", "i led", "i managed"
+    ),
+    "uncertain": (
+        "i think", "maybe", "perhaps", "i'm not sure", "i believe",
+        "probably", "might", "could be", "i guess"
+    ),
+}
+
+# Interview question banks by category (shared, read-only)
+_QUESTION_BANK = MappingProxyType({
+    "technical": (
+        "Explain the difference between synchronous and asynchronous programming.",
+        "How would you optimize a slow database query?",
+        "Describe your approach to debugging a complex issue in production.",
+        "What are the principles of good software design?",
+        "How do you ensure code quality in your projects?",
+        "Explain the concept of microservices and their benefits.",
+        "How would you handle a situation where your application needs to scale?",
+        "Describe your experience with version control and collaboration.",
+        "What testing strategies do you use in your development process?",
+        "How do you stay updated with new technologies and best practices?"
+    ),
+    "behavioral": (
+        "Tell me about a time when you had to work under pressure.",
+        "Describe a situation where you had to learn something new quickly.",
+        "How do you handle conflicts with team members?",
+        "Tell me about a project you're particularly proud of.",
+        "Describe a time when you made a mistake and how you handled it.",
+        "How do you prioritize tasks when you have multiple deadlines?",
+        "Tell me about a time when you had to give difficult feedback.",
+        "Describe your ideal work environment.",
+        "How do you handle criticism of your work?",
+        "Tell me about a time when you went above and beyond."
+    ),
+    "situational": (
+        "How would you approach a project with unclear requirements?",
+        "What would you do if you disagreed with your manager's decision?",
+        "How would you handle a situation where a team member isn't contributing?",
+        "What would you do if you discovered a security vulnerability?",
+        "How would you approach working with a difficult client?",
+        "What would you do if you realized you couldn't meet a deadline?",
+        "How would you handle a situation where you need to learn a new technology quickly?",
+        "What would you do if you found a bug in production?",
+        "How would you approach mentoring a junior developer?",
+        "What would you do if you had to work with legacy code?"
+    ),
+    "cultural": (
+        "What motivates you in your work?",
+        "How do you define success?",
+        "What type of work environment do you thrive in?",
+        "How do you handle work-life balance?",
+        "What are your long-term career goals?",
+        "How do you prefer to receive feedback?",
+        "What role do you typically take in team projects?",
+        "How do you approach continuous learning?",
+        "What values are important to you in a workplace?",
+        "How do you handle change and uncertainty?"
+    )
+})
+
+# Evaluation criteria and their weights (shared, read-only)
+_EVAL_CRITERIA = MappingProxyType({
+    "technical_competency": MappingProxyType({
+        "weight": 0.3,
+        "factors": ("accuracy", "depth", "problem_solving", "best_practices")
+    }),
+    "communication": MappingProxyType({
+        "weight": 0.25,
+        "factors": ("clarity", "articulation", "listening", "engagement")
+    }),
+    "cultural_fit": MappingProxyType({
+        "weight": 0.2,
+        "factors": ("values_alignment", "team_collaboration", "adaptability")
+    }),
+    "experience_relevance": MappingProxyType({
+        "weight": 0.15,
+        "factors": ("relevant_experience", "project_complexity", "leadership")
+    }),
+    "problem_solving": MappingProxyType({
+        "weight": 0.1,
+        "factors": ("analytical_thinking", "creativity", "decision_making")
+    })
+})
+
+# Welcome messages per interview type, formatted with the candidate name
+_WELCOME_TEMPLATES = MappingProxyType({
+    "technical": "Hello {name}! Welcome to your technical interview. I'm your AI interviewer, and I'll be assessing your technical skills and problem-solving abilities. We'll cover programming concepts, system design, and your hands-on experience. Are you ready to begin?",
+    "behavioral": "Hi {name}! I'm excited to learn more about your professional experiences and how you handle various workplace situations. This behavioral interview will help us understand your soft skills and cultural fit. Shall we get started?",
+    "comprehensive": "Welcome {name}! I'll be conducting a comprehensive interview covering both technical and behavioral aspects. We'll discuss your technical expertise, past experiences, and how you approach challenges. Ready to begin?"
+})
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when available"""
+    return orjson.loads(data) if _orjson_available else json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to a JSON string with orjson when available"""
+    if _orjson_available:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+# Fixed instructions live in the system message; user prompts carry only the turn's data
+AI_RESPONSE_SYSTEM_PROMPT = (
+    "You are a professional, encouraging AI interviewer. Given the question, the candidate's "
+    "answer and a score digest (comm=communication, tech=technical depth, 0-100; sent=sentiment), "
+    "reply naturally: acknowledge the answer, give brief feedback if appropriate, and transition "
+    "to the next question or follow-up. Keep it conversational and professional."
+)
+EVALUATION_SYSTEM_PROMPT = (
+    "You are an expert HR professional providing interview evaluations. Given the overall score, "
+    "per-criterion average scores (0-100) and sample responses, reply with JSON only, using keys: "
+    "interview_summary (2-3 sentences), strengths (top 3), areas_for_improvement (top 3), "
+    "hiring_recommendation (Strong Hire/Hire/Maybe/No Hire), recommendations (specific "
+    "suggestions for candidate development)."
+)
+
+# Short criterion names for prompt digests
+_CRITERION_ABBREVIATIONS = MappingProxyType({
+    "technical_competency": "tech",
+    "communication": "comm",
+    "cultural_fit": "culture",
+    "experience_relevance": "exp",
+    "problem_solving": "ps"
+})
+
+
+def _compact_scores(scores: Dict[str, float]) -> str:
+    """Render scores as a compact digest such as 'comm=72,tech=65'"""
+    return ",".join(
+        f"{_CRITERION_ABBREVIATIONS.get(criterion, criterion)}={score:.0f}"
+        for criterion, score in scores.items()
+    )
+
+
+def _score_totals(session_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert list scores (sessions stored before running totals) to {"sum", "count"} in place"""
+    scores = session_data.get("evaluation", {}).get("scores", {})
+    for criterion, entry in scores.items():
+        if isinstance(entry, list):
+            scores[criterion] = {"sum": float(sum(entry)), "count": len(entry)}
+    return session_data
+
+
+# Canned interviewer replies for well-understood turns, by quality bucket
+_CANNED_RESPONSES = MappingProxyType({
+    "strong": (
+        "Great answer - that was clear and well structured. Let's keep going.",
+        "Thank you, that's a thorough and well-reasoned response. Let's move on.",
+        "That's a strong answer with good detail. On to the next topic."
+    ),
+    "brief": (
+        "Thanks. Could you expand on that a little with a concrete example?",
+        "I'd love to hear more detail on that. Could you walk me through it?",
+        "Could you elaborate a bit more so I can understand your approach?"
+    )
+})
+
+
+def _canned_response(question_id: str, sentiment_label: str, quality_bucket: str) -> Optional[str]:
+    """Templated reply for a turn, or None when the model should answer"""
+    if quality_bucket == "strong" and sentiment_label != "positive":
+        return None
+    variants = _CANNED_RESPONSES.get(quality_bucket)
+    if not variants:
+        return None
+    # Stable per question so repeated turns read consistently
+    index = int(hashlib.md5(question_id.encode()).hexdigest(), 16) % len(variants)
+    return variants[index]
+
+
+# Average score thresholds for reporting a strength / an area for improvement
+STRENGTH_THRESHOLD = 80.0
+IMPROVEMENT_THRESHOLD = 60.0
+
+# Overall scores at or beyond these bounds get a templated summary without an OpenAI call
+CLEAR_HIRE_SCORE = 90.0
+CLEAR_REJECT_SCORE = 30.0
+
+
+if _numba_available:
+    @njit(cache=True, fastmath=True)
+    def _aggregate_scores(sums, counts, strength_threshold, improvement_threshold):
+        """Per-criterion means plus strength and improvement masks"""
+        n = sums.shape[0]
+        means = np.zeros(n, dtype=np.float64)
+        strengths = np.zeros(n, dtype=np.bool_)
+        improvements = np.zeros(n, dtype=np.bool_)
+        for i in range(n):
+            if counts[i] > 0:
+                means[i] = sums[i] / counts[i]
+                if means[i] >= strength_threshold:
+                    strengths[i] = True
+                elif means[i] < improvement_threshold:
+                    improvements[i] = True
+        return means, strengths, improvements
+else:
+    def _aggregate_scores(sums, counts, strength_threshold, improvement_threshold):
+        """Per-criterion means plus strength and improvement masks (vectorized)"""
+        scored = counts > 0
+        means = np.divide(sums, counts, out=np.zeros_like(sums, dtype=np.float64), where=scored)
+        return means, scored & (means >= strength_threshold), scored & (means < improvement_threshold)
+
+
 class InterviewAgent:
     def __init__(self):
         self.is_initialized = False
@@ -42,8 +339,57 @@ class InterviewAgent:
         self.emotion_classifier = None
         self.tokenizer = None
         self.embedding_model = None
-        self.question_bank = {}
-        self.evaluation_criteria = {}
+        self.tech_accuracy_head = None
+        self.question_bank = _QUESTION_BANK
+        self.evaluation_criteria = _EVAL_CRITERIA
+        
+        # Criteria weights frozen into a vector for overall scoring
+        self._criteria_keys = tuple(self.evaluation_criteria)
+        self._criteria_index = {criterion: i for i, criterion in enumerate(self._criteria_keys)}
+        self._criteria_weights = np.array(
+            [config["weight"] for config in self.evaluation_criteria.values()], dtype=np.float32
+        )
+        
+        # Sentiment/emotion pipelines are loaded on first use
+        self._pipeline_loaders = {}
+        self._pipeline_locks = {
+            "sentiment_analyzer": asyncio.Lock(),
+            "emotion_classifier": asyncio.Lock()
+        }
+        
+        # Precompiled keyword matchers
+        self._category_matcher = None
+        self._technical_matcher = None
+        self._flow_matcher = None
+        self._confidence_matcher = None
+        
+        # OpenAI call bookkeeping
+        self._llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        self._llm_cache: "OrderedDict[str, str]" = OrderedDict()
+        # Per-session running (sums, counts) vectors over _criteria_keys
+        self._session_score_vectors: "OrderedDict[str, tuple]" = OrderedDict()
+        self._llm_inflight: Dict[str, asyncio.Future] = {}
+        self._openai_client = None
+        
+        # Thread pool for sentiment/emotion/embedding inference
+        self._pool = None
+        
+        # Write-behind buffer of $set deltas, keyed by session id, plus the
+        # full documents they apply to (kept until the delta is written)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._session_docs: Dict[str, Dict[str, Any]] = {}
+        self._dirty_event = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Buffered message exchanges per session, inserted in batches
+        self._msg_buffers: Dict[str, List[Dict[str, Any]]] = {}
+        self._msg_buffered = 0
+        self._msg_flush_task: Optional[asyncio.Task] = None
+        
+        # Async (Motor) MongoDB handles, resolved once per agent
+        self._mongo = get_async_mongo_client().hr_system
+        self._sessions_col = self._mongo.interview_sessions
+        self._messages_col = self._mongo.interview_messages
 
     async def initialize(self):
         """Initialize AI models for interview processing"""
@@ -53,28 +399,46 @@ class InterviewAgent:
             # Initialize OpenAI
             openai.api_key = settings.OPENAI_API_KEY
             
-            # Load sentiment analysis model
-            self.sentiment_analyzer = pipeline(
-                "sentiment-analysis",
-                model="cardiffnlp/twitter-roberta-base-sentiment-latest"
-            )
-            
-            # Load emotion classification model
-            self.emotion_classifier = pipeline(
-                "text-classification",
-                model="j-hartmann/emotion-english-distilroberta-base"
-            )
+            # Sentiment and emotion models are deferred until a message needs them
+            use_cuda = torch.cuda.is_available()
+            pipeline_options = {
+                "device": 0 if use_cuda else -1,
+                "torch_dtype": torch.float16 if use_cuda else torch.float32
+            }
+            self._pipeline_loaders = {
+                "sentiment_analyzer": functools.partial(
+                    pipeline,
+                    "sentiment-analysis",
+                    model="cardiffnlp/twitter-roberta-base-sentiment-latest",
+                    **pipeline_options
+                ),
+                "emotion_classifier": functools.partial(
+                    pipeline,
+                    "text-classification",
+                    model="j-hartmann/emotion-english-distilroberta-base",
+                    **pipeline_options
+                )
+            }
             
             # Load embedding model for semantic analysis
             model_name = "sentence-transformers/all-MiniLM-L6-v2"
             self.tokenizer = AutoTokenizer.from_pretrained(model_name)
             self.embedding_model = AutoModel.from_pretrained(model_name)
             
-            # Load question banks
-            await self._load_question_banks()
+            # Optional local regressor for technical accuracy (replaces the OpenAI call)
+            self.tech_accuracy_head = self._load_tech_accuracy_head(settings.TECH_ACCURACY_HEAD_PATH)
             
-            # Load evaluation criteria
-            await self._load_evaluation_criteria()
+            # Run model inference off the event loop, concurrently per message
+            self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=INFERENCE_WORKERS)
+            
+            # Build keyword matchers once instead of rescanning per keyword
+            self._category_matcher = KeywordMatcher(QUESTION_CATEGORY_KEYWORDS)
+            self._technical_matcher = KeywordMatcher({"technical": TECHNICAL_KEYWORDS})
+            self._flow_matcher = KeywordMatcher({"flow": FLOW_INDICATORS})
+            self._confidence_matcher = KeywordMatcher(CONFIDENCE_PHRASES)
+            
+            # Start the background session writer
+            self._start_session_flusher()
             
             self.is_initialized = True
             logger.info("Interview Agent initialized successfully")
@@ -87,83 +451,35 @@ class InterviewAgent:
         """Check if agent is ready"""
         return self.is_initialized
 
-    async def _load_question_banks(self):
-        """Load interview question banks by category"""
-        self.question_bank = {
-            "technical": [
-                "Explain the difference between synchronous and asynchronous programming.",
-                "How would you optimize a slow database query?",
-                "Describe your approach to debugging a complex issue in production.",
-                "What are the principles of good software design?",
-                "How do you ensure code quality in your projects?",
-                "Explain the concept of microservices and their benefits.",
-                "How would you handle a situation where your application needs to scale?",
-                "Describe your experience with version control and collaboration.",
-                "What testing strategies do you use in your development process?",
-                "How do you stay updated with new technologies and best practices?"
-            ],
-            "behavioral": [
-                "Tell me about a time when you had to work under pressure.",
-                "Describe a situation where you had to learn something new quickly.",
-                "How do you handle conflicts with team members?",
-                "Tell me about a project you're particularly proud of.",
-                "Describe a time when you made a mistake and how you handled it.",
-                "How do you prioritize tasks when you have multiple deadlines?",
-                "Tell me about a time when you had to give difficult feedback.",
-                "Describe your ideal work environment.",
-                "How do you handle criticism of your work?",
-                "Tell me about a time when you went above and beyond."
-            ],
-            "situational": [
-                "How would you approach a project with unclear requirements?",
-                "What would you do if you disagreed with your manager's decision?",
-                "How would you handle a situation where a team member isn't contributing?",
-                "What would you do if you discovered a security vulnerability?",
-                "How would you approach working with a difficult client?",
-                "What would you do if you realized you couldn't meet a deadline?",
-                "How would you handle a situation where you need to learn a new technology quickly?",
-                "What would you do if you found a bug in production?",
-                "How would you approach mentoring a junior developer?",
-                "What would you do if you had to work with legacy code?"
-            ],
-            "cultural": [
-                "What motivates you in your work?",
-                "How do you define success?",
-                "What type of work environment do you thrive in?",
-                "How do you handle work-life balance?",
-                "What are your long-term career goals?",
-                "How do you prefer to receive feedback?",
-                "What role do you typically take in team projects?",
-                "How do you approach continuous learning?",
-                "What values are important to you in a workplace?",
-                "How do you handle change and uncertainty?"
-            ]
-        }
+    def _load_tech_accuracy_head(self, path: Optional[str]):
+        """Load the offline-trained embedding -> accuracy head, if configured"""
+        if not path:
+            return None
+        try:
+            state = torch.load(path, map_location="cpu")
+            if isinstance(state, nn.Module):
+                head = state
+            else:
+                head = nn.Linear(self.embedding_model.config.hidden_size, 1)
+                head.load_state_dict(state)
+            head.eval()
+            logger.info(f"Loaded technical accuracy head from {path}")
+            return head
+        except Exception as e:
+            logger.error(f"Failed to load technical accuracy head: {str(e)}")
+            return None
 
-    async def _load_evaluation_criteria(self):
-        """Load evaluation criteria for different aspects"""
-        self.evaluation_criteria = {
-            "technical_competency": {
-                "weight": 0.3,
-                "factors": ["accuracy", "depth", "problem_solving", "best_practices"]
-            },
-            "communication": {
-                "weight": 0.25,
-                "factors": ["clarity", "articulation", "listening", "engagement"]
-            },
-            "cultural_fit": {
-                "weight": 0.2,
-                "factors": ["values_alignment", "team_collaboration", "adaptability"]
-            },
-            "experience_relevance": {
-                "weight": 0.15,
-                "factors": ["relevant_experience", "project_complexity", "leadership"]
-            },
-            "problem_solving": {
-                "weight": 0.1,
-                "factors": ["analytical_thinking", "creativity", "decision_making"]
-            }
-        }
+    async def _ensure_pipeline(self, name: str):
+        """Return the named pipeline, loading it on first use"""
+        model = getattr(self, name)
+        if model is None:
+            async with self._pipeline_locks[name]:
+                model = getattr(self, name)
+                if model is None:
+                    logger.info(f"Loading {name} pipeline...")
+                    model = await asyncio.to_thread(self._pipeline_loaders[name])
+                    setattr(self, name, model)
+        return model
 
     async def start_session(self, candidate_id: str, interview_type: str, job_id: str, user_id: str) -> Dict[str, Any]:
         """Start a new interview session"""
@@ -181,7 +497,7 @@ class InterviewAgent:
                 "status": "active",
                 "current_question_index": 0,
                 "questions": questions,
-                "started_at": datetime.utcnow().isoformat(),
+                "started_at": datetime.utcnow(),
                 "interviewer_id": user_id,
                 "evaluation": {
                     "scores": {},
@@ -190,6 +506,9 @@ class InterviewAgent:
                 }
             }
             
+            # Pre-normalized question embedding matrix for relevance scoring
+            session_data.update(await self._build_question_embeddings(questions))
+            
             # Generate welcome message
             welcome_message = await self._generate_welcome_message(candidate_id, interview_type)
             session_data["welcome_message"] = welcome_message
@@ -211,11 +530,15 @@ class InterviewAgent:
             
             # Base questions by type
             if interview_type == "technical":
-                base_questions = self.question_bank["technical"][:5]
-                base_questions.extend(self.question_bank["behavioral"][:3])
+                base_questions = (
+                    self.question_bank["technical"][:5] +
+                    self.question_bank["behavioral"][:3]
+                )
             elif interview_type == "behavioral":
-                base_questions = self.question_bank["behavioral"][:6]
-                base_questions.extend(self.question_bank["cultural"][:2])
+                base_questions = (
+                    self.question_bank["behavioral"][:6] +
+                    self.question_bank["cultural"][:2]
+                )
             else:  # comprehensive
                 base_questions = (
                     self.question_bank["technical"][:3] +
@@ -224,14 +547,19 @@ class InterviewAgent:
                     self.question_bank["cultural"][:2]
                 )
             
+            # Generate all follow-ups concurrently instead of one call per question
+            follow_ups = await asyncio.gather(
+                *[self._generate_follow_up_questions(q) for q in base_questions]
+            )
+            
             # Convert to structured format
-            for i, question_text in enumerate(base_questions):
+            for i, (question_text, question_follow_ups) in enumerate(zip(base_questions, follow_ups)):
                 questions.append({
                     "id": f"q_{i+1}",
                     "text": question_text,
                     "category": self._categorize_question(question_text),
                     "expected_duration": 180,  # 3 minutes
-                    "follow_up_questions": await self._generate_follow_up_questions(question_text)
+                    "follow_up_questions": question_follow_ups
                 })
             
             return questions
@@ -240,18 +568,45 @@ class InterviewAgent:
             logger.error(f"Question generation error: {str(e)}")
             return []
 
+    async def _build_question_embeddings(self, questions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Embed all questions as one row-normalized float32 matrix.
+        
+        The matrix is stored as raw bytes so the session document stays
+        BSON-serializable; see _question_matrix for the reverse.
+        """
+        try:
+            if not _ml_available or not questions:
+                return {}
+            matrix = await self._run_inference(self._embed_batch_sync, [q["text"] for q in questions])
+            matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+            matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+            return {
+                "question_embedding_ids": [q["id"] for q in questions],
+                "question_embedding_dim": matrix.shape[1],
+                "question_embeddings": matrix.tobytes()
+            }
+            
+        except Exception as e:
+            logger.error(f"Question embedding error: {str(e)}")
+            return {}
+
+    @staticmethod
+    def _question_matrix(session_data: Dict[str, Any]):
+        """Return (question ids, normalized embedding matrix) for a session, if stored"""
+        buffer = session_data.get("question_embeddings")
+        if not buffer:
+            return None, None
+        matrix = np.frombuffer(buffer, dtype=np.float32).reshape(-1, session_data["question_embedding_dim"])
+        return session_data["question_embedding_ids"], matrix
+
     def _categorize_question(self, question_text: str) -> str:
         """Categorize question based on content"""
-        question_lower = question_text.lower()
+        matches = self._category_matcher.find(question_text.lower())
         
-        if any(word in question_lower for word in ["technical", "code", "algorithm", "database", "system"]):
-            return "technical"
-        elif any(word in question_lower for word in ["time when", "situation", "experience", "example"]):
-            return "behavioral"
-        elif any(word in question_lower for word in ["would you", "how would", "what would"]):
-            return "situational"
-        else:
-            return "cultural"
+        for category in QUESTION_CATEGORY_KEYWORDS:
+            if matches[category]:
+                return category
+        return "cultural"
 
     async def _generate_follow_up_questions(self, main_question: str) -> List[str]:
         """Generate follow-up questions using AI"""
@@ -268,17 +623,14 @@ class InterviewAgent:
             Return only the questions, one per line.
             """
             
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert interviewer creating follow-up questions."},
-                    {"role": "user", "content": prompt}
-                ],
+            content = await self._llm_call(
+                prompt,
+                system="You are an expert interviewer creating follow-up questions.",
                 max_tokens=200,
                 temperature=0.7
             )
             
-            follow_ups = response.choices[0].message.content.strip().split('\n')
+            follow_ups = content.split('\n')
             return [q.strip() for q in follow_ups if q.strip()]
             
         except Exception as e:
@@ -291,13 +643,8 @@ class InterviewAgent:
             # Get candidate info (simplified)
             candidate_name = "Candidate"  # Would fetch from database
             
-            welcome_templates = {
-                "technical": f"Hello {candidate_name}! Welcome to your technical interview. I'm your AI interviewer, and I'll be assessing your technical skills and problem-solving abilities. We'll cover programming concepts, system design, and your hands-on experience. Are you ready to begin?",
-                "behavioral": f"Hi {candidate_name}! I'm excited to learn more about your professional experiences and how you handle various workplace situations. This behavioral interview will help us understand your soft skills and cultural fit. Shall we get started?",
-                "comprehensive": f"Welcome {candidate_name}! I'll be conducting a comprehensive interview covering both technical and behavioral aspects. We'll discuss your technical expertise, past experiences, and how you approach challenges. Ready to begin?"
-            }
-            
-            return welcome_templates.get(interview_type, welcome_templates["comprehensive"])
+            template = _WELCOME_TEMPLATES.get(interview_type, _WELCOME_TEMPLATES["comprehensive"])
+            return template.format(name=candidate_name)
             
         except Exception as e:
             logger.error(f"Welcome message generation error: {str(e)}")
@@ -314,6 +661,9 @@ class InterviewAgent:
             # Analyze the response
             analysis = await self._analyze_response(message, session_data)
             
+            # Keep the summary's sample responses ready-made on the session
+            self._append_recent_sample(session_data, message)
+            
             # Update evaluation scores
             await self._update_evaluation_scores(session_data, analysis)
             
@@ -328,11 +678,18 @@ class InterviewAgent:
                 "analysis": analysis,
                 "next_action": next_action,
                 "session_status": session_data["status"],
-                "current_scores": session_data["evaluation"]["scores"]
+                "current_scores": self._average_scores(session_data["evaluation"]["scores"])
             }
             
-            # Update session data
-            await self._update_session_data(session_id, session_data)
+            # Persist only the fields this turn may have changed
+            delta = {
+                "evaluation.scores": session_data["evaluation"]["scores"],
+                "evaluation.overall_score": session_data["evaluation"]["overall_score"]
+            }
+            for field in SESSION_TURN_FIELDS:
+                if field in session_data:
+                    delta[field] = session_data[field]
+            await self._update_session_data(session_id, delta, session_data)
             
             return response_data
             
@@ -340,15 +697,37 @@ class InterviewAgent:
             logger.error(f"Message processing error: {str(e)}")
             raise
 
+    @staticmethod
+    def _append_recent_sample(session_data: Dict[str, Any], message: str):
+        """Roll a truncated response into the session's summary samples"""
+        sample = message[:SUMMARY_SAMPLE_CHARS]
+        if not sample:
+            return
+        samples = session_data.get("recent_samples", [])
+        samples = samples[-(SUMMARY_SAMPLE_SIZE - 1):] + [sample]
+        session_data["recent_samples"] = samples
+        session_data["recent_samples_text"] = "\n".join(samples)
+
     async def _analyze_response(self, message: str, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Comprehensive analysis of candidate's response"""
         try:
+            tokens = _WORD_RE.findall(message.lower())
+            if len(tokens) < SHORT_RESPONSE_TOKENS:
+                return self._short_response_analysis(tokens)
+            
+            # Sentiment, emotion and the response embedding run side by side
+            sentiment, emotion, response_embedding = await asyncio.gather(
+                self._analyze_sentiment(message),
+                self._analyze_emotion(message),
+                self._get_text_embedding(message)
+            )
+            
             analysis = {
-                "sentiment": await self._analyze_sentiment(message),
-                "emotion": await self._analyze_emotion(message),
-                "technical_content": await self._analyze_technical_content(message),
+                "sentiment": sentiment,
+                "emotion": emotion,
+                "technical_content": await self._analyze_technical_content(message, response_embedding),
                 "communication_quality": await self._analyze_communication_quality(message),
-                "relevance": await self._analyze_relevance(message, session_data),
+                "relevance": await self._analyze_relevance(message, session_data, response_embedding),
                 "completeness": await self._analyze_completeness(message, session_data),
                 "confidence_level": await self._analyze_confidence(message)
             }
@@ -359,10 +738,37 @@ class InterviewAgent:
             logger.error(f"Response analysis error: {str(e)}")
             return {}
 
+    @staticmethod
+    def _short_response_analysis(tokens: List[str]) -> Dict[str, Any]:
+        """Fixed low-quality analysis for trivially short replies (e.g. 'yes', 'ok')"""
+        return {
+            "sentiment": {"label": "NEUTRAL", "score": 0.5},
+            "emotion": {"emotion": "neutral", "confidence": 0.5},
+            "technical_content": {
+                "technical_keywords": [],
+                "technical_depth_score": 0,
+                "accuracy_score": 0.0,
+                "overall_technical_score": 0.0
+            },
+            "communication_quality": {
+                "word_count": len(tokens),
+                "sentence_count": 1,
+                "avg_sentence_length": len(tokens),
+                "clarity_score": 0.0,
+                "vocabulary_score": 0.0,
+                "structure_score": 0.0,
+                "overall_communication_score": 0.0
+            },
+            "relevance": 0.0,
+            "completeness": 0.0,
+            "confidence_level": 50.0
+        }
+
     async def _analyze_sentiment(self, message: str) -> Dict[str, Any]:
         """Analyze sentiment of the response"""
         try:
-            result = self.sentiment_analyzer(message)
+            sentiment_analyzer = await self._ensure_pipeline("sentiment_analyzer")
+            result = await self._run_inference(sentiment_analyzer, message)
             return {
                 "label": result[0]["label"],
                 "score": result[0]["score"]
@@ -374,7 +780,8 @@ class InterviewAgent:
     async def _analyze_emotion(self, message: str) -> Dict[str, Any]:
         """Analyze emotional tone of the response"""
         try:
-            result = self.emotion_classifier(message)
+            emotion_classifier = await self._ensure_pipeline("emotion_classifier")
+            result = await self._run_inference(emotion_classifier, message)
             return {
                 "emotion": result[0]["label"],
                 "confidence": result[0]["score"]
@@ -383,24 +790,17 @@ class InterviewAgent:
             logger.error(f"Emotion analysis error: {str(e)}")
             return {"emotion": "neutral", "confidence": 0.5}
 
-    async def _analyze_technical_content(self, message: str) -> Dict[str, Any]:
+    async def _analyze_technical_content(self, message: str, embedding=None) -> Dict[str, Any]:
         """Analyze technical depth and accuracy"""
         try:
             # Technical keywords and concepts
-            technical_keywords = [
-                "algorithm", "database", "api", "framework", "architecture",
-                "scalability", "performance", "security", "testing", "deployment",
-                "microservices", "cloud", "devops", "agile", "scrum"
-            ]
-            
-            message_lower = message.lower()
-            found_keywords = [kw for kw in technical_keywords if kw in message_lower]
+            found_keywords = self._technical_matcher.find(message.lower())["technical"]
             
             # Calculate technical depth score
             technical_score = min(len(found_keywords) * 10, 100)
             
             # Use AI to assess technical accuracy
-            accuracy_score = await self._assess_technical_accuracy(message)
+            accuracy_score = await self._assess_technical_accuracy(message, embedding)
             
             return {
                 "technical_keywords": found_keywords,
@@ -413,9 +813,17 @@ class InterviewAgent:
             logger.error(f"Technical analysis error: {str(e)}")
             return {"overall_technical_score": 50.0}
 
-    async def _assess_technical_accuracy(self, message: str) -> float:
+    async def _assess_technical_accuracy(self, message: str, embedding=None) -> float:
         """Use AI to assess technical accuracy of response"""
         try:
+            if self.tech_accuracy_head is not None:
+                if embedding is None or len(embedding) == 0:
+                    embedding = await self._get_text_embedding(message)
+                return self._score_technical_accuracy(embedding)
+            
+            if not settings.TECH_ACCURACY_LLM_FALLBACK:
+                return 50.0
+            
             prompt = f"""
             Assess the technical accuracy of this response on a scale of 0-100:
             "{message}"
@@ -429,39 +837,41 @@ class InterviewAgent:
             Return only a number between 0-100.
             """
             
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a technical expert evaluating accuracy."},
-                    {"role": "user", "content": prompt}
-                ],
+            score_text = await self._llm_call(
+                prompt,
+                system="You are a technical expert evaluating accuracy.",
                 max_tokens=10,
                 temperature=0.1
             )
             
-            score_text = response.choices[0].message.content.strip()
             return float(score_text) if score_text.isdigit() else 50.0
             
         except Exception as e:
             logger.error(f"Technical accuracy assessment error: {str(e)}")
             return 50.0
 
+    def _score_technical_accuracy(self, embedding) -> float:
+        """Score a response embedding with the local accuracy head (0-100)"""
+        features = torch.as_tensor(embedding, dtype=torch.float32)
+        with torch.no_grad():
+            score = torch.sigmoid(self.tech_accuracy_head(features)).item()
+        return score * 100
+
     async def _analyze_communication_quality(self, message: str) -> Dict[str, Any]:
         """Analyze communication quality"""
         try:
-            words = message.split()
-            sentences = message.split('.')
+            words = _WORD_RE.findall(message.lower())
             
             # Basic metrics
             word_count = len(words)
-            sentence_count = len([s for s in sentences if s.strip()])
-            avg_sentence_length = word_count / max(sentence_count, 1)
+            sentence_count = max(1, len(_SENT_RE.findall(message)))
+            avg_sentence_length = word_count / sentence_count
             
             # Clarity score based on sentence structure
             clarity_score = min(100, max(0, 100 - abs(avg_sentence_length - 15) * 2))
             
             # Vocabulary richness
-            unique_words = len(set(word.lower() for word in words))
+            unique_words = len(set(words))
             vocabulary_score = min(100, (unique_words / max(word_count, 1)) * 200)
             
             # Structure and coherence
@@ -485,13 +895,7 @@ class InterviewAgent:
         """Assess the structure and coherence of the response"""
         try:
             # Check for logical flow indicators
-            flow_indicators = [
-                "first", "second", "then", "next", "finally", "however", "therefore",
-                "because", "since", "although", "moreover", "furthermore"
-            ]
-            
-            message_lower = message.lower()
-            flow_count = sum(1 for indicator in flow_indicators if indicator in message_lower)
+            flow_count = self._flow_matcher.count(message.lower())["flow"]
             
             # Structure score based on flow indicators and length
             structure_score = min(100, flow_count * 15 + len(message.split()) * 0.5)
@@ -502,7 +906,7 @@ class InterviewAgent:
             logger.error(f"Structure assessment error: {str(e)}")
             return 50.0
 
-    async def _analyze_relevance(self, message: str, session_data: Dict[str, Any]) -> float:
+    async def _analyze_relevance(self, message: str, session_data: Dict[str, Any], response_embedding=None) -> float:
         """Analyze how relevant the response is to the question"""
         try:
             current_question = session_data.get("current_question", {})
@@ -511,11 +915,22 @@ class InterviewAgent:
             if not question_text:
                 return 50.0
             
-            # Use embeddings to calculate semantic similarity
-            question_embedding = await self._get_text_embedding(question_text)
-            response_embedding = await self._get_text_embedding(message)
+            if response_embedding is None:
+                response_embedding = await self._get_text_embedding(message)
             
-            similarity = cosine_similarity([question_embedding], [response_embedding])[0][0]
+            # Score against every question in one GEMV when the matrix is available
+            question_ids, question_matrix = self._question_matrix(session_data)
+            if question_matrix is not None and current_question.get("id") in question_ids:
+                response_vector = np.asarray(response_embedding, dtype=np.float32)
+                response_vector = response_vector / (np.linalg.norm(response_vector) + 1e-12)
+                scores = question_matrix @ response_vector
+                similarity = float(scores[question_ids.index(current_question["id"])])
+            else:
+                # Use embeddings to calculate semantic similarity
+                question_embedding = await self._get_text_embedding(question_text)
+                similarity = np.dot(question_embedding, response_embedding) / (
+                    np.linalg.norm(question_embedding) * np.linalg.norm(response_embedding) + 1e-12
+                )
             relevance_score = similarity * 100
             
             return max(0, min(100, relevance_score))
@@ -524,18 +939,39 @@ class InterviewAgent:
             logger.error(f"Relevance analysis error: {str(e)}")
             return 50.0
 
+    async def _run_inference(self, func, *args):
+        """Run a blocking model call on the inference thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, func, *args)
+
+    def _embed_sync(self, text: str):
+        """Compute a mean-pooled text embedding (blocking)"""
+        inputs = self.tokenizer(text, return_tensors="pt", truncation=True, padding=True)
+        
+        with torch.no_grad():
+            outputs = self.embedding_model(**inputs)
+            embeddings = outputs.last_hidden_state.mean(dim=1)
+        
+        return embeddings.numpy().flatten()
+
+    def _embed_batch_sync(self, texts: List[str]):
+        """Compute mean-pooled embeddings for several texts in one forward pass (blocking)"""
+        inputs = self.tokenizer(texts, return_tensors="pt", truncation=True, padding=True)
+        
+        with torch.no_grad():
+            outputs = self.embedding_model(**inputs)
+            # Exclude padding tokens so each row matches its unbatched embedding
+            mask = inputs["attention_mask"].unsqueeze(-1).to(outputs.last_hidden_state.dtype)
+            embeddings = (outputs.last_hidden_state * mask).sum(dim=1) / mask.sum(dim=1)
+        
+        return embeddings.numpy()
+
     async def _get_text_embedding(self, text: str):
         """Get text embedding using transformer model"""
         try:
             if not _ml_available:
                 return []
-            inputs = self.tokenizer(text, return_tensors="pt", truncation=True, padding=True)
-            
-            with torch.no_grad():
-                outputs = self.embedding_model(**inputs)
-                embeddings = outputs.last_hidden_state.mean(dim=1)
-            
-            return embeddings.numpy().flatten()
+            return await self._run_inference(self._embed_sync, text)
             
         except Exception as e:
             logger.error(f"Embedding generation error: {str(e)}")
@@ -574,20 +1010,9 @@ class InterviewAgent:
         """Analyze confidence level in the response"""
         try:
             # Confidence indicators
-            confident_phrases = [
-                "i am confident", "i know", "definitely", "certainly", "absolutely",
-                "i have experience", "i successfully", "i led", "i managed"
-            ]
-            
-            uncertain_phrases = [
-                "i think", "maybe", "perhaps", "i'm not sure", "i believe",
-                "probably", "might", "could be", "i guess"
-            ]
-            
-            message_lower = message.lower()
-            
-            confident_count = sum(1 for phrase in confident_phrases if phrase in message_lower)
-            uncertain_count = sum(1 for phrase in uncertain_phrases if phrase in message_lower)
+            indicator_counts = self._confidence_matcher.count(message.lower())
+            confident_count = indicator_counts["confident"]
+            uncertain_count = indicator_counts["uncertain"]
             
             # Calculate confidence score
             confidence_score = 50 + (confident_count * 10) - (uncertain_count * 5)
@@ -605,18 +1030,14 @@ class InterviewAgent:
             question_category = current_question.get("category", "")
             
             # Map analysis to evaluation criteria
-            scores = session_data["evaluation"]["scores"]
-            
             # Technical competency
             if question_category == "technical":
                 technical_score = analysis.get("technical_content", {}).get("overall_technical_score", 50)
-                scores["technical_competency"] = scores.get("technical_competency", [])
-                scores["technical_competency"].append(technical_score)
+                self._record_score(session_data, "technical_competency", technical_score)
             
             # Communication
             comm_score = analysis.get("communication_quality", {}).get("overall_communication_score", 50)
-            scores["communication"] = scores.get("communication", [])
-            scores["communication"].append(comm_score)
+            self._record_score(session_data, "communication", comm_score)
             
             # Cultural fit (for behavioral/cultural questions)
             if question_category in ["behavioral", "cultural"]:
@@ -624,8 +1045,7 @@ class InterviewAgent:
                     analysis.get("sentiment", {}).get("score", 0.5) * 50 +
                     analysis.get("confidence_level", 50)
                 ) / 2
-                scores["cultural_fit"] = scores.get("cultural_fit", [])
-                scores["cultural_fit"].append(cultural_score)
+                self._record_score(session_data, "cultural_fit", cultural_score)
             
             # Problem solving (for situational questions)
             if question_category == "situational":
@@ -633,8 +1053,7 @@ class InterviewAgent:
                     analysis.get("relevance", 50) +
                     analysis.get("completeness", 50)
                 ) / 2
-                scores["problem_solving"] = scores.get("problem_solving", [])
-                scores["problem_solving"].append(problem_solving_score)
+                self._record_score(session_data, "problem_solving", problem_solving_score)
             
             # Calculate overall score
             await self._calculate_overall_score(session_data)
@@ -642,21 +1061,83 @@ class InterviewAgent:
         except Exception as e:
             logger.error(f"Score update error: {str(e)}")
 
+    def _record_score(self, session_data: Dict[str, Any], criterion: str, value: float):
+        """Fold a score into the criterion's running sum and count, and the session's score vectors"""
+        index = self._criteria_index.get(criterion)
+        if index is not None:
+            # Resolved before the dict is updated, so a vector rebuilt from it is not double counted
+            sums, counts = self._score_vectors(session_data)
+            sums[index] += value
+            counts[index] += 1
+        
+        entry = session_data["evaluation"]["scores"].setdefault(criterion, {"sum": 0.0, "count": 0})
+        entry["sum"] += value
+        entry["count"] += 1
+
+    def _score_vectors(self, session_data: Dict[str, Any]) -> tuple:
+        """Running (sums, counts) arrays of a session over the criteria, rebuilt from its stored totals on a miss"""
+        session_id = session_data["id"]
+        vectors = self._session_score_vectors.get(session_id)
+        if vectors is not None:
+            self._session_score_vectors.move_to_end(session_id)
+            return vectors
+        
+        scores = session_data["evaluation"]["scores"]
+        sums = np.array([scores.get(c, {}).get("sum", 0.0) for c in self._criteria_keys], dtype=np.float64)
+        counts = np.array([scores.get(c, {}).get("count", 0) for c in self._criteria_keys], dtype=np.float64)
+        vectors = (sums, counts)
+        self._session_score_vectors[session_id] = vectors
+        if len(self._session_score_vectors) > SCORE_VECTOR_CACHE_SIZE:
+            self._session_score_vectors.popitem(last=False)
+        return vectors
+
+    @staticmethod
+    def _templated_evaluation_summary(overall_score: float, scores: Dict[str, float]) -> Dict[str, Any]:
+        """Deterministic summary for sessions with an extreme overall score"""
+        top = [c.replace('_', ' ') for c, _ in heapq.nlargest(3, scores.items(), key=lambda kv: kv[1])]
+        bottom = [c.replace('_', ' ') for c, _ in heapq.nsmallest(3, scores.items(), key=lambda kv: kv[1])]
+        
+        if overall_score >= CLEAR_HIRE_SCORE:
+            return {
+                "interview_summary": (
+                    f"The candidate performed exceptionally well with an overall score of {overall_score:.1f}/100, "
+                    f"showing particular strength in {', '.join(top) or 'all assessed areas'}."
+                ),
+                "strengths": [f"Strong {c}" for c in top],
+                "areas_for_improvement": [f"Continue developing {c}" for c in bottom],
+                "hiring_recommendation": "Strong Hire",
+                "recommendations": [f"Offer opportunities to apply {c} in a lead role" for c in top]
+            }
+        
+        return {
+            "interview_summary": (
+                f"The candidate scored {overall_score:.1f}/100 overall, well below the bar, "
+                f"with the weakest results in {', '.join(bottom) or 'all assessed areas'}."
+            ),
+            "strengths": [f"Relative strength in {c}" for c in top],
+            "areas_for_improvement": [f"Improve {c}" for c in bottom],
+            "hiring_recommendation": "No Hire",
+            "recommendations": [f"Build experience and practice in {c}" for c in bottom]
+        }
+
+    @staticmethod
+    def _average_scores(scores: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+        """Per-criterion averages from the running sums and counts"""
+        return {
+            criterion: entry["sum"] / entry["count"]
+            for criterion, entry in scores.items()
+            if entry["count"]
+        }
+
     async def _calculate_overall_score(self, session_data: Dict[str, Any]):
         """Calculate overall interview score"""
         try:
-            scores = session_data["evaluation"]["scores"]
-            criteria = self.evaluation_criteria
-            
-            weighted_score = 0.0
-            total_weight = 0.0
-            
-            for criterion, config in criteria.items():
-                if criterion in scores and scores[criterion]:
-                    avg_score = sum(scores[criterion]) / len(scores[criterion])
-                    weight = config["weight"]
-                    weighted_score += avg_score * weight
-                    total_weight += weight
+            # Running vectors are updated in place per response; no per-call dict walk
+            sums, counts = self._score_vectors(session_data)
+            mask = counts > 0
+            weights = self._criteria_weights[mask]
+            total_weight = float(weights.sum())
+            weighted_score = float(weights @ (sums[mask] / counts[mask]))
             
             if total_weight > 0:
                 overall_score = weighted_score / total_weight
@@ -674,45 +1155,36 @@ class InterviewAgent:
             current_question = session_data.get("current_question", {})
             question_text = current_question.get("text", "")
             
-            # Create context for AI response
-            context = {
-                "question": question_text,
-                "response_quality": analysis.get("communication_quality", {}),
-                "technical_depth": analysis.get("technical_content", {}),
-                "sentiment": analysis.get("sentiment", {}),
-                "session_progress": session_data.get("current_question_index", 0)
-            }
-            
-            prompt = f"""
-            You are an AI interviewer. The candidate just answered: "{message}"
-            
-            Question asked: "{question_text}"
-            
-            Response analysis:
-            - Communication quality: {context['response_quality'].get('overall_communication_score', 50)}/100
-            - Technical depth: {context['technical_depth'].get('overall_technical_score', 50)}/100
-            - Sentiment: {context['sentiment'].get('label', 'NEUTRAL')}
-            
-            Generate a natural, encouraging response that:
-            1. Acknowledges their answer
-            2. Provides brief feedback if appropriate
-            3. Transitions to the next question or follow-up
-            
-            Keep it conversational and professional.
-            """
-            
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a professional, encouraging AI interviewer."},
-                    {"role": "user", "content": prompt}
-                ],
+            # Clear-cut turns get a templated reply instead of an OpenAI call
+            quality = analysis.get("communication_quality", {})
+            if quality.get("word_count", SHORT_RESPONSE_TOKENS) < SHORT_RESPONSE_TOKENS:
+                quality_bucket = "brief"
+            elif quality.get("overall_communication_score", 50) >= STRENGTH_THRESHOLD:
+                quality_bucket = "strong"
+            else:
+                quality_bucket = "mixed"
+            canned = _canned_response(
+                current_question.get("id", ""),
+                analysis.get("sentiment", {}).get("label", "NEUTRAL").lower(),
+                quality_bucket
+            )
+            if canned is not None:
+                return canned
+            
+            digest = _compact_scores({
+                "communication": quality.get("overall_communication_score", 50),
+                "technical_competency": analysis.get("technical_content", {}).get("overall_technical_score", 50)
+            })
+            sentiment_label = analysis.get("sentiment", {}).get("label", "NEUTRAL")[:3].upper()
+            prompt = f'Q: "{question_text}"\nA: "{message}"\n{digest},sent={sentiment_label}'
+            
+            return await self._llm_call(
+                prompt,
+                system=AI_RESPONSE_SYSTEM_PROMPT,
                 max_tokens=200,
                 temperature=0.7
             )
             
-            return response.choices[0].message.content.strip()
-            
         except Exception as e:
             logger.error(f"AI response generation error: {str(e)}")
             return "Thank you for that response. Let me ask you another question."
@@ -720,8 +1192,8 @@ class InterviewAgent:
     async def _determine_next_action(self, session_data: Dict[str, Any], analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Determine what to do next in the interview"""
         try:
-            current_index = session_data.get("current_question_index", 0)
-            total_questions = len(session_data.get("questions", []))
+            questions = session_data.get("questions", [])
+            next_index = session_data.get("current_question_index", 0) + 1
             current_question = session_data.get("current_question", {})
             
             # Check if we need a follow-up question
@@ -739,9 +1211,9 @@ class InterviewAgent:
                     }
             
             # Move to next question
-            if current_index + 1 < total_questions:
-                next_question = session_data["questions"][current_index + 1]
-                session_data["current_question_index"] = current_index + 1
+            if next_index < len(questions):
+                next_question = questions[next_index]
+                session_data["current_question_index"] = next_index
                 session_data["current_question"] = next_question
                 
                 return {
@@ -752,7 +1224,7 @@ class InterviewAgent:
             else:
                 # End interview
                 session_data["status"] = "completed"
-                session_data["completed_at"] = datetime.utcnow().isoformat()
+                session_data["completed_at"] = datetime.utcnow()
                 
                 return {
                     "action": "end_interview",
@@ -780,33 +1252,46 @@ class InterviewAgent:
 
     async def store_session(self, session_data: Dict[str, Any], db_session, mongo_db):
         """Store interview session in databases"""
+        await self.store_sessions_bulk([session_data], db_session, mongo_db)
+
+    async def store_sessions_bulk(self, session_data_list: List[Dict[str, Any]], db_session, mongo_db):
+        """Store several interview sessions with one SQL commit and one Mongo insert"""
+        if not session_data_list:
+            return
         try:
-            # Store in SQL database
-            interview_session = InterviewSession(
-                id=session_data["id"],
-                candidate_id=session_data["candidate_id"],
-                job_id=session_data["job_id"],
-                interview_type=session_data["interview_type"],
-                status=session_data["status"],
-                started_at=datetime.fromisoformat(session_data["started_at"]),
-                interviewer_id=session_data["interviewer_id"],
-                overall_score=session_data["evaluation"]["overall_score"]
-            )
-            
-            db_session.add(interview_session)
-            db_session.commit()
+            # Store in SQL database (off the event loop)
+            mappings = [
+                {
+                    "id": session_data["id"],
+                    "candidate_id": session_data["candidate_id"],
+                    "job_id": session_data["job_id"],
+                    "interview_type": session_data["interview_type"],
+                    "status": session_data["status"],
+                    "started_at": session_data["started_at"],
+                    "interviewer_id": session_data["interviewer_id"],
+                    "overall_score": session_data["evaluation"]["overall_score"]
+                }
+                for session_data in session_data_list
+            ]
+            await asyncio.to_thread(self._insert_session_rows, db_session, mappings)
             
             # Store detailed session data in MongoDB
             mongo_collection = mongo_db.interview_sessions
-            await mongo_collection.insert_one(session_data)
+            await mongo_collection.insert_many(session_data_list, ordered=False)
             
-            logger.info(f"Interview session {session_data['id']} stored successfully")
+            logger.info(f"Stored {len(session_data_list)} interview session(s) successfully")
             
         except Exception as e:
             logger.error(f"Session storage error: {str(e)}")
-            db_session.rollback()
+            await asyncio.to_thread(db_session.rollback)
             raise
 
+    @staticmethod
+    def _insert_session_rows(db_session, mappings: List[Dict[str, Any]]):
+        """Insert InterviewSession rows and commit (blocking)"""
+        db_session.bulk_insert_mappings(InterviewSession, mappings)
+        db_session.commit()
+
     async def store_message(self, session_id: str, user_message: str, ai_response: Dict[str, Any], mongo_db):
         """Store interview message exchange"""
         try:
@@ -814,36 +1299,98 @@ class InterviewAgent:
                 "session_id": session_id,
                 "user_message": user_message,
                 "ai_response": ai_response,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcnow(),
                 "analysis": ai_response.get("analysis", {})
             }
             
-            mongo_collection = mongo_db.interview_messages
-            await mongo_collection.insert_one(message_data)
+            self._msg_buffers.setdefault(session_id, []).append(message_data)
+            self._msg_buffered += 1
             
+            if self._msg_buffered >= MESSAGE_BATCH_SIZE:
+                await self.flush_messages()
+            elif ai_response.get("session_status") == "completed":
+                await self.flush_messages(session_id)
+            else:
+                self._start_message_flusher()
+            
+        except Exception as e:
+            logger.error(f"Message storage error: {str(e)}")
+
+    def _start_message_flusher(self):
+        """Start the background message writer if it is not running"""
+        if self._msg_flush_task is None or self._msg_flush_task.done():
+            self._msg_flush_task = asyncio.create_task(self._flush_messages_loop())
+
+    async def _flush_messages_loop(self):
+        """Periodically insert buffered messages until the buffer is empty"""
+        while self._msg_buffered:
+            await asyncio.sleep(MESSAGE_FLUSH_INTERVAL)
+            await self.flush_messages()
+
+    async def flush_messages(self, session_id: Optional[str] = None):
+        """Insert buffered messages for one session, or for all sessions"""
+        if session_id is None:
+            buffers, self._msg_buffers = self._msg_buffers, {}
+            documents = [doc for docs in buffers.values() for doc in docs]
+        else:
+            documents = self._msg_buffers.pop(session_id, [])
+        
+        if not documents:
+            return
+        self._msg_buffered -= len(documents)
+        
+        unwritten = []
+        try:
+            await self._messages_col.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            # Unordered: everything but the reported documents was inserted. Duplicate keys
+            # mean an earlier, partly failed attempt already stored the document.
+            logger.error(f"Message storage error: {str(e)}")
+            unwritten = [
+                documents[error["index"]] for error in e.details.get("writeErrors", [])
+                if error.get("code") != DUPLICATE_KEY_ERROR
+            ]
         except Exception as e:
             logger.error(f"Message storage error: {str(e)}")
+            unwritten = documents
+        
+        if unwritten:
+            # Requeue ahead of messages buffered since, keeping each transcript in order
+            requeued: Dict[str, List[Dict[str, Any]]] = {}
+            for document in unwritten:
+                requeued.setdefault(document["session_id"], []).append(document)
+            for sid, docs in requeued.items():
+                self._msg_buffers[sid] = docs + self._msg_buffers.get(sid, [])
+            self._msg_buffered += len(unwritten)
+            self._start_message_flusher()
 
     async def get_evaluation(self, session_id: str, db_session) -> Dict[str, Any]:
         """Get comprehensive interview evaluation"""
         try:
-            # Get session from SQL
-            session_record = db_session.query(InterviewSession).filter(
-                InterviewSession.id == session_id
-            ).first()
+            # Get session from SQL and detailed data from MongoDB concurrently
+            session_record, session_data = await asyncio.gather(
+                asyncio.to_thread(
+                    lambda: db_session.query(InterviewSession).filter(
+                        InterviewSession.id == session_id
+                    ).first()
+                ),
+                self._get_session_data(session_id)
+            )
             
             if not session_record:
                 raise ValueError("Session not found")
-            
-            # Get detailed data from MongoDB
-            mongo_client = get_mongo_client()
-            mongo_db = mongo_client.hr_system
-            
-            session_collection = mongo_db.interview_sessions
-            session_data = await session_collection.find_one({"id": session_id})
-            
-            messages_collection = mongo_db.interview_messages
-            messages = await messages_collection.find({"session_id": session_id}).to_list(None)
+            if not session_data:
+                raise ValueError("Session data not found")
+            
+            # Sessions without precomputed samples quote the latest stored messages
+            messages = []
+            if "recent_samples_text" not in session_data:
+                await self.flush_messages(session_id)
+                recent = await self._messages_col.find(
+                    {"session_id": session_id},
+                    projection={"user_message": 1, "timestamp": 1}
+                ).sort("timestamp", -1).limit(SUMMARY_SAMPLE_SIZE).to_list(SUMMARY_SAMPLE_SIZE)
+                messages = recent[::-1]
             
             # Generate comprehensive evaluation
             evaluation = await self._generate_comprehensive_evaluation(session_data, messages)
@@ -854,13 +1401,73 @@ class InterviewAgent:
             logger.error(f"Evaluation retrieval error: {str(e)}")
             raise
 
+    async def get_evaluations_bulk(self, session_ids: List[str], db_session) -> Dict[str, Dict[str, Any]]:
+        """Get evaluations for several sessions with one query per store"""
+        evaluations = {session_id: {} for session_id in session_ids}
+        try:
+            # Sessions with unflushed turns are served from memory
+            sessions = {
+                session_id: self._session_docs[session_id]
+                for session_id in session_ids if session_id in self._session_docs
+            }
+            to_fetch = [session_id for session_id in session_ids if session_id not in sessions]
+            
+            records, fetched = await asyncio.gather(
+                asyncio.to_thread(
+                    lambda: db_session.query(InterviewSession.id).filter(
+                        InterviewSession.id.in_(session_ids)
+                    ).all()
+                ),
+                self._sessions_col.find({"id": {"$in": to_fetch}}).to_list(None)
+            )
+            known_ids = {record.id for record in records}
+            sessions.update((doc["id"], _score_totals(doc)) for doc in fetched)
+            
+            for session_id in session_ids:
+                if session_id not in known_ids or session_id not in sessions:
+                    logger.error(f"Bulk evaluation error for {session_id}: session not found")
+                    sessions.pop(session_id, None)
+            
+            # Latest responses for sessions without precomputed samples, in one aggregation
+            messages_by_session = {}
+            legacy_ids = [sid for sid, doc in sessions.items() if "recent_samples_text" not in doc]
+            if legacy_ids:
+                for session_id in legacy_ids:
+                    await self.flush_messages(session_id)
+                grouped = await self._messages_col.aggregate([
+                    {"$match": {"session_id": {"$in": legacy_ids}}},
+                    {"$sort": {"timestamp": -1}},
+                    {"$group": {"_id": "$session_id", "user_messages": {"$push": "$user_message"}}},
+                    {"$project": {"user_messages": {"$slice": ["$user_messages", SUMMARY_SAMPLE_SIZE]}}}
+                ]).to_list(None)
+                for group in grouped:
+                    messages_by_session[group["_id"]] = [
+                        {"user_message": text} for text in reversed(group["user_messages"])
+                    ]
+            
+            # Summary generation overlaps across sessions
+            session_list = list(sessions.items())
+            results = await asyncio.gather(
+                *[
+                    self._generate_comprehensive_evaluation(doc, messages_by_session.get(session_id, []))
+                    for session_id, doc in session_list
+                ]
+            )
+            for (session_id, _), result in zip(session_list, results):
+                evaluations[session_id] = result
+            
+        except Exception as e:
+            logger.error(f"Bulk evaluation retrieval error: {str(e)}")
+        
+        return evaluations
+
     async def _generate_comprehensive_evaluation(self, session_data: Dict[str, Any], messages: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate comprehensive evaluation report"""
         try:
             evaluation = {
                 "session_id": session_data["id"],
                 "overall_score": session_data["evaluation"]["overall_score"],
-                "detailed_scores": session_data["evaluation"]["scores"],
+                "detailed_scores": self._average_scores(session_data["evaluation"]["scores"]),
                 "strengths": [],
                 "areas_for_improvement": [],
                 "recommendations": [],
@@ -873,13 +1480,18 @@ class InterviewAgent:
             scores = session_data["evaluation"]["scores"]
             
             # Identify strengths and weaknesses
-            for criterion, score_list in scores.items():
-                if score_list:
-                    avg_score = sum(score_list) / len(score_list)
-                    if avg_score >= 80:
-                        evaluation["strengths"].append(f"Strong {criterion.replace('_', ' ')}")
-                    elif avg_score < 60:
-                        evaluation["areas_for_improvement"].append(f"Improve {criterion.replace('_', ' ')}")
+            criteria = list(scores)
+            _, strong, weak = _aggregate_scores(
+                np.fromiter((scores[c]["sum"] for c in criteria), dtype=np.float64, count=len(criteria)),
+                np.fromiter((scores[c]["count"] for c in criteria), dtype=np.int64, count=len(criteria)),
+                STRENGTH_THRESHOLD,
+                IMPROVEMENT_THRESHOLD
+            )
+            strengths = list(itertools.compress(criteria, strong.tolist()))
+            improvements = list(itertools.compress(criteria, weak.tolist()))
+            
+            evaluation["strengths"].extend(f"Strong {c.replace('_', ' ')}" for c in strengths)
+            evaluation["areas_for_improvement"].extend(f"Improve {c.replace('_', ' ')}" for c in improvements)
             
             # Generate AI-powered summary and recommendations
             ai_summary = await self._generate_ai_evaluation_summary(session_data, messages)
@@ -896,50 +1508,37 @@ class InterviewAgent:
         try:
             # Prepare context for AI
             overall_score = session_data["evaluation"]["overall_score"]
-            scores = session_data["evaluation"]["scores"]
-            
-            # Sample responses for analysis
-            sample_responses = []
-            for msg in messages[-5:]:  # Last 5 responses
-                if msg.get("user_message"):
-                    sample_responses.append(msg["user_message"][:200])  # Truncate for token limits
+            scores = self._average_scores(session_data["evaluation"]["scores"])
             
-            prompt = f"""
-            Generate a comprehensive interview evaluation based on:
-            
-            Overall Score: {overall_score:.1f}/100
-            Detailed Scores: {json.dumps(scores, indent=2)}
+            # Clear-cut outcomes don't need the model
+            if overall_score >= CLEAR_HIRE_SCORE or overall_score <= CLEAR_REJECT_SCORE:
+                return self._templated_evaluation_summary(overall_score, scores)
             
-            Sample Responses:
-            {chr(10).join(sample_responses)}
-            
-            Provide:
-            1. Interview Summary (2-3 sentences)
-            2. Top 3 Strengths
-            3. Top 3 Areas for Improvement
-            4. Hiring Recommendation (Strong Hire/Hire/Maybe/No Hire)
-            5. Specific Recommendations for candidate development
+            # Sample responses for analysis
+            samples_text = session_data.get("recent_samples_text")
+            if samples_text is None:
+                samples_text = "\n".join(
+                    msg["user_message"][:SUMMARY_SAMPLE_CHARS]  # Truncate for token limits
+                    for msg in messages[-SUMMARY_SAMPLE_SIZE:]  # Most recent responses
+                    if msg.get("user_message")
+                )
             
-            Format as JSON with keys: interview_summary, strengths, areas_for_improvement, hiring_recommendation, recommendations
-            """
+            prompt = f"overall={overall_score:.1f}\nscores: {_compact_scores(scores)}\nsamples:\n{samples_text}"
             
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert HR professional providing interview evaluations."},
-                    {"role": "user", "content": prompt}
-                ],
+            content = await self._llm_call(
+                prompt,
+                system=EVALUATION_SYSTEM_PROMPT,
                 max_tokens=800,
                 temperature=0.3
             )
             
             try:
-                ai_evaluation = json.loads(response.choices[0].message.content)
+                ai_evaluation = _json_loads(content)
                 return ai_evaluation
-            except json.JSONDecodeError:
+            except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
                 # Fallback if JSON parsing fails
                 return {
-                    "interview_summary": response.choices[0].message.content[:200],
+                    "interview_summary": content[:200],
                     "hiring_recommendation": "Hire" if overall_score >= 70 else "Maybe"
                 }
             
@@ -950,31 +1549,159 @@ class InterviewAgent:
                 "hiring_recommendation": "Review Required"
             }
 
+    def _get_openai_client(self):
+        """Shared OpenAI client over one pooled (HTTP/2 when available) connection pool"""
+        if self._openai_client is None:
+            self._openai_client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=httpx.AsyncClient(
+                    http2=_http2_available,
+                    limits=httpx.Limits(max_connections=LLM_MAX_CONNECTIONS),
+                    timeout=30
+                )
+            )
+        return self._openai_client
+
+    async def close(self):
+        """Release the shared OpenAI HTTP connections"""
+        if self._openai_client is not None:
+            await self._openai_client.close()
+            self._openai_client = None
+
+    async def _llm_call(self, prompt: str, system: str, model: str = "gpt-3.5-turbo",
+                        temperature: float = 0.7, max_tokens: int = 200) -> str:
+        """Run a chat completion with bounded concurrency and prompt dedup"""
+        key = hashlib.sha256(
+            _json_dumps([model, system, prompt, temperature, max_tokens]).encode()
+        ).hexdigest()
+        
+        # Identical prompt already answered
+        if key in self._llm_cache:
+            self._llm_cache.move_to_end(key)
+            return self._llm_cache[key]
+        
+        # Identical prompt currently in flight - share its result
+        pending = self._llm_inflight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # this waiter was cancelled
+                # The owning call was cancelled; make (or join) a fresh call instead
+                return await self._llm_call(prompt, system, model, temperature, max_tokens)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._llm_inflight[key] = future
+        try:
+            async with self._llm_semaphore:
+                response = await self._get_openai_client().chat.completions.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+            content = response.choices[0].message.content.strip()
+            
+            self._llm_cache[key] = content
+            if len(self._llm_cache) > LLM_CACHE_SIZE:
+                self._llm_cache.popitem(last=False)
+            
+            future.set_result(content)
+            return content
+            
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else is waiting
+            raise
+        finally:
+            # Cancelled owner (or any other BaseException): release the coalesced waiters too
+            if not future.done():
+                future.cancel()
+            self._llm_inflight.pop(key, None)
+
     async def _get_session_data(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get session data from MongoDB"""
+        """Get session data, preferring updates not yet written to MongoDB"""
         try:
-            mongo_client = get_mongo_client()
-            mongo_db = mongo_client.hr_system
-            mongo_collection = mongo_db.interview_sessions
+            session_data = self._session_docs.get(session_id)
+            if session_data is not None:
+                return session_data
             
-            session_data = await mongo_collection.find_one({"id": session_id})
-            return session_data
+            session_data = await self._sessions_col.find_one({"id": session_id})
+            return _score_totals(session_data) if session_data else None
             
         except Exception as e:
             logger.error(f"Session data retrieval error: {str(e)}")
             return None
 
-    async def _update_session_data(self, session_id: str, session_data: Dict[str, Any]):
-        """Update session data in MongoDB"""
+    async def _update_session_data(self, session_id: str, delta: Dict[str, Any],
+                                   session_data: Dict[str, Any]):
+        """Queue a $set of changed fields for a debounced write to MongoDB.
+        
+        ``session_data`` is the already-updated document; it is served to
+        readers until the delta has been written.
+        """
+        self._session_docs[session_id] = session_data
+        self._pending.setdefault(session_id, {}).update(delta)
+        self._dirty_event.set()
+        self._start_session_flusher()
+
+    def _start_session_flusher(self):
+        """Start the background session writer if it is not running"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_sessions_loop())
+
+    async def _flush_sessions_loop(self):
+        """Coalesce queued session updates into periodic bulk writes, backing off while writes fail"""
+        delay = SESSION_FLUSH_DELAY
+        while True:
+            await self._dirty_event.wait()
+            await asyncio.sleep(delay)
+            self._dirty_event.clear()
+            if await self._write_pending_sessions():
+                delay = SESSION_FLUSH_DELAY
+            else:
+                delay = min(delay * 2, SESSION_FLUSH_MAX_RETRY_DELAY)
+
+    async def _write_pending_sessions(self) -> bool:
+        """Write all queued session deltas in one bulk operation; False if they were requeued"""
+        if not self._pending:
+            return True
+        
+        batch, self._pending = self._pending, {}
         try:
-            mongo_client = get_mongo_client()
-            mongo_db = mongo_client.hr_system
-            mongo_collection = mongo_db.interview_sessions
-            
-            await mongo_collection.replace_one(
-                {"id": session_id},
-                session_data
+            await self._sessions_col.bulk_write(
+                [UpdateOne({"id": session_id}, {"$set": delta}) for session_id, delta in batch.items()],
+                ordered=False
             )
             
         except Exception as e:
             logger.error(f"Session data update error: {str(e)}")
+            # Requeue, letting newer values for the same fields win
+            for session_id, delta in batch.items():
+                self._pending[session_id] = {**delta, **self._pending.get(session_id, {})}
+            # Wake the writer again; nothing else may touch these sessions before shutdown
+            self._dirty_event.set()
+            return False
+        
+        # Written sessions without newer changes are read from MongoDB again
+        for session_id in batch:
+            if session_id not in self._pending:
+                self._session_docs.pop(session_id, None)
+        return True
+
+    async def flush_sessions(self):
+        """Stop the background writer and persist any queued session updates"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        
+        self._dirty_event.clear()
+        await self._write_pending_sessions()
@@ -4,57 +4,461 @@ Handles chat, voice, video interviews with full AI evaluation
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime, timedelta
+import multiprocessing
+import os
+import time
+from typing import Dict, List, Optional, Any, Union, Callable, Awaitable
+from datetime import datetime
 import json
+import re
 import uuid
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+
+# Required: score weights, hiring bands and packed score columns are numpy arrays at import
+import numpy as np
 
 try:
-    import openai
+    from openai import AsyncOpenAI
+    import httpx
     _openai_available = True
 except ImportError:
     _openai_available = False
 
 try:
-    import numpy as np
-    from sklearn.metrics.pairwise import cosine_similarity
-    import spacy
-    from transformers import pipeline, AutoTokenizer, AutoModel
+    from transformers import pipeline, AutoTokenizer, AutoModel, AutoModelForSequenceClassification
     import torch
+    from torch import nn
     _ml_available = True
 except ImportError:
     _ml_available = False
 
+try:
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    _onnx_available = True
+except ImportError:
+    _onnx_available = False
+
+try:
+    from optimum.bettertransformer import BetterTransformer
+    _bettertransformer_available = True
+except ImportError:
+    _bettertransformer_available = False
+
+try:
+    import orjson
+    _orjson_available = True
+except ImportError:
+    _orjson_available = False
+
+try:
+    import redis.asyncio as aioredis
+    _redis_available = True
+except ImportError:
+    _redis_available = False
+
+try:
+    from numba import njit
+    _numba_available = True
+except ImportError:
+    _numba_available = False
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
 from ..base_agent import BaseAgent
 from .question_generator import QuestionGenerator
 from .evaluation_engine import EvaluationEngine
 from .voice_processor import VoiceProcessor
 from .video_analyzer import VideoAnalyzer
 from .behavioral_analyzer import BehavioralAnalyzer
-from backend.database.mongo_database import get_mongo_client
+from backend.database.mongo_database import get_async_mongo_client
 from backend.database.sql_database import SessionLocal
 from models.sql_models import InterviewSession, Candidate, Job
 from backend.utils.config import settings
+from backend.utils.async_batcher import AsyncBatcher
+from backend.utils.keyword_matcher import KeywordMatcher
+from backend.utils.response_cache import ResponseCache
+from backend.utils.scoring import pack_scores, unpack_scores, hire_band
 
 logger = logging.getLogger(__name__)
 
+# Micro-batching of sentiment/emotion pipeline calls across concurrent responses
+PIPELINE_BATCH_SIZE_GPU = 16
+PIPELINE_BATCH_SIZE_CPU = 8
+PIPELINE_BATCH_WAIT_MS = 20
+
+# Token cap for sentence/answer embeddings
+EMBEDDING_MAX_LENGTH = 128
+# Batched texts are grouped by token length so short ones aren't padded to the longest
+EMBEDDING_LENGTH_BUCKETS = (32, 64, EMBEDDING_MAX_LENGTH)
+# Question embeddings kept in memory; questions are re-asked across retries
+QUESTION_EMBEDDING_CACHE_SIZE = 1024
+
+# (batch_size, seq_len) shapes compiled ahead of the first real request
+COMPILE_WARMUP_SHAPES = ((1, EMBEDDING_MAX_LENGTH), (8, EMBEDDING_MAX_LENGTH), (16, EMBEDDING_MAX_LENGTH))
+
+SENTIMENT_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+EMOTION_MODEL = "j-hartmann/emotion-english-distilroberta-base"
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+ONNX_EMBEDDING_FILE = "model_quantized.onnx"
+
+# Technical-accuracy scoring asks for a bare 0-100 number; a small model is enough
+TECH_ACCURACY_MODEL = "gpt-4o-mini"
+TECH_ACCURACY_MAX_TOKENS = 4
+# Scores are reused for identical (question, response) pairs, e.g. retries and re-runs
+TECH_ACCURACY_CACHE_SIZE = 4096
+TECH_ACCURACY_CACHE_TTL = 24 * 3600
+_SCORE_RE = re.compile(r"\d+(?:\.\d+)?")
+# Per-response aspect weights for the overall response score
+SCORE_WEIGHT_KEYS = (
+    "technical_competency", "behavioral_competency", "communication", "relevance", "attitude", "confidence"
+)
+SCORE_WEIGHT_VEC = np.array([0.3, 0.3, 0.25, 0.15, 0.05, 0.05], dtype=np.float32)
+DEFAULT_SCORE_WEIGHT = 0.1
+
+RED_FLAG_SCORE = 40
+EXCEPTIONAL_SCORE = 90
+
+if _numba_available:
+    @njit(cache=True, fastmath=True)
+    def _trend_stats(scores):
+        """First-half and second-half means of a score array"""
+        n = scores.size
+        half = n // 2
+        first = 0.0
+        for i in range(half):
+            first += scores[i]
+        second = 0.0
+        for i in range(half, n):
+            second += scores[i]
+        return first / half, second / (n - half)
+
+    # Compile (or load the on-disk cache) at import rather than on the first report
+    _trend_stats(np.zeros(2, dtype=np.float32))
+else:
+    def _trend_stats(scores):
+        """First-half and second-half means of a score array (vectorized)"""
+        half = scores.size // 2
+        return float(scores[:half].mean()), float(scores[half:].mean())
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when available"""
+    return orjson.loads(data) if _orjson_available else json.loads(data)
+
+
+def _json_default(obj):
+    """Packed score columns serialize as lists of ints"""
+    if isinstance(obj, bytes):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj, indent: bool = False) -> str:
+    """Serialize to a compact (or 2-space indented) JSON string with orjson when available"""
+    if _orjson_available:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 if indent else None).decode()
+    if indent:
+        return json.dumps(obj, indent=2, default=_json_default)
+    return json.dumps(obj, separators=(",", ":"), default=_json_default)
+
+
+# Per-response feedback prompt: fixed instructions plus a compact JSON payload
+FEEDBACK_SYSTEM_PROMPT = (
+    "You are a professional, encouraging AI interviewer providing constructive feedback. "
+    "The user message is JSON describing one interview answer: q=question, r=response "
+    "(may be truncated), s=overall score out of 100, pos=strengths, neg=areas for improvement. "
+    "Reply with: a positive acknowledgment of the response, the specific strengths, "
+    "constructive suggestions for improvement (if any), and encouragement for the next question. "
+    "Keep it professional, encouraging, and under 150 words."
+)
+# Canned feedback for scores where the LLM output is near-constant (ENABLE_STATIC_FEEDBACK)
+STATIC_FEEDBACK = MappingProxyType({
+    "strong": "Excellent response! Your answer was clear, relevant, and well supported with specifics. Keep bringing that same depth to the next question.",
+    "weak": "Thank you for your response. Consider addressing the question more directly and supporting your points with concrete examples from your experience. Let's continue with the next question."
+})
+STATIC_FEEDBACK_STRONG_SCORE = 90
+STATIC_FEEDBACK_WEAK_SCORE = 40
+FEEDBACK_QUESTION_CHARS = 200
+FEEDBACK_RESPONSE_CHARS = 400
+FEEDBACK_MAX_POINTS = 3
+
+# Static prompt backbones; only the dynamic slots are filled per call
+TECH_ACCURACY_PROMPT = (
+    "Assess the technical accuracy of this response on a scale of 0-100:\n\n"
+    "Question: {question}\n"
+    "Response: {response}\n\n"
+    "Consider:\n"
+    "1. Factual correctness\n"
+    "2. Proper use of technical terminology\n"
+    "3. Logical reasoning and approach\n"
+    "4. Completeness of the answer\n"
+    "5. Best practices mentioned\n\n"
+    "Return only a number between 0-100."
+).format
+EVALUATION_SUMMARY_PROMPT = (
+    "Generate a comprehensive interview evaluation summary:\n\n"
+    "Interview Details:\n"
+    "- Type: {interview_type}\n"
+    "- Overall Score: {overall_score:.1f}/100\n"
+    "- Category Scores: {category_scores}\n\n"
+    "Candidate Background: {background}\n"
+    "Job Role: {job_title}\n\n"
+    "Provide a professional evaluation summary including:\n"
+    "1. Overall performance assessment\n"
+    "2. Key strengths demonstrated\n"
+    "3. Areas needing development\n"
+    "4. Fit for the role\n"
+    "5. Specific recommendations\n\n"
+    "Keep it professional and constructive, around 200-250 words."
+).format
+
+# Session-start greetings, filled with str.format(name=..., job=...)
+WELCOME_TEMPLATES = MappingProxyType({
+    "technical": "Hello {name}! Welcome to your technical interview for {job}. I'm your AI interviewer, and I'll be assessing your technical skills, problem-solving abilities, and coding expertise. We'll cover various technical topics relevant to the role. Are you ready to begin?",
+    "behavioral": "Hi {name}! I'm excited to learn more about your professional experiences and how you handle various workplace situations. This behavioral interview will help us understand your soft skills, leadership qualities, and cultural fit for {job}. Shall we get started?",
+    "comprehensive": "Welcome {name}! I'll be conducting a comprehensive interview covering both technical and behavioral aspects for the {job} position. We'll discuss your technical expertise, past experiences, and how you approach various challenges. Ready to begin?",
+    "screening": "Hello {name}! This is a brief screening interview for {job}. I'll ask you a few questions to understand your background and basic qualifications. Let's get started!"
+})
+DEFAULT_WELCOME_TEMPLATE = "Welcome {name}! I'm your AI interviewer. Are you ready to begin?"
+
+
+@functools.lru_cache(maxsize=512)
+def _welcome_message(interview_type: str, name: str, job: str) -> str:
+    return WELCOME_TEMPLATES.get(interview_type, DEFAULT_WELCOME_TEMPLATE).format(name=name, job=job)
+
+
+# Completed chat responses kept in the exact-prompt cache
+LLM_CACHE_SIZE = 4096
+
+# Local (question, response) -> accuracy cross-encoder; scores this close to 50
+# are treated as uncertain and re-scored by the LLM
+ACCURACY_SCORER_MAX_LENGTH = 256
+ACCURACY_SCORER_UNCERTAIN_BAND = 15.0
+
+# Fixed-at-start session fields cached in memory so per-response reads can skip them
+SESSION_HEADER_FIELDS = ("questions", "metadata")
+SESSION_HEADER_CACHE_SIZE = 1024
+# Fields a processed response can change; written with $set next to the $push of the response
+SESSION_RESPONSE_FIELDS = (
+    "current_question_index", "follow_up_asked", "status", "completed_at", "completed_at_ts",
+    "evaluation", "responses_soa"
+)
+SESSION_UPDATE_FIELDS = SESSION_RESPONSE_FIELDS + ("end_reason",)
+# Buffered session writes go out as one bulk_write per interval, or sooner once this many are queued
+SESSION_FLUSH_INTERVAL = 0.1
+SESSION_FLUSH_MAX_OPS = 64
+# Status reads skip questions and responses; the question count is computed server-side
+SESSION_STATUS_PROJECTION = {
+    "status": 1,
+    "current_question_index": 1,
+    "question_count": {"$size": {"$ifNull": ["$questions", []]}},
+    "evaluation.scores": 1,
+    "evaluation.overall_score": 1
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+# Single-word keywords are matched against the response's token set
+TECHNICAL_KEYWORDS = frozenset({
+    "algorithm", "complexity", "optimization", "scalability", "performance",
+    "database", "api", "framework", "architecture", "testing", "debugging",
+    "deployment", "security", "authentication"
+})
+CODE_INDICATORS = frozenset({"function", "class", "method", "variable", "loop", "condition"})
+BEST_PRACTICE_KEYWORDS = frozenset({"documentation", "testing"})
+STAR_INDICATORS = {
+    "situation": frozenset({"situation", "when", "time", "project", "challenge"}),
+    "task": frozenset({"task", "responsibility", "goal", "objective", "needed"}),
+    "action": frozenset({"action", "did", "implemented", "decided", "approached"}),
+    "result": frozenset({"result", "outcome", "achieved", "improved", "success"})
+}
+LEADERSHIP_KEYWORDS = frozenset({"led", "managed", "coordinated", "mentored", "guided", "influenced"})
+COLLABORATION_KEYWORDS = frozenset({"team", "collaborated", "coordinated", "communicated"})
+PROBLEM_SOLVING_KEYWORDS = frozenset({"problem", "challenge", "solution", "resolved", "analyzed"})
+FILLER_WORDS = frozenset({"um", "uh", "like"})
+
+# Multi-word phrases are found in one Aho-Corasick pass over the lower-cased response;
+# group names match KEYWORD_GROUPS
+KEYWORD_PHRASES = {
+    "technical": ("design pattern",),
+    "best_practices": ("clean code", "version control", "code review"),
+    "collaboration": ("worked together",),
+    "filler": ("you know",)
+}
+_PHRASE_MATCHER = KeywordMatcher(KEYWORD_PHRASES)
+
+# Every keyword category, tagged so one pass over the response's tokens fills them all
+KEYWORD_GROUPS = {
+    "technical": TECHNICAL_KEYWORDS,
+    "code": CODE_INDICATORS,
+    "best_practices": BEST_PRACTICE_KEYWORDS,
+    **{f"star_{component}": indicators for component, indicators in STAR_INDICATORS.items()},
+    "leadership": LEADERSHIP_KEYWORDS,
+    "collaboration": COLLABORATION_KEYWORDS,
+    "problem_solving": PROBLEM_SOLVING_KEYWORDS,
+    "filler": FILLER_WORDS
+}
+_KEYWORD_INDEX: Dict[str, tuple] = {}
+for _group, _keywords in KEYWORD_GROUPS.items():
+    for _keyword in _keywords:
+        _KEYWORD_INDEX[_keyword] = _KEYWORD_INDEX.get(_keyword, ()) + (_group,)
+
+
+def _use_onnx_embedding(device) -> bool:
+    return settings.EMBEDDING_ONNX_INT8 and _onnx_available and device.type == "cpu"
+
+
+def _export_onnx_embedding(save_dir: str):
+    """Export MiniLM to ONNX and dynamically quantize it to int8 (VNNI), once per save_dir"""
+    if os.path.exists(os.path.join(save_dir, ONNX_EMBEDDING_FILE)):
+        return
+    model = ORTModelForFeatureExtraction.from_pretrained(EMBEDDING_MODEL, export=True)
+    model.save_pretrained(save_dir)
+    quantizer = ORTQuantizer.from_pretrained(model)
+    quantizer.quantize(
+        save_dir=save_dir,
+        quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    )
+
+
+def _load_embedding_model(device, dtype):
+    """int8 ONNX Runtime session on CPU when available, otherwise the PyTorch model"""
+    if _use_onnx_embedding(device):
+        try:
+            _export_onnx_embedding(settings.EMBEDDING_ONNX_DIR)
+            return ORTModelForFeatureExtraction.from_pretrained(
+                settings.EMBEDDING_ONNX_DIR, file_name=ONNX_EMBEDDING_FILE
+            )
+        except Exception as e:
+            logger.warning(f"ONNX embedding model unavailable, using PyTorch: {str(e)}")
+    return AutoModel.from_pretrained(EMBEDDING_MODEL).to(device=device, dtype=dtype).eval()
+
+
+def _load_pipeline(task: str, model_name: str, device, dtype):
+    """HF pipeline whose model uses fused SDPA attention via BetterTransformer when available"""
+    classifier = pipeline(task, model=model_name, device=device, torch_dtype=dtype)
+    if settings.PIPELINE_BETTERTRANSFORMER and _bettertransformer_available:
+        try:
+            classifier.model = BetterTransformer.transform(classifier.model, keep_original_model=False)
+        except Exception as e:
+            logger.warning(f"BetterTransformer not applied to {model_name}: {str(e)}")
+    return classifier
+
+
+def _load_inference_models(device, dtype) -> Dict[str, Any]:
+    """Load the sentiment/emotion pipelines and the embedding model"""
+    return {
+        "sentiment": _load_pipeline("sentiment-analysis", SENTIMENT_MODEL, device, dtype),
+        "emotion": _load_pipeline("text-classification", EMOTION_MODEL, device, dtype),
+        "tokenizer": AutoTokenizer.from_pretrained(EMBEDDING_MODEL),
+        "embedding": _load_embedding_model(device, dtype)
+    }
+
+
+def _embed_texts(tokenizer, model, texts: List[str]) -> np.ndarray:
+    """Mean-pooled, L2-normalized embeddings; one tokenizer call, one forward pass per length bucket"""
+    encoded = tokenizer(texts, truncation=True, max_length=EMBEDDING_MAX_LENGTH)
+    buckets = [
+        next(i for i, limit in enumerate(EMBEDDING_LENGTH_BUCKETS) if len(ids) <= limit)
+        for ids in encoded["input_ids"]
+    ]
+    
+    # Pool and normalize on the model's device; copy to host once at the end
+    with torch.inference_mode():
+        embeddings = torch.empty((len(texts), model.config.hidden_size), dtype=torch.float32, device=model.device)
+        for bucket in sorted(set(buckets)):
+            rows = [i for i, b in enumerate(buckets) if b == bucket]
+            inputs = tokenizer.pad(
+                {key: [values[i] for i in rows] for key, values in encoded.items()},
+                padding="longest",
+                return_tensors="pt"
+            ).to(model.device)
+            
+            outputs = model(**inputs)
+            # Mean-pool over real tokens only, in fp32
+            hidden = outputs.last_hidden_state.float()
+            mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+            embeddings[rows] = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+        
+        return torch.nn.functional.normalize(embeddings, dim=1, eps=1e-12).cpu().numpy()
+
+
+# Per-process model state for the CPU inference pool
+_worker_models: Dict[str, Any] = {}
+
+
+def _init_inference_worker(num_threads: int):
+    """Pin intra-op threads and load the models once in each pool process"""
+    os.environ["OMP_NUM_THREADS"] = str(num_threads)
+    torch.set_num_threads(num_threads)
+    _worker_models.update(_load_inference_models(*InterviewAgent._inference_device_and_dtype()))
+
+
+def _worker_sentiment(texts: List[str], batch_size: int) -> List[Dict[str, Any]]:
+    return _worker_models["sentiment"](texts, batch_size=batch_size, truncation=True)
+
+
+def _worker_emotion(texts: List[str], batch_size: int) -> List[Dict[str, Any]]:
+    return _worker_models["emotion"](texts, batch_size=batch_size, truncation=True)
+
+
+def _worker_embed(texts: List[str]) -> np.ndarray:
+    return _embed_texts(_worker_models["tokenizer"], _worker_models["embedding"], texts)
+
+
 class InterviewAgent(BaseAgent):
     def __init__(self):
         super().__init__()
         self.agent_name = "interview_agent"
         self.question_generator = QuestionGenerator()
-        self.evaluation_engine = EvaluationEngine()
+        self.evaluation_engine = EvaluationEngine(embed_texts=self._get_text_embeddings_batch)
         self.voice_processor = VoiceProcessor()
         self.video_analyzer = VideoAnalyzer()
         self.behavioral_analyzer = BehavioralAnalyzer()
         
         # AI Models
-        self.nlp = None
         self.sentiment_analyzer = None
         self.emotion_classifier = None
         self.embedding_model = None
         self.tokenizer = None
+        self._sentiment_batcher = None
+        self._emotion_batcher = None
+        self._inference_pool = None
+        self._accuracy_scorer = None
+        self._accuracy_batcher = None
+        self._question_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._accuracy_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._session_headers: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._openai_client = None
+        self._llm_cache = ResponseCache(LLM_CACHE_SIZE)
+        self._llm_semaphore = asyncio.Semaphore(settings.OPENAI_CONCURRENCY)
+        
+        # Async (Motor) MongoDB handles, resolved once per agent
+        self._mongo = get_async_mongo_client().hr_system
+        self._sessions_col = self._mongo.interview_sessions
+        
+        # Buffered MongoDB session updates, per session in write order
+        self._pending_session_ops: Dict[str, List[tuple]] = {}
+        self._pending_session_op_count = 0
+        self._session_flush_task: Optional[asyncio.Task] = None
+        # One bulk write in flight at a time; readers flushing a session wait for it
+        self._session_write_lock = asyncio.Lock()
+        # Bumped after every completed bulk write, so reads that raced one are not cached
+        self._session_write_epoch = 0
+        # Final evaluations running after end_interview_session returned
+        self._finalize_tasks: set = set()
+        
+        # Session read cache shared across workers; disabled unless REDIS_URL is set
+        self._redis = None
+        if _redis_available and settings.REDIS_URL:
+            self._redis = aioredis.from_url(settings.REDIS_URL, decode_responses=False)
         
         # Interview configurations
         self.interview_types = {
@@ -88,26 +492,67 @@ class InterviewAgent(BaseAgent):
             # Initialize base components
             await super().initialize()
             
-            # Load NLP models
-            self.nlp = spacy.load("en_core_web_sm")
+            # Inference-only models run in half precision where the hardware supports it
+            device, dtype = self._inference_device_and_dtype()
+            batch_size = PIPELINE_BATCH_SIZE_GPU if device.type == "cuda" else PIPELINE_BATCH_SIZE_CPU
+            
+            if settings.INFERENCE_PROCESS_POOL and device.type == "cpu":
+                # CPU deploys: several small-thread model processes instead of one
+                # process whose intra-op threads all sessions contend for
+                threads = settings.INFERENCE_THREADS_PER_PROCESS
+                if _use_onnx_embedding(device):
+                    # Export once here so pool workers don't race on the same directory
+                    try:
+                        await asyncio.to_thread(_export_onnx_embedding, settings.EMBEDDING_ONNX_DIR)
+                    except Exception as e:
+                        logger.warning(f"ONNX embedding export failed: {str(e)}")
+                self._inference_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max((os.cpu_count() or 1) // threads, 1),
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_inference_worker,
+                    initargs=(threads,)
+                )
+                sentiment_fn = functools.partial(_worker_sentiment, batch_size=batch_size)
+                emotion_fn = functools.partial(_worker_emotion, batch_size=batch_size)
+            else:
+                models = _load_inference_models(device, dtype)
+                self.sentiment_analyzer = models["sentiment"]
+                self.emotion_classifier = models["emotion"]
+                self.tokenizer = models["tokenizer"]
+                self.embedding_model = models["embedding"]
+                sentiment_fn = functools.partial(self.sentiment_analyzer, batch_size=batch_size, truncation=True)
+                emotion_fn = functools.partial(self.emotion_classifier, batch_size=batch_size, truncation=True)
+                
+                # Compile and warm up models off the event loop
+                if settings.TORCH_COMPILE_MODELS:
+                    await asyncio.to_thread(self._compile_models)
+            
+            # Offline-trained local accuracy scorer, so most responses skip the LLM
+            if settings.TECH_ACCURACY_SCORER_PATH:
+                self._accuracy_scorer = await asyncio.to_thread(
+                    self._load_accuracy_scorer, settings.TECH_ACCURACY_SCORER_PATH
+                )
+            if self._accuracy_scorer is not None:
+                self._accuracy_batcher = AsyncBatcher(
+                    self._score_accuracy_batch,
+                    max_batch_size=batch_size,
+                    max_wait_ms=PIPELINE_BATCH_WAIT_MS
+                )
             
-            # Initialize sentiment analysis
-            self.sentiment_analyzer = pipeline(
-                "sentiment-analysis",
-                model="cardiffnlp/twitter-roberta-base-sentiment-latest"
+            # Coalesce concurrent single-response calls into padded batches
+            self._sentiment_batcher = AsyncBatcher(
+                sentiment_fn,
+                max_batch_size=batch_size,
+                max_wait_ms=PIPELINE_BATCH_WAIT_MS,
+                executor=self._inference_pool
             )
-            
-            # Initialize emotion classification
-            self.emotion_classifier = pipeline(
-                "text-classification",
-                model="j-hartmann/emotion-english-distilroberta-base"
+            self._emotion_batcher = AsyncBatcher(
+                emotion_fn,
+                max_batch_size=batch_size,
+                max_wait_ms=PIPELINE_BATCH_WAIT_MS,
+                executor=self._inference_pool
             )
             
-            # Load embedding model
-            model_name = "sentence-transformers/all-MiniLM-L6-v2"
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.embedding_model = AutoModel.from_pretrained(model_name)
-            
             # Initialize sub-components
             await self.question_generator.initialize()
             await self.evaluation_engine.initialize()
@@ -122,6 +567,154 @@ class InterviewAgent(BaseAgent):
             logger.error(f"Failed to initialize Interview Agent: {str(e)}")
             raise
 
+    async def close(self):
+        """Stop the pipeline batchers and the inference process pool, release OpenAI connections"""
+        for batcher in (self._sentiment_batcher, self._emotion_batcher, self._accuracy_batcher):
+            if batcher is not None:
+                await batcher.close()
+        await self.evaluation_engine.close()
+        if self._inference_pool is not None:
+            self._inference_pool.shutdown(wait=False, cancel_futures=True)
+            self._inference_pool = None
+        if self._openai_client is not None:
+            await self._openai_client.close()
+            self._openai_client = None
+        if self._finalize_tasks:
+            await asyncio.gather(*self._finalize_tasks, return_exceptions=True)
+        if self._session_flush_task is not None:
+            self._session_flush_task.cancel()
+            try:
+                await self._session_flush_task
+            except asyncio.CancelledError:
+                pass
+            self._session_flush_task = None
+        await self._flush_session_writes()
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    def _get_openai_client(self):
+        """Shared OpenAI client over one pooled connection pool"""
+        if self._openai_client is None:
+            self._openai_client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(max_connections=settings.OPENAI_CONCURRENCY),
+                    timeout=30
+                )
+            )
+        return self._openai_client
+
+    async def _chat_completion(self, **kwargs):
+        """Chat completion on the shared client, at most OPENAI_CONCURRENCY in flight"""
+        async with self._llm_semaphore:
+            return await self._get_openai_client().chat.completions.create(**kwargs)
+
+    async def _stream_chat_completion(self, on_token: Callable[[str], Awaitable[Any]], **kwargs) -> str:
+        """Streamed chat completion, passing each content delta to on_token as it arrives"""
+        parts = []
+        async with self._llm_semaphore:
+            stream = await self._get_openai_client().chat.completions.create(stream=True, **kwargs)
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    await on_token(delta)
+        return "".join(parts)
+
+    async def _cached_chat_completion(self, on_token: Optional[Callable[[str], Awaitable[Any]]] = None,
+                                      **kwargs) -> str:
+        """Chat completion text, served from the cache when the exact prompt was seen before.
+        
+        If on_token is given the completion is streamed through it; a cache hit
+        is passed through as a single chunk.
+        """
+        exact_key = ResponseCache.exact_key(kwargs["model"], _json_dumps(kwargs["messages"]))
+        cached = self._llm_cache.get_exact(exact_key)
+        if cached is not None:
+            if on_token is not None:
+                await on_token(cached)
+            return cached
+        
+        if on_token is not None:
+            content = (await self._stream_chat_completion(on_token, **kwargs)).strip()
+        else:
+            response = await self._chat_completion(**kwargs)
+            content = response.choices[0].message.content.strip()
+        self._llm_cache.put(exact_key, content)
+        return content
+
+    def _load_accuracy_scorer(self, path: str) -> Optional[tuple]:
+        """Load the fine-tuned single-output accuracy scorer, int8-quantized for CPU"""
+        try:
+            tokenizer = AutoTokenizer.from_pretrained(path)
+            model = AutoModelForSequenceClassification.from_pretrained(path, num_labels=1).eval()
+            model = torch.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+            logger.info(f"Loaded technical accuracy scorer from {path}")
+            return tokenizer, model
+        except Exception as e:
+            logger.error(f"Failed to load technical accuracy scorer: {str(e)}")
+            return None
+
+    def _score_accuracy_batch(self, pairs: List[tuple]) -> List[float]:
+        """Score (question, response) pairs 0-100 in one forward pass"""
+        tokenizer, model = self._accuracy_scorer
+        inputs = tokenizer(
+            [question for question, _ in pairs],
+            [response for _, response in pairs],
+            return_tensors="pt", truncation=True, padding=True, max_length=ACCURACY_SCORER_MAX_LENGTH
+        )
+        with torch.inference_mode():
+            logits = model(**inputs).logits.squeeze(-1)
+        return (torch.sigmoid(logits.float()) * 100).tolist()
+
+    @staticmethod
+    def _inference_device_and_dtype():
+        """fp16 on CUDA, bf16 on CPUs with native support, fp32 otherwise"""
+        if torch.cuda.is_available():
+            return torch.device("cuda", 0), torch.float16
+        try:
+            if torch.ops.mkldnn._is_mkldnn_bf16_supported():
+                return torch.device("cpu"), torch.bfloat16
+        except Exception:
+            pass
+        return torch.device("cpu"), torch.float32
+
+    def _compile_models(self):
+        """torch.compile the embedding and classifier models and warm up common shapes"""
+        if not hasattr(torch, "compile"):
+            return
+        originals = (self.embedding_model, self.sentiment_analyzer.model, self.emotion_classifier.model)
+        # The ONNX Runtime embedding session is already optimized and isn't an nn.Module
+        compile_embedding = isinstance(self.embedding_model, nn.Module)
+        try:
+            if compile_embedding:
+                self.embedding_model = torch.compile(self.embedding_model, mode="reduce-overhead", fullgraph=False)
+            self.sentiment_analyzer.model = torch.compile(
+                self.sentiment_analyzer.model, mode="reduce-overhead", fullgraph=False
+            )
+            self.emotion_classifier.model = torch.compile(
+                self.emotion_classifier.model, mode="reduce-overhead", fullgraph=False
+            )
+            
+            compiled = [self.sentiment_analyzer.model, self.emotion_classifier.model]
+            if compile_embedding:
+                compiled.append(self.embedding_model)
+            
+            with torch.inference_mode():
+                for model in compiled:
+                    device = getattr(model, "device", "cpu")
+                    for batch_size, seq_len in COMPILE_WARMUP_SHAPES:
+                        input_ids = torch.ones((batch_size, seq_len), dtype=torch.long, device=device)
+                        model(input_ids=input_ids, attention_mask=torch.ones_like(input_ids))
+            
+            logger.info("Interview models compiled")
+            
+        except Exception as e:
+            # Fall back to eager models so requests don't hit the same failure
+            self.embedding_model, self.sentiment_analyzer.model, self.emotion_classifier.model = originals
+            logger.warning(f"Model compilation skipped: {str(e)}")
+
     async def start_interview_session(self, candidate_id: str, job_id: str, interview_type: str, 
                                     mode: str = "chat", interviewer_id: str = None) -> Dict[str, Any]:
         """Start a new interview session"""
@@ -129,8 +722,7 @@ class InterviewAgent(BaseAgent):
             session_id = str(uuid.uuid4())
             
             # Get candidate and job information
-            candidate_info = await self._get_candidate_info(candidate_id)
-            job_info = await self._get_job_info(job_id)
+            candidate_info, job_info = await self._get_candidate_and_job_info(candidate_id, job_id)
             
             # Generate interview questions
             questions = await self.question_generator.generate_questions(
@@ -140,7 +732,15 @@ class InterviewAgent(BaseAgent):
                 difficulty_level=self._determine_difficulty_level(candidate_info)
             )
             
-            # Create session data
+            # Embed all questions once; relevance scoring then only embeds responses
+            if questions:
+                question_embeddings = await self._get_text_embeddings_batch([q.get("text", "") for q in questions])
+                for question, embedding in zip(questions, question_embeddings):
+                    if embedding.any():
+                        question["_embedding"] = embedding.tolist()
+            
+            # Create session data; *_ts fields are epoch seconds for duration math and range queries
+            started_at_ts = time.time()
             session_data = {
                 "id": session_id,
                 "candidate_id": candidate_id,
@@ -148,11 +748,14 @@ class InterviewAgent(BaseAgent):
                 "interview_type": interview_type,
                 "mode": mode,  # chat, voice, video
                 "status": "active",
-                "started_at": datetime.utcnow().isoformat(),
+                "started_at": datetime.utcfromtimestamp(started_at_ts).isoformat(),
+                "started_at_ts": started_at_ts,
                 "interviewer_id": interviewer_id or "ai_interviewer",
                 "questions": questions,
                 "current_question_index": 0,
                 "responses": [],
+                # Columnar per-response scores for session-wide aggregation (overall_score packed as uint8)
+                "responses_soa": {"overall_score": b"", "question_category": []},
                 "evaluation": {
                     "scores": {},
                     "detailed_feedback": [],
@@ -167,7 +770,7 @@ class InterviewAgent(BaseAgent):
             }
             
             # Generate welcome message
-            welcome_message = await self._generate_welcome_message(session_data)
+            welcome_message = self._generate_welcome_message(session_data)
             session_data["welcome_message"] = welcome_message
             
             # Store session
@@ -179,7 +782,7 @@ class InterviewAgent(BaseAgent):
             return {
                 "session_id": session_id,
                 "welcome_message": welcome_message,
-                "first_question": first_question,
+                "first_question": self._public_question(first_question),
                 "session_info": {
                     "type": interview_type,
                     "mode": mode,
@@ -193,11 +796,15 @@ class InterviewAgent(BaseAgent):
             raise
 
     async def process_response(self, session_id: str, response: str, 
-                             response_type: str = "text", metadata: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Process candidate response and generate next action"""
+                             response_type: str = "text", metadata: Dict[str, Any] = None,
+                             on_feedback_token: Optional[Callable[[str], Awaitable[Any]]] = None) -> Dict[str, Any]:
+        """Process candidate response and generate next action.
+        
+        on_feedback_token, if given, receives the AI feedback text as it streams in.
+        """
         try:
-            # Get session data
-            session_data = await self._get_session_data(session_id)
+            # Get session state (response history is not loaded)
+            session_data = await self._get_session_state(session_id)
             if not session_data:
                 raise ValueError("Session not found")
             
@@ -224,19 +831,34 @@ class InterviewAgent(BaseAgent):
                 "metadata": metadata or {}
             }
             
-            session_data["responses"].append(response_data)
+            columns = self._response_columns(session_data)
+            if "responses" in session_data:
+                session_data["responses"].append(response_data)
+            columns["overall_score"] = pack_scores(columns["overall_score"]) + pack_scores([analysis.get("overall_score", 0)])
+            columns["question_category"].append(analysis.get("question_category") or "general")
             
             # Update evaluation scores
             await self._update_evaluation_scores(session_data, analysis)
             
             # Generate AI feedback
-            ai_feedback = await self._generate_ai_feedback(response, current_question, analysis)
+            ai_feedback = await self._generate_ai_feedback(response, current_question, analysis, on_feedback_token)
+            
+            # The last question may end the interview, and the final report needs the full history
+            if "responses" not in session_data and session_data["current_question_index"] + 1 >= len(session_data["questions"]):
+                session_data["responses"] = await self._get_session_responses(session_id) + [response_data]
             
             # Determine next action
             next_action = await self._determine_next_action(session_data, analysis)
             
-            # Update session
-            await self._update_session(session_data)
+            # Persist the response and changed fields in one write
+            await self._persist_response(session_data, response_data)
+            
+            # The final report is generated in the background once the last response is stored
+            if next_action.get("action") == "end_interview":
+                self._schedule_final_evaluation(session_data)
+            
+            current_number = session_data["current_question_index"] + 1
+            total_questions = len(session_data["questions"])
             
             return {
                 "ai_feedback": ai_feedback,
@@ -247,9 +869,9 @@ class InterviewAgent(BaseAgent):
                 },
                 "next_action": next_action,
                 "session_progress": {
-                    "current_question": session_data["current_question_index"] + 1,
-                    "total_questions": len(session_data["questions"]),
-                    "completion_percentage": ((session_data["current_question_index"] + 1) / len(session_data["questions"])) * 100
+                    "current_question": current_number,
+                    "total_questions": total_questions,
+                    "completion_percentage": (current_number / total_questions) * 100
                 }
             }
             
@@ -276,28 +898,34 @@ class InterviewAgent(BaseAgent):
             
             # Text-based analysis
             if response_type in ["text", "voice"]:
-                # Basic metrics
-                analysis["detailed_analysis"]["text_metrics"] = await self._analyze_text_metrics(response)
+                # Tokenize once; every text helper below reads from this
+                pre = self._preprocess_response(response)
                 
-                # Sentiment analysis
-                analysis["detailed_analysis"]["sentiment"] = await self._analyze_sentiment(response)
+                # Model work runs concurrently so it can share batches with other sessions
+                sentiment, emotion, embeddings = await asyncio.gather(
+                    self._analyze_sentiment(response),
+                    self._analyze_emotion(response),
+                    self._embed_question_and_response(question, response)
+                )
+                analysis["detailed_analysis"]["sentiment"] = sentiment
+                analysis["detailed_analysis"]["emotion"] = emotion
                 
-                # Emotion analysis
-                analysis["detailed_analysis"]["emotion"] = await self._analyze_emotion(response)
+                # Basic metrics
+                analysis["detailed_analysis"]["text_metrics"] = await self._analyze_text_metrics(response, pre)
                 
                 # Technical content analysis
                 if question.get("category") in ["technical", "problem_solving"]:
-                    analysis["detailed_analysis"]["technical"] = await self._analyze_technical_content(response, question)
+                    analysis["detailed_analysis"]["technical"] = await self._analyze_technical_content(response, pre, question)
                 
                 # Behavioral analysis
                 if question.get("category") in ["behavioral", "cultural_fit"]:
-                    analysis["detailed_analysis"]["behavioral"] = await self._analyze_behavioral_content(response, question)
+                    analysis["detailed_analysis"]["behavioral"] = await self._analyze_behavioral_content(response, pre, question)
                 
                 # Communication quality
-                analysis["detailed_analysis"]["communication"] = await self._analyze_communication_quality(response)
+                analysis["detailed_analysis"]["communication"] = await self._analyze_communication_quality(response, pre)
                 
                 # Relevance to question
-                analysis["detailed_analysis"]["relevance"] = await self._analyze_relevance(response, question)
+                analysis["detailed_analysis"]["relevance"] = await self._analyze_relevance(response, pre, question, embeddings)
             
             # Voice-specific analysis
             if response_type == "voice" and metadata:
@@ -328,19 +956,47 @@ class InterviewAgent(BaseAgent):
             logger.error(f"Response analysis error: {str(e)}")
             return {"overall_score": 0.0, "error": str(e)}
 
-    async def _analyze_text_metrics(self, response: str) -> Dict[str, Any]:
+    @staticmethod
+    def _preprocess_response(response: str) -> Dict[str, Any]:
+        """Lower-case, tokenize and sentence-split a response once for all analyzers"""
+        words = response.split()
+        lower = response.lower()
+        tokens = frozenset(_WORD_RE.findall(lower))
+        
+        # One lookup per distinct token tags it with all of its keyword groups
+        keywords = {group: [] for group in KEYWORD_GROUPS}
+        for token in tokens:
+            for group in _KEYWORD_INDEX.get(token, ()):
+                keywords[group].append(token)
+        for group, found in keywords.items():
+            found.sort()
+        for group, found in _PHRASE_MATCHER.find(lower).items():
+            keywords[group].extend(found)
+        
+        return {
+            "lower": lower,
+            "words": words,
+            "word_counts": Counter(w.lower() for w in words),
+            "tokens": tokens,
+            "keywords": keywords,
+            "sentences": [s.strip() for s in response.split('.') if s.strip()],
+            "word_count": len(words)
+        }
+
+    async def _analyze_text_metrics(self, response: str, pre: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze basic text metrics"""
         try:
-            words = response.split()
-            sentences = response.split('.')
+            word_count = pre["word_count"]
+            sentence_count = len(pre["sentences"])
+            unique_words = len(pre["word_counts"])
             
             return {
-                "word_count": len(words),
-                "sentence_count": len([s for s in sentences if s.strip()]),
-                "avg_sentence_length": len(words) / max(len([s for s in sentences if s.strip()]), 1),
+                "word_count": word_count,
+                "sentence_count": sentence_count,
+                "avg_sentence_length": word_count / max(sentence_count, 1),
                 "character_count": len(response),
-                "unique_words": len(set(word.lower() for word in words)),
-                "vocabulary_richness": len(set(word.lower() for word in words)) / max(len(words), 1)
+                "unique_words": unique_words,
+                "vocabulary_richness": unique_words / max(word_count, 1)
             }
         except Exception as e:
             logger.error(f"Text metrics analysis error: {str(e)}")
@@ -349,11 +1005,11 @@ class InterviewAgent(BaseAgent):
     async def _analyze_sentiment(self, response: str) -> Dict[str, Any]:
         """Analyze sentiment of response"""
         try:
-            result = self.sentiment_analyzer(response)
+            result = await self._sentiment_batcher.submit(response)
             return {
-                "label": result[0]["label"],
-                "score": result[0]["score"],
-                "confidence": result[0]["score"]
+                "label": result["label"],
+                "score": result["score"],
+                "confidence": result["score"]
             }
         except Exception as e:
             logger.error(f"Sentiment analysis error: {str(e)}")
@@ -362,39 +1018,30 @@ class InterviewAgent(BaseAgent):
     async def _analyze_emotion(self, response: str) -> Dict[str, Any]:
         """Analyze emotional tone"""
         try:
-            result = self.emotion_classifier(response)
+            result = await self._emotion_batcher.submit(response)
             return {
-                "emotion": result[0]["label"],
-                "confidence": result[0]["score"],
-                "all_emotions": result
+                "emotion": result["label"],
+                "confidence": result["score"],
+                "all_emotions": [result]
             }
         except Exception as e:
             logger.error(f"Emotion analysis error: {str(e)}")
             return {"emotion": "neutral", "confidence": 0.5}
 
-    async def _analyze_technical_content(self, response: str, question: Dict[str, Any]) -> Dict[str, Any]:
+    async def _analyze_technical_content(self, response: str, pre: Dict[str, Any], question: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze technical content quality"""
         try:
             # Technical keywords detection
-            technical_keywords = [
-                "algorithm", "complexity", "optimization", "scalability", "performance",
-                "database", "api", "framework", "architecture", "design pattern",
-                "testing", "debugging", "deployment", "security", "authentication"
-            ]
-            
-            response_lower = response.lower()
-            found_keywords = [kw for kw in technical_keywords if kw in response_lower]
+            found_keywords = pre["keywords"]["technical"]
             
             # Code quality indicators
-            code_indicators = ["function", "class", "method", "variable", "loop", "condition"]
-            code_mentions = [ind for ind in code_indicators if ind in response_lower]
+            code_mentions = pre["keywords"]["code"]
             
             # Best practices mentions
-            best_practices = ["clean code", "documentation", "version control", "code review", "testing"]
-            practices_mentioned = [bp for bp in best_practices if bp in response_lower]
+            practices_mentioned = pre["keywords"]["best_practices"]
             
             # Use AI to assess technical accuracy
-            accuracy_score = await self._assess_technical_accuracy_with_ai(response, question)
+            accuracy_score = await self._assess_technical_accuracy(response, question)
             
             return {
                 "technical_keywords": found_keywords,
@@ -410,71 +1057,78 @@ class InterviewAgent(BaseAgent):
             logger.error(f"Technical content analysis error: {str(e)}")
             return {"overall_technical_score": 50.0}
 
+    async def _assess_technical_accuracy(self, response: str, question: Dict[str, Any]) -> float:
+        """Score technical accuracy locally, deferring to the LLM when the scorer is unsure"""
+        if self._accuracy_batcher is not None:
+            try:
+                score = await self._accuracy_batcher.submit((question.get("text", ""), response))
+                if abs(score - 50.0) >= ACCURACY_SCORER_UNCERTAIN_BAND or not settings.TECH_ACCURACY_LLM_FALLBACK:
+                    return score
+            except Exception as e:
+                logger.error(f"Local technical accuracy scoring error: {str(e)}")
+        
+        return await self._assess_technical_accuracy_with_ai(response, question)
+
     async def _assess_technical_accuracy_with_ai(self, response: str, question: Dict[str, Any]) -> float:
-        """Use AI to assess technical accuracy"""
+        """Use AI to assess technical accuracy, cached per (question, response)"""
+        key = (
+            question.get("id") or question.get("text", ""),
+            hashlib.blake2b(response.encode(), digest_size=16).hexdigest()
+        )
+        cached = self._accuracy_cache.get(key)
+        if cached is not None:
+            score, expires_at = cached
+            if expires_at > time.monotonic():
+                self._accuracy_cache.move_to_end(key)
+                return score
+            del self._accuracy_cache[key]
+        
         try:
-            prompt = f"""
-            Assess the technical accuracy of this response on a scale of 0-100:
-            
-            Question: {question.get('text', '')}
-            Response: {response}
+            prompt = TECH_ACCURACY_PROMPT(question=question.get("text", ""), response=response)
             
-            Consider:
-            1. Factual correctness
-            2. Proper use of technical terminology
-            3. Logical reasoning and approach
-            4. Completeness of the answer
-            5. Best practices mentioned
-            
-            Return only a number between 0-100.
-            """
-            
-            response_obj = await openai.ChatCompletion.acreate(
-                model="gpt-4",
+            response_obj = await self._chat_completion(
+                model=TECH_ACCURACY_MODEL,
                 messages=[
                     {"role": "system", "content": "You are a technical expert evaluating interview responses."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=10,
+                max_tokens=TECH_ACCURACY_MAX_TOKENS,
                 temperature=0.1
             )
             
-            score_text = response_obj.choices[0].message.content.strip()
-            return float(score_text) if score_text.replace('.', '').isdigit() else 50.0
+            match = _SCORE_RE.search(response_obj.choices[0].message.content)
+            if match is None:
+                return 50.0
+            score = min(float(match.group()), 100.0)
+            
+            # Only real model scores are cached; failures fall through to 50.0 each time
+            self._accuracy_cache[key] = (score, time.monotonic() + TECH_ACCURACY_CACHE_TTL)
+            if len(self._accuracy_cache) > TECH_ACCURACY_CACHE_SIZE:
+                self._accuracy_cache.popitem(last=False)
+            return score
             
         except Exception as e:
             logger.error(f"AI technical accuracy assessment error: {str(e)}")
             return 50.0
 
-    async def _analyze_behavioral_content(self, response: str, question: Dict[str, Any]) -> Dict[str, Any]:
+    async def _analyze_behavioral_content(self, response: str, pre: Dict[str, Any], question: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze behavioral response quality"""
         try:
             # STAR method detection (Situation, Task, Action, Result)
-            star_indicators = {
-                "situation": ["situation", "when", "time", "project", "challenge"],
-                "task": ["task", "responsibility", "goal", "objective", "needed"],
-                "action": ["action", "did", "implemented", "decided", "approached"],
-                "result": ["result", "outcome", "achieved", "improved", "success"]
+            keywords = pre["keywords"]
+            star_scores = {
+                component: min(len(keywords[f"star_{component}"]) * 25, 100)
+                for component in STAR_INDICATORS
             }
             
-            response_lower = response.lower()
-            star_scores = {}
-            
-            for component, indicators in star_indicators.items():
-                score = sum(1 for indicator in indicators if indicator in response_lower)
-                star_scores[component] = min(score * 25, 100)
-            
             # Leadership indicators
-            leadership_keywords = ["led", "managed", "coordinated", "mentored", "guided", "influenced"]
-            leadership_score = sum(1 for kw in leadership_keywords if kw in response_lower) * 15
+            leadership_score = len(keywords["leadership"]) * 15
             
             # Collaboration indicators
-            collaboration_keywords = ["team", "collaborated", "worked together", "coordinated", "communicated"]
-            collaboration_score = sum(1 for kw in collaboration_keywords if kw in response_lower) * 15
+            collaboration_score = len(keywords["collaboration"]) * 15
             
             # Problem-solving indicators
-            problem_solving_keywords = ["problem", "challenge", "solution", "resolved", "analyzed"]
-            problem_solving_score = sum(1 for kw in problem_solving_keywords if kw in response_lower) * 15
+            problem_solving_score = len(keywords["problem_solving"]) * 15
             
             return {
                 "star_method_scores": star_scores,
@@ -494,18 +1148,18 @@ class InterviewAgent(BaseAgent):
             logger.error(f"Behavioral content analysis error: {str(e)}")
             return {"overall_behavioral_score": 50.0}
 
-    async def _analyze_communication_quality(self, response: str) -> Dict[str, Any]:
+    async def _analyze_communication_quality(self, response: str, pre: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze communication quality"""
         try:
             # Basic structure analysis
-            sentences = [s.strip() for s in response.split('.') if s.strip()]
-            words = response.split()
+            sentences = pre["sentences"]
+            words = pre["words"]
             
             # Clarity indicators
             clarity_indicators = {
                 "clear_structure": len(sentences) >= 2,
                 "appropriate_length": 50 <= len(words) <= 300,
-                "proper_grammar": not any(word in response.lower() for word in ["um", "uh", "like", "you know"]),
+                "proper_grammar": not pre["keywords"]["filler"],
                 "complete_thoughts": all(len(s.split()) >= 3 for s in sentences[:3])
             }
             
@@ -513,11 +1167,11 @@ class InterviewAgent(BaseAgent):
             articulation_score = sum(clarity_indicators.values()) * 25
             
             # Vocabulary assessment
-            unique_words = len(set(word.lower() for word in words))
+            unique_words = len(pre["word_counts"])
             vocabulary_score = min((unique_words / max(len(words), 1)) * 200, 100)
             
             # Coherence assessment
-            coherence_score = await self._assess_coherence(response)
+            coherence_score = await self._assess_coherence(sentences)
             
             return {
                 "clarity_indicators": clarity_indicators,
@@ -531,29 +1185,22 @@ class InterviewAgent(BaseAgent):
             logger.error(f"Communication quality analysis error: {str(e)}")
             return {"overall_communication_score": 50.0}
 
-    async def _assess_coherence(self, response: str) -> float:
+    async def _assess_coherence(self, sentences: List[str]) -> float:
         """Assess response coherence using AI"""
         try:
-            sentences = [s.strip() for s in response.split('.') if s.strip()]
             if len(sentences) < 2:
                 return 70.0  # Single sentence responses are considered moderately coherent
             
             # Calculate semantic similarity between consecutive sentences
-            embeddings = []
-            for sentence in sentences[:5]:  # Limit to first 5 sentences
-                embedding = await self._get_text_embedding(sentence)
-                embeddings.append(embedding)
+            embeddings = await self._get_text_embeddings_batch(sentences[:5])  # Limit to first 5 sentences
             
             if len(embeddings) < 2:
                 return 70.0
             
             # Calculate average similarity between consecutive sentences
-            similarities = []
-            for i in range(len(embeddings) - 1):
-                sim = cosine_similarity([embeddings[i]], [embeddings[i + 1]])[0][0]
-                similarities.append(sim)
+            similarities = np.einsum('ij,ij->i', embeddings[:-1], embeddings[1:])
             
-            avg_similarity = sum(similarities) / len(similarities)
+            avg_similarity = float(similarities.mean())
             coherence_score = min(avg_similarity * 150, 100)  # Scale to 0-100
             
             return max(coherence_score, 30.0)  # Minimum coherence score
@@ -562,36 +1209,66 @@ class InterviewAgent(BaseAgent):
             logger.error(f"Coherence assessment error: {str(e)}")
             return 50.0
 
-    async def _get_text_embedding(self, text: str) -> np.ndarray:
-        """Get text embedding using transformer model"""
+    async def _get_text_embeddings_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed several texts with one tokenizer call and one forward pass.
+        
+        Rows are L2-normalized, so cosine similarity is a plain dot product.
+        The forward pass runs in a worker thread (or the inference process pool)
+        so it overlaps the pipeline batches.
+        """
         try:
-            inputs = self.tokenizer(text, return_tensors="pt", truncation=True, padding=True, max_length=512)
-            
-            with torch.no_grad():
-                outputs = self.embedding_model(**inputs)
-                embeddings = outputs.last_hidden_state.mean(dim=1)
-            
-            return embeddings.numpy().flatten()
+            if self._inference_pool is not None:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._inference_pool, _worker_embed, texts)
+            return await asyncio.to_thread(_embed_texts, self.tokenizer, self.embedding_model, texts)
             
         except Exception as e:
-            logger.error(f"Embedding generation error: {str(e)}")
-            return np.zeros(384)  # Default embedding size
+            logger.error(f"Batch embedding generation error: {str(e)}")
+            return np.zeros((len(texts), 384))  # Default embedding size
+
+    async def _get_text_embedding(self, text: str) -> np.ndarray:
+        """Get L2-normalized text embedding using transformer model"""
+        return (await self._get_text_embeddings_batch([text]))[0]
+
+    async def _embed_question_and_response(self, question: Dict[str, Any], response: str) -> tuple:
+        """Question and response embeddings; the question side is precomputed or cached when possible"""
+        if question.get("_embedding"):
+            response_embedding = (await self._get_text_embeddings_batch([response]))[0]
+            return np.asarray(question["_embedding"], dtype=np.float32), response_embedding
+        
+        question_text = question.get("text", "")
+        question_embedding = self._question_embeddings.get(question_text)
+        if question_embedding is None:
+            question_embedding, response_embedding = await self._get_text_embeddings_batch(
+                [question_text, response]
+            )
+            if question_embedding.any():
+                self._question_embeddings[question_text] = question_embedding
+                if len(self._question_embeddings) > QUESTION_EMBEDDING_CACHE_SIZE:
+                    self._question_embeddings.popitem(last=False)
+        else:
+            self._question_embeddings.move_to_end(question_text)
+            response_embedding = (await self._get_text_embeddings_batch([response]))[0]
+        
+        return question_embedding, response_embedding
 
-    async def _analyze_relevance(self, response: str, question: Dict[str, Any]) -> Dict[str, Any]:
+    async def _analyze_relevance(self, response: str, pre: Dict[str, Any], question: Dict[str, Any],
+                                 embeddings: Optional[tuple] = None) -> Dict[str, Any]:
         """Analyze response relevance to question"""
         try:
             question_text = question.get("text", "")
             
             # Semantic similarity
-            question_embedding = await self._get_text_embedding(question_text)
-            response_embedding = await self._get_text_embedding(response)
+            if embeddings is None:
+                embeddings = await self._embed_question_and_response(question, response)
+            question_embedding, response_embedding = embeddings
             
-            similarity = cosine_similarity([question_embedding], [response_embedding])[0][0]
+            similarity = float(question_embedding @ response_embedding)
             relevance_score = similarity * 100
             
             # Keyword overlap
             question_words = set(question_text.lower().split())
-            response_words = set(response.lower().split())
+            response_words = set(pre["word_counts"])
             
             # Remove common stop words
             stop_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"}
@@ -680,23 +1357,19 @@ class InterviewAgent(BaseAgent):
             if not scores:
                 return 0.0
             
-            # Weight different aspects
-            weights = {
-                "technical_competency": 0.3,
-                "behavioral_competency": 0.3,
-                "communication": 0.25,
-                "relevance": 0.15,
-                "attitude": 0.05,
-                "confidence": 0.05
-            }
+            # Weighted mean over the aspects present in this response
+            score_vec = np.fromiter(
+                (scores.get(aspect, np.nan) for aspect in SCORE_WEIGHT_KEYS),
+                dtype=np.float32, count=len(SCORE_WEIGHT_KEYS)
+            )
+            present = ~np.isnan(score_vec)
+            weighted_score = float(score_vec[present] @ SCORE_WEIGHT_VEC[present])
+            total_weight = float(SCORE_WEIGHT_VEC[present].sum())
             
-            weighted_score = 0.0
-            total_weight = 0.0
-            
-            for aspect, score in scores.items():
-                weight = weights.get(aspect, 0.1)
-                weighted_score += score * weight
-                total_weight += weight
+            # Aspects outside the weight table count at the default weight
+            other_scores = [score for aspect, score in scores.items() if aspect not in SCORE_WEIGHT_KEYS]
+            weighted_score += sum(other_scores) * DEFAULT_SCORE_WEIGHT
+            total_weight += len(other_scores) * DEFAULT_SCORE_WEIGHT
             
             if total_weight > 0:
                 overall_score = weighted_score / total_weight
@@ -748,45 +1421,44 @@ class InterviewAgent(BaseAgent):
             logger.error(f"Feedback generation error: {str(e)}")
             return [], []
 
-    async def _generate_ai_feedback(self, response: str, question: Dict[str, Any], analysis: Dict[str, Any]) -> str:
+    async def _generate_ai_feedback(self, response: str, question: Dict[str, Any], analysis: Dict[str, Any],
+                                    on_token: Optional[Callable[[str], Awaitable[Any]]] = None) -> str:
         """Generate AI-powered feedback"""
         try:
             overall_score = analysis.get("overall_score", 0)
             strengths = analysis.get("strengths", [])
             improvements = analysis.get("improvements", [])
             
-            prompt = f"""
-            Generate encouraging and constructive feedback for this interview response:
-            
-            Question: {question.get('text', '')}
-            Response: {response[:500]}...
-            
-            Analysis Summary:
-            - Overall Score: {overall_score:.1f}/100
-            - Strengths: {', '.join(strengths)}
-            - Areas for Improvement: {', '.join(improvements)}
-            
-            Provide:
-            1. Positive acknowledgment of their response
-            2. Specific strengths highlighted
-            3. Constructive suggestions for improvement (if any)
-            4. Encouragement for the next question
-            
-            Keep it professional, encouraging, and under 150 words.
-            """
-            
-            response_obj = await openai.ChatCompletion.acreate(
+            # Clear-cut scores get a canned reply instead of an LLM call
+            if settings.ENABLE_STATIC_FEEDBACK and (
+                overall_score >= STATIC_FEEDBACK_STRONG_SCORE or overall_score < STATIC_FEEDBACK_WEAK_SCORE
+            ):
+                feedback = STATIC_FEEDBACK["strong" if overall_score >= STATIC_FEEDBACK_STRONG_SCORE else "weak"]
+                if on_token is not None:
+                    await on_token(feedback)
+                return feedback
+            
+            # Compact structured payload; the fixed instructions live in the system prompt
+            prompt = _json_dumps({
+                "q": question.get("text", "")[:FEEDBACK_QUESTION_CHARS],
+                "r": response[:FEEDBACK_RESPONSE_CHARS],
+                "s": round(overall_score, 1),
+                "pos": strengths[:FEEDBACK_MAX_POINTS],
+                "neg": improvements[:FEEDBACK_MAX_POINTS]
+            })
+            
+            # Feedback is per candidate, so only an identical prompt may be served from cache
+            return await self._cached_chat_completion(
+                on_token=on_token,
                 model="gpt-3.5-turbo",
                 messages=[
-                    {"role": "system", "content": "You are a professional, encouraging AI interviewer providing constructive feedback."},
+                    {"role": "system", "content": FEEDBACK_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=200,
                 temperature=0.7
             )
             
-            return response_obj.choices[0].message.content.strip()
-            
         except Exception as e:
             logger.error(f"AI feedback generation error: {str(e)}")
             return "Thank you for your response. Let's continue with the next question."
@@ -794,8 +1466,9 @@ class InterviewAgent(BaseAgent):
     async def _determine_next_action(self, session_data: Dict[str, Any], analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Determine what to do next in the interview"""
         try:
+            questions = session_data.get("questions", [])
             current_index = session_data.get("current_question_index", 0)
-            total_questions = len(session_data.get("questions", []))
+            total_questions = len(questions)
             
             # Check if we need a follow-up question
             overall_score = analysis.get("overall_score", 0)
@@ -803,7 +1476,7 @@ class InterviewAgent(BaseAgent):
             
             # If response quality is low, ask follow-up
             if overall_score < 60 or relevance_score < 50:
-                current_question = session_data["questions"][current_index]
+                current_question = questions[current_index]
                 follow_ups = current_question.get("follow_up_questions", [])
                 
                 if follow_ups and not session_data.get("follow_up_asked", False):
@@ -822,11 +1495,11 @@ class InterviewAgent(BaseAgent):
             if current_index + 1 < total_questions:
                 session_data["current_question_index"] = current_index + 1
                 session_data["follow_up_asked"] = False
-                next_question = session_data["questions"][current_index + 1]
+                next_question = questions[current_index + 1]
                 
                 return {
                     "action": "next_question",
-                    "question": next_question,
+                    "question": self._public_question(next_question),
                     "progress": {
                         "current": current_index + 2,
                         "total": total_questions,
@@ -834,18 +1507,15 @@ class InterviewAgent(BaseAgent):
                     }
                 }
             else:
-                # End interview
-                session_data["status"] = "completed"
-                session_data["completed_at"] = datetime.utcnow().isoformat()
-                
-                # Generate final evaluation
-                final_evaluation = await self._generate_final_evaluation(session_data)
-                session_data["evaluation"]["final_report"] = final_evaluation
+                # End interview; the caller schedules the final evaluation after persisting this turn
+                session_data["status"] = "evaluating"
+                session_data["completed_at_ts"] = time.time()
+                session_data["completed_at"] = datetime.utcfromtimestamp(session_data["completed_at_ts"]).isoformat()
                 
                 return {
                     "action": "end_interview",
                     "message": "Thank you for completing the interview. I'll now prepare your evaluation report.",
-                    "final_evaluation": final_evaluation
+                    "status": "evaluating"
                 }
             
         except Exception as e:
@@ -858,46 +1528,42 @@ class InterviewAgent(BaseAgent):
             responses = session_data.get("responses", [])
             interview_type = session_data.get("interview_type", "")
             
-            # Calculate overall scores
-            all_scores = []
-            category_scores = {}
+            # Calculate overall and category-wise averages from the score columns
+            columns = self._response_columns(session_data)
+            all_scores = unpack_scores(columns["overall_score"])
+            categories = np.asarray(columns["question_category"], dtype=object)
             
-            for response in responses:
-                analysis = response.get("analysis", {})
-                overall_score = analysis.get("overall_score", 0)
-                all_scores.append(overall_score)
-                
-                # Category-wise scores
-                question_category = response.get("question_category", "general")
-                if question_category not in category_scores:
-                    category_scores[question_category] = []
-                category_scores[question_category].append(overall_score)
-            
-            # Calculate averages
-            overall_average = sum(all_scores) / len(all_scores) if all_scores else 0
+            overall_average = float(all_scores.mean()) if all_scores.size else 0
             category_averages = {
-                category: sum(scores) / len(scores)
-                for category, scores in category_scores.items()
+                category: float(all_scores[categories == category].mean())
+                for category in dict.fromkeys(columns["question_category"])
             }
             
-            # Generate recommendation
-            recommendation = await self._generate_hiring_recommendation(overall_average, category_averages, session_data)
+            # Recommendation and AI summary are independent; run them concurrently
+            recommendation, ai_summary = await asyncio.gather(
+                self._generate_hiring_recommendation(overall_average, category_averages, session_data),
+                self._generate_ai_evaluation_summary(session_data, overall_average, category_averages),
+                return_exceptions=True
+            )
+            if isinstance(recommendation, Exception):
+                logger.error(f"Hiring recommendation error: {str(recommendation)}")
+                recommendation = {"recommendation": "Review Required", "confidence": "Low"}
+            if isinstance(ai_summary, Exception):
+                logger.error(f"AI evaluation summary error: {str(ai_summary)}")
+                ai_summary = f"Interview completed with overall score of {overall_average:.1f}/100. Detailed analysis available in the evaluation report."
             
-            # Compile strengths and improvements
-            all_strengths = []
-            all_improvements = []
+            # Compile strengths and improvements in one pass, counting how often each recurs
+            strength_counter = Counter()
+            improvement_counter = Counter()
             
             for response in responses:
                 analysis = response.get("analysis", {})
-                all_strengths.extend(analysis.get("strengths", []))
-                all_improvements.extend(analysis.get("improvements", []))
+                strength_counter.update(analysis.get("strengths", ()))
+                improvement_counter.update(analysis.get("improvements", ()))
             
-            # Remove duplicates and get top items
-            unique_strengths = list(set(all_strengths))[:5]
-            unique_improvements = list(set(all_improvements))[:5]
-            
-            # Generate AI summary
-            ai_summary = await self._generate_ai_evaluation_summary(session_data, overall_average, category_averages)
+            # Get top items, most frequent first (ties keep first-seen order)
+            unique_strengths = [item for item, _ in strength_counter.most_common(5)]
+            unique_improvements = [item for item, _ in improvement_counter.most_common(5)]
             
             final_evaluation = {
                 "overall_score": overall_average,
@@ -907,7 +1573,7 @@ class InterviewAgent(BaseAgent):
                 "areas_for_improvement": unique_improvements,
                 "ai_summary": ai_summary,
                 "interview_duration": self._calculate_interview_duration(session_data),
-                "response_quality_trend": self._analyze_response_trend(responses),
+                "response_quality_trend": self._analyze_response_trend(columns["overall_score"]),
                 "generated_at": datetime.utcnow().isoformat()
             }
             
@@ -915,7 +1581,7 @@ class InterviewAgent(BaseAgent):
             
         except Exception as e:
             logger.error(f"Final evaluation generation error: {str(e)}")
-            return {"overall_score": 0, "recommendation": "Review Required"}
+            return {"overall_score": 0, "recommendation": "Review Required", "error": str(e)}
 
     async def _generate_hiring_recommendation(self, overall_score: float, category_scores: Dict[str, float], session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate hiring recommendation based on scores"""
@@ -923,40 +1589,22 @@ class InterviewAgent(BaseAgent):
             interview_type = session_data.get("interview_type", "")
             job_info = session_data.get("metadata", {}).get("job_info", {})
             
-            # Scoring thresholds
-            thresholds = {
-                "strong_hire": 85,
-                "hire": 75,
-                "maybe": 60,
-                "no_hire": 0
-            }
+            # Determine recommendation: first band whose threshold the score meets
+            recommendation, confidence = hire_band(overall_score)
             
-            # Determine recommendation
-            if overall_score >= thresholds["strong_hire"]:
-                recommendation = "Strong Hire"
-                confidence = "High"
-            elif overall_score >= thresholds["hire"]:
-                recommendation = "Hire"
-                confidence = "Medium-High"
-            elif overall_score >= thresholds["maybe"]:
-                recommendation = "Maybe"
-                confidence = "Medium"
-            else:
-                recommendation = "No Hire"
-                confidence = "High"
-            
-            # Additional considerations
+            # Additional considerations, from one sweep over the category scores
             considerations = []
+            category_array = np.fromiter(category_scores.values(), dtype=np.float32, count=len(category_scores))
             
             # Check for red flags
-            if any(score < 40 for score in category_scores.values()):
+            if bool((category_array < RED_FLAG_SCORE).any()):
                 considerations.append("Significant weakness in key areas")
                 if recommendation in ["Strong Hire", "Hire"]:
                     recommendation = "Maybe"
                     confidence = "Low"
             
             # Check for exceptional performance
-            if any(score >= 90 for score in category_scores.values()):
+            if bool((category_array >= EXCEPTIONAL_SCORE).any()):
                 considerations.append("Exceptional performance in key areas")
             
             return {
@@ -1009,28 +1657,16 @@ class InterviewAgent(BaseAgent):
             candidate_info = session_data.get("metadata", {}).get("candidate_info", {})
             job_info = session_data.get("metadata", {}).get("job_info", {})
             
-            prompt = f"""
-            Generate a comprehensive interview evaluation summary:
-            
-            Interview Details:
-            - Type: {interview_type}
-            - Overall Score: {overall_score:.1f}/100
-            - Category Scores: {json.dumps(category_scores, indent=2)}
-            
-            Candidate Background: {candidate_info.get('background', 'Not provided')}
-            Job Role: {job_info.get('title', 'Not specified')}
-            
-            Provide a professional evaluation summary including:
-            1. Overall performance assessment
-            2. Key strengths demonstrated
-            3. Areas needing development
-            4. Fit for the role
-            5. Specific recommendations
-            
-            Keep it professional and constructive, around 200-250 words.
-            """
+            prompt = EVALUATION_SUMMARY_PROMPT(
+                interview_type=interview_type,
+                overall_score=overall_score,
+                category_scores=_json_dumps(category_scores, indent=True),
+                background=candidate_info.get("background", "Not provided"),
+                job_title=job_info.get("title", "Not specified")
+            )
             
-            response = await openai.ChatCompletion.acreate(
+            # The summary goes into one candidate's report: exact prompt matches only
+            return await self._cached_chat_completion(
                 model="gpt-4",
                 messages=[
                     {"role": "system", "content": "You are an expert HR professional providing interview evaluations."},
@@ -1040,8 +1676,6 @@ class InterviewAgent(BaseAgent):
                 temperature=0.3
             )
             
-            return response.choices[0].message.content.strip()
-            
         except Exception as e:
             logger.error(f"AI evaluation summary error: {str(e)}")
             return f"Interview completed with overall score of {overall_score:.1f}/100. Detailed analysis available in the evaluation report."
@@ -1049,11 +1683,16 @@ class InterviewAgent(BaseAgent):
     def _calculate_interview_duration(self, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate interview duration"""
         try:
-            started_at = datetime.fromisoformat(session_data.get("started_at", ""))
-            completed_at = datetime.fromisoformat(session_data.get("completed_at", datetime.utcnow().isoformat()))
+            started_at_ts = session_data.get("started_at_ts")
+            if started_at_ts is not None:
+                duration_seconds = session_data.get("completed_at_ts", time.time()) - started_at_ts
+            else:
+                # Sessions stored before the epoch fields existed
+                started_at = datetime.fromisoformat(session_data.get("started_at", ""))
+                completed_at = datetime.fromisoformat(session_data.get("completed_at", datetime.utcnow().isoformat()))
+                duration_seconds = (completed_at - started_at).total_seconds()
             
-            duration = completed_at - started_at
-            duration_minutes = duration.total_seconds() / 60
+            duration_minutes = duration_seconds / 60
             
             return {
                 "total_minutes": duration_minutes,
@@ -1066,20 +1705,15 @@ class InterviewAgent(BaseAgent):
             logger.error(f"Duration calculation error: {str(e)}")
             return {"total_minutes": 0, "formatted_duration": "Unknown"}
 
-    def _analyze_response_trend(self, responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_response_trend(self, scores: Union[bytes, List[float]]) -> Dict[str, Any]:
         """Analyze trend in response quality"""
         try:
-            scores = [response.get("analysis", {}).get("overall_score", 0) for response in responses]
-            
             if len(scores) < 2:
                 return {"trend": "insufficient_data"}
             
             # Calculate trend
-            first_half = scores[:len(scores)//2]
-            second_half = scores[len(scores)//2:]
-            
-            first_avg = sum(first_half) / len(first_half)
-            second_avg = sum(second_half) / len(second_half)
+            values = unpack_scores(scores)
+            first_avg, second_avg = _trend_stats(values)
             
             improvement = second_avg - first_avg
             
@@ -1095,77 +1729,83 @@ class InterviewAgent(BaseAgent):
                 "improvement": improvement,
                 "first_half_average": first_avg,
                 "second_half_average": second_avg,
-                "score_progression": scores
+                "score_progression": list(scores)
             }
             
         except Exception as e:
             logger.error(f"Response trend analysis error: {str(e)}")
             return {"trend": "unknown"}
 
+    def _response_columns(self, session_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Per-response score columns (overall_score packed as uint8), rebuilt from the response list for older sessions"""
+        responses = session_data.get("responses", [])
+        columns = session_data.get("responses_soa")
+        if columns is None or ("responses" in session_data and len(columns.get("overall_score", [])) != len(responses)):
+            columns = {
+                "overall_score": pack_scores([r.get("analysis", {}).get("overall_score", 0) for r in responses]),
+                "question_category": [r.get("analysis", {}).get("question_category") or "general" for r in responses]
+            }
+            session_data["responses_soa"] = columns
+        elif not isinstance(columns["overall_score"], bytes):
+            # Stored before packing, or decoded from the JSON session cache
+            columns["overall_score"] = pack_scores(columns["overall_score"])
+        return columns
+
     # Helper methods for session management
-    async def _get_candidate_info(self, candidate_id: str) -> Dict[str, Any]:
-        """Get candidate information"""
+    async def _get_candidate_and_job_info(self, candidate_id: str, job_id: str) -> tuple:
+        """Get candidate and job information in one worker-thread round-trip"""
         try:
-            db = SessionLocal()
-            candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
-            db.close()
-            
-            if candidate:
-                return {
-                    "id": candidate.id,
-                    "name": candidate.name,
-                    "email": candidate.email,
-                    "background": f"Candidate applying for position, current status: {candidate.status}"
-                }
-            return {}
+            return await asyncio.to_thread(self._query_candidate_and_job, candidate_id, job_id)
         except Exception as e:
-            logger.error(f"Candidate info retrieval error: {str(e)}")
-            return {}
+            logger.error(f"Candidate/job info retrieval error: {str(e)}")
+            return {}, {}
 
-    async def _get_job_info(self, job_id: str) -> Dict[str, Any]:
-        """Get job information"""
+    def _query_candidate_and_job(self, candidate_id: str, job_id: str) -> tuple:
+        """Blocking lookups behind _get_candidate_and_job_info, sharing one session"""
+        db = SessionLocal()
         try:
-            db = SessionLocal()
+            candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
             job = db.query(Job).filter(Job.id == job_id).first()
+        finally:
             db.close()
-            
-            if job:
-                return {
-                    "id": job.id,
-                    "title": job.title,
-                    "description": job.description,
-                    "requirements": job.requirements
-                }
-            return {}
-        except Exception as e:
-            logger.error(f"Job info retrieval error: {str(e)}")
-            return {}
+        
+        candidate_info = {
+            "id": candidate.id,
+            "name": candidate.name,
+            "email": candidate.email,
+            "background": f"Candidate applying for position, current status: {candidate.status}"
+        } if candidate else {}
+        job_info = {
+            "id": job.id,
+            "title": job.title,
+            "description": job.description,
+            "requirements": job.requirements
+        } if job else {}
+        return candidate_info, job_info
 
     def _determine_difficulty_level(self, candidate_info: Dict[str, Any]) -> str:
         """Determine interview difficulty level based on candidate background"""
         # Simplified logic - would be more sophisticated in practice
         return "intermediate"
 
-    async def _generate_welcome_message(self, session_data: Dict[str, Any]) -> str:
+    def _generate_welcome_message(self, session_data: Dict[str, Any]) -> str:
         """Generate personalized welcome message"""
         try:
             candidate_name = session_data.get("metadata", {}).get("candidate_info", {}).get("name", "Candidate")
             interview_type = session_data.get("interview_type", "")
             job_title = session_data.get("metadata", {}).get("job_info", {}).get("title", "this position")
             
-            welcome_messages = {
-                "technical": f"Hello {candidate_name}! Welcome to your technical interview for {job_title}. I'm your AI interviewer, and I'll be assessing your technical skills, problem-solving abilities, and coding expertise. We'll cover various technical topics relevant to the role. Are you ready to begin?",
-                "behavioral": f"Hi {candidate_name}! I'm excited to learn more about your professional experiences and how you handle various workplace situations. This behavioral interview will help us understand your soft skills, leadership qualities, and cultural fit for {job_title}. Shall we get started?",
-                "comprehensive": f"Welcome {candidate_name}! I'll be conducting a comprehensive interview covering both technical and behavioral aspects for the {job_title} position. We'll discuss your technical expertise, past experiences, and how you approach various challenges. Ready to begin?",
-                "screening": f"Hello {candidate_name}! This is a brief screening interview for {job_title}. I'll ask you a few questions to understand your background and basic qualifications. Let's get started!"
-            }
-            
-            return welcome_messages.get(interview_type, f"Welcome {candidate_name}! I'm your AI interviewer. Are you ready to begin?")
+            return _welcome_message(interview_type, candidate_name, job_title)
             
         except Exception as e:
             logger.error(f"Welcome message generation error: {str(e)}")
             return "Welcome to your interview! I'm your AI interviewer. Are you ready to begin?"
 
+    @staticmethod
+    def _public_question(question: Dict[str, Any]) -> Dict[str, Any]:
+        """Question as returned to clients, without internal fields such as _embedding"""
+        return {key: value for key, value in question.items() if not key.startswith("_")}
+
     async def _get_current_question(self, session_data: Dict[str, Any]) -> Dict[str, Any]:
         """Get current question from session"""
         try:
@@ -1182,9 +1822,21 @@ class InterviewAgent(BaseAgent):
     async def _store_session(self, session_data: Dict[str, Any]):
         """Store session in databases"""
         try:
-            # Store in SQL
-            db = SessionLocal()
-            interview_session = InterviewSession(
+            # SQL row (in a worker thread) and MongoDB document are written concurrently
+            await asyncio.gather(
+                asyncio.to_thread(self._insert_session_row, session_data),
+                self._sessions_col.insert_one(session_data)
+            )
+            
+        except Exception as e:
+            logger.error(f"Session storage error: {str(e)}")
+            raise
+
+    def _insert_session_row(self, session_data: Dict[str, Any]):
+        """Blocking SQL insert behind _store_session"""
+        db = SessionLocal()
+        try:
+            db.add(InterviewSession(
                 id=session_data["id"],
                 candidate_id=session_data["candidate_id"],
                 job_id=session_data["job_id"],
@@ -1193,36 +1845,131 @@ class InterviewAgent(BaseAgent):
                 started_at=datetime.fromisoformat(session_data["started_at"]),
                 interviewer_id=session_data["interviewer_id"],
                 overall_score=session_data["evaluation"]["overall_score"]
-            )
-            db.add(interview_session)
+            ))
             db.commit()
+        finally:
             db.close()
-            
-            # Store detailed data in MongoDB
-            mongo_client = get_mongo_client()
-            mongo_db = mongo_client.hr_system
-            await mongo_db.interview_sessions.insert_one(session_data)
-            
-        except Exception as e:
-            logger.error(f"Session storage error: {str(e)}")
-            raise
 
-    async def _get_session_data(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get session data from MongoDB"""
+    async def _get_session_data(self, session_id: str, projection: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Get session data (or the projected fields), from the Redis cache or MongoDB"""
         try:
-            mongo_client = get_mongo_client()
-            mongo_db = mongo_client.hr_system
-            session_data = await mongo_db.interview_sessions.find_one({"id": session_id})
+            await self._flush_session_writes(session_id)
+            
+            # One Redis hash per session, one field per projection, so a write drops them all
+            cache_field = _json_dumps(projection) if projection else "*"
+            cached = await self._session_cache_get(session_id, cache_field)
+            if cached is not None:
+                return cached
+            
+            epoch = self._session_write_epoch
+            session_data = await self._sessions_col.find_one({"id": session_id}, projection)
+            if session_data:
+                session_data.pop("_id", None)
+                # A write that completed meanwhile may have made this read stale
+                if epoch == self._session_write_epoch:
+                    await self._session_cache_set(session_id, cache_field, session_data)
             return session_data
         except Exception as e:
             logger.error(f"Session retrieval error: {str(e)}")
             return None
 
-    async def _update_session(self, session_data: Dict[str, Any]):
-        """Update session in databases"""
+    async def _session_cache_get(self, session_id: str, field: str) -> Optional[Dict[str, Any]]:
+        """Cached session read, or None on a miss or when Redis is unavailable"""
+        if self._redis is None:
+            return None
+        try:
+            raw = await self._redis.hget(f"sess:{session_id}", field)
+            return _json_loads(raw) if raw is not None else None
+        except Exception as e:
+            logger.warning(f"Session cache read error: {str(e)}")
+            return None
+
+    async def _session_cache_set(self, session_id: str, field: str, session_data: Dict[str, Any]):
+        """Cache a session read for SESSION_CACHE_TTL_SECONDS"""
+        if self._redis is None:
+            return
+        try:
+            key = f"sess:{session_id}"
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, field, _json_dumps(session_data))
+                pipe.expire(key, settings.SESSION_CACHE_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Session cache write error: {str(e)}")
+
+    async def _invalidate_session_cache(self, session_id: str):
+        """Drop every cached read of a session after it is written"""
+        if self._redis is None:
+            return
+        try:
+            await self._redis.delete(f"sess:{session_id}")
+        except Exception as e:
+            logger.warning(f"Session cache invalidation error: {str(e)}")
+
+    async def _get_session_state(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get session data without the response history; questions/metadata come from cache"""
+        try:
+            await self._flush_session_writes(session_id)
+            
+            header = self._session_headers.get(session_id)
+            projection = {"responses": 0}
+            if header is not None:
+                self._session_headers.move_to_end(session_id)
+                projection.update({field: 0 for field in SESSION_HEADER_FIELDS})
+            
+            session_data = await self._sessions_col.find_one({"id": session_id}, projection)
+            if not session_data:
+                return None
+            
+            # Sessions stored before the score columns existed need their full history once
+            if "responses_soa" not in session_data:
+                return await self._get_session_data(session_id)
+            
+            if header is None:
+                header = {field: session_data.get(field) for field in SESSION_HEADER_FIELDS}
+                self._session_headers[session_id] = header
+                if len(self._session_headers) > SESSION_HEADER_CACHE_SIZE:
+                    self._session_headers.popitem(last=False)
+            session_data.update(header)
+            return session_data
+            
+        except Exception as e:
+            logger.error(f"Session state retrieval error: {str(e)}")
+            return None
+
+    async def _get_session_responses(self, session_id: str) -> List[Dict[str, Any]]:
+        """Get the stored response history of a session"""
+        try:
+            await self._flush_session_writes(session_id)
+            session_data = await self._sessions_col.find_one({"id": session_id}, {"responses": 1})
+            return (session_data or {}).get("responses", [])
+        except Exception as e:
+            logger.error(f"Session responses retrieval error: {str(e)}")
+            return []
+
+    async def _persist_response(self, session_data: Dict[str, Any], response_data: Dict[str, Any]):
+        """Append one response and set the fields it changed, instead of rewriting the session"""
+        try:
+            await asyncio.to_thread(self._update_session_sql, session_data)
+            
+            # Guarded by response id, so a retry after an ambiguous failure cannot push it twice
+            response_id = response_data.get("analysis", {}).get("response_id")
+            guard = {"responses.analysis.response_id": {"$ne": response_id}} if response_id else None
+            await self._queue_session_write(session_data["id"], {
+                "$push": {"responses": response_data},
+                "$set": {field: session_data[field] for field in SESSION_RESPONSE_FIELDS if field in session_data}
+            }, guard)
+            
+            if session_data.get("status") != "active":
+                self._session_headers.pop(session_data["id"], None)
+            
+        except Exception as e:
+            logger.error(f"Response persistence error: {str(e)}")
+
+    def _update_session_sql(self, session_data: Dict[str, Any]):
+        """Mirror status and overall score to the SQL session row"""
+        db = SessionLocal()
         try:
-            # Update SQL
-            db = SessionLocal()
             interview_session = db.query(InterviewSession).filter(InterviewSession.id == session_data["id"]).first()
             if interview_session:
                 interview_session.status = session_data["status"]
@@ -1230,35 +1977,115 @@ class InterviewAgent(BaseAgent):
                 if session_data.get("completed_at"):
                     interview_session.completed_at = datetime.fromisoformat(session_data["completed_at"])
                 db.commit()
+        finally:
             db.close()
+
+    async def _update_session(self, session_data: Dict[str, Any]):
+        """Update session in databases"""
+        try:
+            # Update SQL
+            await asyncio.to_thread(self._update_session_sql, session_data)
             
-            # Update MongoDB
-            mongo_client = get_mongo_client()
-            mongo_db = mongo_client.hr_system
-            await mongo_db.interview_sessions.replace_one(
-                {"id": session_data["id"]},
-                session_data
+            # Update MongoDB with only the mutable fields
+            await self._queue_session_write(
+                session_data["id"],
+                {"$set": {field: session_data[field] for field in SESSION_UPDATE_FIELDS if field in session_data}}
             )
             
         except Exception as e:
             logger.error(f"Session update error: {str(e)}")
 
+    async def _queue_session_write(self, session_id: str, update: Dict[str, Any],
+                                   guard: Optional[Dict[str, Any]] = None):
+        """Buffer a session update for the next bulk write.
+        
+        guard is added to the update filter; it makes a non-idempotent update a no-op once applied.
+        """
+        self._pending_session_ops.setdefault(session_id, []).append(({"id": session_id, **(guard or {})}, update))
+        self._pending_session_op_count += 1
+        
+        if self._pending_session_op_count >= SESSION_FLUSH_MAX_OPS:
+            await self._flush_session_writes()
+        elif self._session_flush_task is None or self._session_flush_task.done():
+            self._session_flush_task = asyncio.create_task(self._flush_session_writes_loop())
+
+    async def _flush_session_writes_loop(self):
+        """Periodically bulk-write buffered session updates until the buffer is empty"""
+        while self._pending_session_op_count:
+            await asyncio.sleep(SESSION_FLUSH_INTERVAL)
+            await self._flush_session_writes()
+
+    async def _flush_session_writes(self, session_id: Optional[str] = None):
+        """Write buffered updates for one session, or for all sessions, in one bulk operation.
+        
+        Returns only once no write of the session is buffered or in flight, so a
+        read that follows sees every update queued before the call.
+        """
+        async with self._session_write_lock:
+            await self._flush_session_writes_locked(session_id)
+
+    async def _flush_session_writes_locked(self, session_id: Optional[str]):
+        """Bulk-write the buffered updates; caller holds _session_write_lock"""
+        if session_id is None:
+            batch, self._pending_session_ops = self._pending_session_ops, {}
+        else:
+            ops = self._pending_session_ops.pop(session_id, None)
+            batch = {session_id: ops} if ops else {}
+        
+        if not batch:
+            return
+        self._pending_session_op_count -= sum(len(ops) for ops in batch.values())
+        
+        queued = [(sid, op) for sid, ops in batch.items() for op in ops]
+        landed, unwritten = queued, []
+        try:
+            # Ordered, so a session's $push/$set updates apply in the order they were made
+            await self._sessions_col.bulk_write([UpdateOne(*op) for _, op in queued], ordered=True)
+        except BulkWriteError as e:
+            # Updates before the failed one were applied. The server rejected the failed one
+            # itself, so a retry would fail the same way: dead-letter it and retry the rest
+            failed = e.details["writeErrors"][0]["index"]
+            sid, (op_filter, update) = queued[failed]
+            logger.error(
+                f"Session bulk write error on update {failed}, dropping it: {str(e)}; "
+                f"session={sid} filter={_json_dumps(op_filter)} update={_json_dumps(update)}"
+            )
+            landed, unwritten = queued[:failed], queued[failed + 1:]
+        except Exception as e:
+            # Any prefix may have landed; updates are idempotent on retry (pushes are guarded)
+            logger.error(f"Session bulk write error: {str(e)}")
+            landed, unwritten = [], queued
+        
+        # Requeue ahead of anything queued since
+        requeued: Dict[str, List[tuple]] = {}
+        for sid, op in unwritten:
+            requeued.setdefault(sid, []).append(op)
+        for sid, ops in requeued.items():
+            self._pending_session_ops[sid] = ops + self._pending_session_ops.get(sid, [])
+            self._pending_session_op_count += len(ops)
+        
+        # Only sessions whose updates landed may have their cached reads dropped
+        landed_sessions = {sid for sid, _ in landed}
+        if landed_sessions:
+            self._session_write_epoch += 1
+        for sid in landed_sessions:
+            await self._invalidate_session_cache(sid)
+
     async def _update_evaluation_scores(self, session_data: Dict[str, Any], analysis: Dict[str, Any]):
         """Update evaluation scores in session"""
         try:
             evaluation = session_data["evaluation"]
             scores = analysis.get("scores", {})
             
-            # Update individual scores
+            # Update individual score histories, packed one uint8 per score
+            aspect_scores = evaluation["scores"]
             for aspect, score in scores.items():
-                if aspect not in evaluation["scores"]:
-                    evaluation["scores"][aspect] = []
-                evaluation["scores"][aspect].append(score)
+                aspect_scores[aspect] = pack_scores(aspect_scores.get(aspect, b"")) + pack_scores([score])
             
             # Calculate running overall score
-            all_response_scores = [resp.get("analysis", {}).get("overall_score", 0) for resp in session_data.get("responses", [])]
-            if all_response_scores:
-                evaluation["overall_score"] = sum(all_response_scores) / len(all_response_scores)
+            all_response_scores = self._response_columns(session_data)["overall_score"]
+            if len(all_response_scores):
+                evaluation["overall_score"] = float(unpack_scores(all_response_scores).mean())
             
         except Exception as e:
             logger.error(f"Evaluation score update error: {str(e)}")
@@ -1267,7 +2094,7 @@ class InterviewAgent(BaseAgent):
     async def get_session_status(self, session_id: str) -> Dict[str, Any]:
         """Get current session status"""
         try:
-            session_data = await self._get_session_data(session_id)
+            session_data = await self._get_session_data(session_id, SESSION_STATUS_PROJECTION)
             if not session_data:
                 return {"error": "Session not found"}
             
@@ -1276,10 +2103,13 @@ class InterviewAgent(BaseAgent):
                 "status": session_data.get("status"),
                 "progress": {
                     "current_question": session_data.get("current_question_index", 0) + 1,
-                    "total_questions": len(session_data.get("questions", [])),
-                    "completion_percentage": ((session_data.get("current_question_index", 0) + 1) / len(session_data.get("questions", []))) * 100
+                    "total_questions": session_data.get("question_count", 0),
+                    "completion_percentage": ((session_data.get("current_question_index", 0) + 1) / session_data.get("question_count", 0)) * 100
+                },
+                "current_scores": {
+                    aspect: unpack_scores(history).tolist()
+                    for aspect, history in session_data.get("evaluation", {}).get("scores", {}).items()
                 },
-                "current_scores": session_data.get("evaluation", {}).get("scores", {}),
                 "overall_score": session_data.get("evaluation", {}).get("overall_score", 0)
             }
             
@@ -1290,10 +2120,14 @@ class InterviewAgent(BaseAgent):
     async def get_interview_report(self, session_id: str) -> Dict[str, Any]:
         """Get comprehensive interview report"""
         try:
-            session_data = await self._get_session_data(session_id)
+            session_data = await self._get_session_data(session_id, {"status": 1, "evaluation.final_report": 1})
             if not session_data:
                 return {"error": "Session not found"}
             
+            if session_data.get("status") == "evaluating":
+                return {"status": "evaluating", "message": "Final evaluation is still being generated"}
+            if session_data.get("status") == "failed":
+                return {"error": "Final evaluation failed"}
             if session_data.get("status") != "completed":
                 return {"error": "Interview not completed yet"}
             
@@ -1310,21 +2144,44 @@ class InterviewAgent(BaseAgent):
             if not session_data:
                 return {"error": "Session not found"}
             
-            session_data["status"] = "ended"
+            session_data["status"] = "evaluating"
             session_data["end_reason"] = reason
-            session_data["completed_at"] = datetime.utcnow().isoformat()
-            
-            # Generate final evaluation even if incomplete
-            final_evaluation = await self._generate_final_evaluation(session_data)
-            session_data["evaluation"]["final_report"] = final_evaluation
+            session_data["completed_at_ts"] = time.time()
+            session_data["completed_at"] = datetime.utcfromtimestamp(session_data["completed_at_ts"]).isoformat()
             
             await self._update_session(session_data)
+            await self._flush_session_writes(session_id)
+            self._session_headers.pop(session_id, None)
+            
+            # Generate final evaluation (even if incomplete) in the background; clients poll the status
+            self._schedule_final_evaluation(session_data)
             
             return {
                 "message": "Interview session ended successfully",
-                "final_evaluation": final_evaluation
+                "status": "evaluating"
             }
             
         except Exception as e:
             logger.error(f"Interview session end error: {str(e)}")
             return {"error": str(e)}
+
+    def _schedule_final_evaluation(self, session_data: Dict[str, Any]):
+        """Run _finalize_and_persist as a tracked background task"""
+        task = asyncio.create_task(self._finalize_and_persist(session_data))
+        self._finalize_tasks.add(task)
+        task.add_done_callback(self._finalize_tasks.discard)
+
+    async def _finalize_and_persist(self, session_data: Dict[str, Any]):
+        """Generate and store the final evaluation of an ended session"""
+        try:
+            final_evaluation = await self._generate_final_evaluation(session_data)
+            session_data["evaluation"]["final_report"] = final_evaluation
+            if "error" in final_evaluation:
+                raise RuntimeError(final_evaluation["error"])
+            session_data["status"] = "completed"
+        except Exception as e:
+            logger.error(f"Final evaluation error for session {session_data['id']}: {str(e)}")
+            session_data["status"] = "failed"
+        
+        await self._update_session(session_data)
+        await self._flush_session_writes(session_data["id"])
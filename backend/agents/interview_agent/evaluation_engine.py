@@ -4,22 +4,37 @@ Uses multiple AI models and scoring algorithms
 """
 
 import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from statistics import fmean, pstdev
+from typing import Dict, List, Optional, Any, Tuple, Callable, Awaitable
 from datetime import datetime
 import json
 
 try:
     import numpy as np
     from sklearn.metrics.pairwise import cosine_similarity
-    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.feature_extraction.text import HashingVectorizer
     import spacy
-    from transformers import pipeline
+    from spacy.symbols import VERB, AUX
+    from transformers import pipeline, AutoTokenizer
     import torch
     _ml_available = True
 except ImportError:
     _ml_available = False
 
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    _onnx_available = True
+except ImportError:
+    _onnx_available = False
+
 try:
     import openai
     _openai_available = True
@@ -27,18 +42,181 @@ except ImportError:
     _openai_available = False
 
 from backend.utils.config import settings
+from backend.utils.async_batcher import AsyncBatcher
+from backend.utils.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+SENTIMENT_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+EMOTION_MODEL = "j-hartmann/emotion-english-distilroberta-base"
+ONNX_QUANTIZED_FILE = "model_quantized.onnx"
+
+# Dynamic batching of sentiment/emotion pipeline calls across concurrent evaluations
+PIPELINE_MAX_BATCH_SIZE = 32
+PIPELINE_MAX_WAIT_MS = 10
+# Sentences scored individually for sentiment consistency
+SENTIMENT_MAX_SENTENCES = 5
+
+# Only POS tags, dependency labels, sentences and lexical flags are read
+# (attribute_ruler stays enabled: it maps fine-grained tags to POS in these pipelines)
+SPACY_DISABLED_PIPES = ["ner", "lemmatizer"]
+SPACY_PIPE_BATCH_SIZE = 32
+SPACY_CPU_MODEL = "en_core_web_sm"
+SPACY_GPU_MODEL = "en_core_web_trf"
+SPACY_WARMUP_TEXTS = ["Warm up the parser before the first interview response arrives."] * 4
+
+# Token attribute columns read through Doc.to_array, and their indices
+TOKEN_ARRAY_ATTRS = ["POS", "DEP", "LENGTH", "IS_ALPHA", "IS_SPACE", "LOWER"]
+COL_POS, COL_DEP, COL_LENGTH, COL_IS_ALPHA, COL_IS_SPACE, COL_LOWER = range(len(TOKEN_ARRAY_ATTRS))
+
+
+def _onnx_classifier_dir(model_name: str) -> str:
+    """Directory of a classifier's int8 ONNX export under settings.PIPELINE_ONNX_DIR"""
+    return os.path.join(settings.PIPELINE_ONNX_DIR, model_name.replace("/", "--") + "-int8")
+
+
+def _export_onnx_classifier(model_name: str, save_dir: str):
+    """Export a sequence classifier to ONNX and dynamically quantize it to int8 (VNNI), once per save_dir"""
+    if os.path.exists(os.path.join(save_dir, ONNX_QUANTIZED_FILE)):
+        return
+    model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+    model.save_pretrained(save_dir)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(save_dir)
+    quantizer = ORTQuantizer.from_pretrained(model)
+    quantizer.quantize(
+        save_dir=save_dir,
+        quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    )
+
+
+def _load_classifier(task: str, model_name: str):
+    """int8 ONNX Runtime pipeline on CPU when available, otherwise the PyTorch pipeline"""
+    if settings.PIPELINE_ONNX_INT8 and _onnx_available and not torch.cuda.is_available():
+        try:
+            save_dir = _onnx_classifier_dir(model_name)
+            _export_onnx_classifier(model_name, save_dir)
+            model = ORTModelForSequenceClassification.from_pretrained(save_dir, file_name=ONNX_QUANTIZED_FILE)
+            return pipeline(task, model=model, tokenizer=AutoTokenizer.from_pretrained(save_dir))
+        except Exception as e:
+            logger.warning(f"ONNX classifier unavailable for {model_name}, using PyTorch: {str(e)}")
+    return pipeline(task, model=model_name)
+
+
+def _load_spacy_model():
+    """Transformer pipeline on GPU when one is available, else the small CPU pipeline; warmed up once.
+
+    Call from the thread that will run the model, since prefer_gpu applies to the calling thread.
+    """
+    nlp = None
+    if spacy.prefer_gpu():
+        try:
+            nlp = spacy.load(SPACY_GPU_MODEL, disable=SPACY_DISABLED_PIPES)
+        except OSError as e:
+            logger.warning(f"{SPACY_GPU_MODEL} unavailable, using {SPACY_CPU_MODEL}: {str(e)}")
+    if nlp is None:
+        nlp = spacy.load(SPACY_CPU_MODEL, disable=SPACY_DISABLED_PIPES)
+    list(nlp.pipe(SPACY_WARMUP_TEXTS, batch_size=len(SPACY_WARMUP_TEXTS)))
+    return nlp
+
+
+# Indicator phrases matched as substrings of the lowercased response, all in one scan
+INDICATOR_PHRASES = {
+    "positive": [
+        "excellent", "great", "successful", "achieved", "improved", "effective",
+        "confident", "passionate", "excited", "love", "enjoy", "proud"
+    ],
+    "negative": [
+        "difficult", "challenging", "failed", "problem", "issue", "struggle",
+        "worried", "concerned", "frustrated", "disappointed"
+    ],
+    "filler": ["um", "uh", "like", "you know", "sort of", "kind of"],
+    "example": ["for example", "such as", "like when", "instance"],
+    "transition": [
+        "first", "second", "then", "next", "finally", "however", "therefore",
+        "because", "since", "although", "moreover", "furthermore", "in addition"
+    ],
+    "introduction": ["let me start", "to begin", "first of all", "initially"],
+    "conclusion": ["in conclusion", "to summarize", "finally", "overall"],
+    "professional": [
+        "implement", "analyze", "optimize", "collaborate", "facilitate",
+        "coordinate", "strategic", "innovative", "efficient", "comprehensive"
+    ],
+    "connector": ["because", "therefore", "however", "moreover", "furthermore"]
+}
+_INDICATOR_MATCHER = KeywordMatcher(INDICATOR_PHRASES)
+
+
+@functools.lru_cache(maxsize=256)
+def _indicator_occurrences(response_lower: str) -> Dict[str, Dict[str, int]]:
+    """Per-group indicator occurrence counts; each assessment of a response reuses one scan"""
+    return _INDICATOR_MATCHER.occurrences(response_lower)
+
+
+# Each run of vowels counts as one syllable
+_VOWEL_GROUP = re.compile(r"[aeiouy]+")
+
+# Question/response term vectors for semantic relevance; question vectors are cached by text
+RELEVANCE_HASH_FEATURES = 2 ** 18
+QUESTION_VECTOR_CACHE_SIZE = 4096
+
+# Communication sub-scores in weighting order; coherence has no sub-criterion entry and gets 0.2
+COMMUNICATION_ASPECTS = ("clarity", "structure", "articulation", "vocabulary", "coherence")
+DEFAULT_COMMUNICATION_WEIGHT = 0.2
+
+# Question categories that get a technical or behavioral competency score
+TECHNICAL_CATEGORIES = ("technical", "problem_solving")
+BEHAVIORAL_CATEGORIES = ("behavioral", "cultural_fit")
+
+# Aspect weights for the overall score by question category; other categories use the criteria weights
+CATEGORY_SCORE_WEIGHTS = {
+    "technical": {"technical_competency": 0.5, "communication": 0.3, "relevance": 0.15, "cultural_fit": 0.05},
+    "problem_solving": {"technical_competency": 0.5, "communication": 0.3, "relevance": 0.15, "cultural_fit": 0.05},
+    "behavioral": {"behavioral_competency": 0.4, "communication": 0.3, "cultural_fit": 0.2, "relevance": 0.1},
+    "cultural_fit": {"behavioral_competency": 0.4, "communication": 0.3, "cultural_fit": 0.2, "relevance": 0.1}
+}
+DEFAULT_SCORE_WEIGHT = 0.1
+
+
+def _scored_aspects(category: Optional[str]) -> Tuple[str, ...]:
+    """Aspects _calculate_scores produces for a question category, in its order"""
+    aspects = ["communication", "relevance"]
+    if category in TECHNICAL_CATEGORIES:
+        aspects.append("technical_competency")
+    if category in BEHAVIORAL_CATEGORIES:
+        aspects.append("behavioral_competency")
+    aspects.append("cultural_fit")
+    return tuple(aspects)
+
+
+# Dependency labels counted as complex structures (subordinate clauses, passive voice)
+COMPLEX_DEP_LABELS = ("advcl", "acl", "relcl", "auxpass")
+
+
 class EvaluationEngine:
-    def __init__(self):
+    def __init__(self, embed_texts: Optional[Callable[[List[str]], Awaitable["np.ndarray"]]] = None):
+        """embed_texts: optional async callable returning one L2-normalized embedding row per text;
+        when given, coherence is scored from sentence embeddings instead of word overlap"""
         self.is_initialized = False
+        self._embed_texts = embed_texts
         self.nlp = None
         self.sentiment_analyzer = None
         self.emotion_classifier = None
         self.coherence_model = None
         self.technical_evaluator = None
         self.behavioral_evaluator = None
+        self._sentiment_batcher = None
+        self._emotion_batcher = None
+        self._nlp_batcher = None
+        self._model_executors: List[ThreadPoolExecutor] = []
+        self._emotion_labels: Tuple[str, ...] = ()
+        self._emotion_label_index: Dict[str, int] = {}
+        self._emotion_buf = None
+        self._complex_dep_ids = None
+        self._root_dep_id = None
+        self.relevance_vectorizer = None
+        self._question_vectors: "OrderedDict[str, Any]" = OrderedDict()
+        # Relevance is scored in worker threads, which share the question vector LRU
+        self._question_vectors_lock = threading.Lock()
         
         # Evaluation criteria and weights
         self.evaluation_criteria = {
@@ -85,25 +263,70 @@ class EvaluationEngine:
                 }
             }
         }
+        
+        # Weights frozen from the criteria, so scoring is a dot product
+        communication_weights = self.evaluation_criteria["communication"]["sub_criteria"]
+        self._communication_weights = np.array(
+            [communication_weights.get(aspect, DEFAULT_COMMUNICATION_WEIGHT) for aspect in COMMUNICATION_ASPECTS],
+            dtype=np.float32
+        )
+        self._default_score_weights = {k: v["weight"] for k, v in self.evaluation_criteria.items()}
+        self._category_scorers: Dict[str, Tuple[Tuple[str, ...], "np.ndarray"]] = {}
 
     async def initialize(self):
         """Initialize evaluation models and components"""
         try:
             logger.info("Initializing Evaluation Engine...")
             
-            # Load NLP models
-            self.nlp = spacy.load("en_core_web_sm")
-            
-            # Initialize sentiment analysis
-            self.sentiment_analyzer = pipeline(
-                "sentiment-analysis",
-                model="cardiffnlp/twitter-roberta-base-sentiment-latest"
+            # Load and warm up the spaCy pipeline on the thread that will serve it
+            spacy_executor = self._model_executor("spacy")
+            self.nlp = await asyncio.get_running_loop().run_in_executor(spacy_executor, _load_spacy_model)
+            
+            # Dependency label IDs as they appear in Doc.to_array output
+            strings = self.nlp.vocab.strings
+            self._complex_dep_ids = np.array([strings.add(label) for label in COMPLEX_DEP_LABELS], dtype=np.uint64)
+            self._root_dep_id = strings.add("ROOT")
+            
+            # Stateless term vectorizer, so no corpus fit is needed at startup
+            self.relevance_vectorizer = HashingVectorizer(
+                lowercase=True,
+                stop_words="english",
+                ngram_range=(1, 2),
+                n_features=RELEVANCE_HASH_FEATURES,
+                alternate_sign=False,
+                norm="l2",
+                dtype=np.float32
             )
             
-            # Initialize emotion classification
-            self.emotion_classifier = pipeline(
-                "text-classification",
-                model="j-hartmann/emotion-english-distilroberta-base"
+            # Initialize sentiment analysis and emotion classification (export/quantize off the event loop)
+            self.sentiment_analyzer = await asyncio.to_thread(_load_classifier, "sentiment-analysis", SENTIMENT_MODEL)
+            self.emotion_classifier = await asyncio.to_thread(_load_classifier, "text-classification", EMOTION_MODEL)
+            
+            # Queue texts from concurrent evaluations and run each model on whole batches,
+            # always from the same dedicated thread, so no model is ever called concurrently
+            self._nlp_batcher = AsyncBatcher(
+                self._analyze_batch,
+                max_batch_size=SPACY_PIPE_BATCH_SIZE,
+                max_wait_ms=PIPELINE_MAX_WAIT_MS,
+                executor=spacy_executor
+            )
+            self._sentiment_batcher = AsyncBatcher(
+                functools.partial(self.sentiment_analyzer, batch_size=PIPELINE_MAX_BATCH_SIZE, truncation=True),
+                max_batch_size=PIPELINE_MAX_BATCH_SIZE,
+                max_wait_ms=PIPELINE_MAX_WAIT_MS,
+                executor=self._model_executor("sentiment")
+            )
+            # Emotion scores for every label land in one reusable buffer, indexed by label id
+            id2label = self.emotion_classifier.model.config.id2label
+            self._emotion_labels = tuple(id2label[i] for i in sorted(id2label))
+            self._emotion_label_index = {label: i for i, label in enumerate(self._emotion_labels)}
+            self._emotion_buf = np.empty(len(self._emotion_labels), dtype=np.float32)
+            self._emotion_batcher = AsyncBatcher(
+                functools.partial(self.emotion_classifier, batch_size=PIPELINE_MAX_BATCH_SIZE, truncation=True,
+                                  top_k=None),
+                max_batch_size=PIPELINE_MAX_BATCH_SIZE,
+                max_wait_ms=PIPELINE_MAX_WAIT_MS,
+                executor=self._model_executor("emotion")
             )
             
             # Initialize specialized evaluators
@@ -120,10 +343,29 @@ class EvaluationEngine:
             logger.error(f"Failed to initialize Evaluation Engine: {str(e)}")
             raise
 
+    def _model_executor(self, name: str) -> ThreadPoolExecutor:
+        """Single-thread executor that owns all calls into one model"""
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"eval-{name}")
+        self._model_executors.append(executor)
+        return executor
+
+    async def close(self):
+        """Stop the model batchers and their worker threads"""
+        for batcher in (self._nlp_batcher, self._sentiment_batcher, self._emotion_batcher):
+            if batcher is not None:
+                await batcher.close()
+        for executor in self._model_executors:
+            executor.shutdown(wait=False)
+        self._model_executors = []
+
     async def evaluate_response(self, response: str, question: Dict[str, Any], 
-                              context: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Comprehensive response evaluation"""
+                              context: Dict[str, Any] = None, doc=None) -> Dict[str, Any]:
+        """Comprehensive response evaluation; doc is an optional pre-parsed spaCy Doc of response"""
         try:
+            # Parse once, batched with concurrent evaluations; every spaCy-based metric reads the same Doc
+            if doc is None:
+                doc = await self._nlp_batcher.submit(response)
+            
             evaluation = {
                 "response_id": context.get("response_id", "unknown"),
                 "timestamp": datetime.utcnow().isoformat(),
@@ -136,37 +378,38 @@ class EvaluationEngine:
                 "confidence": 0.0
             }
             
-            # Basic text analysis
-            evaluation["detailed_analysis"]["text_metrics"] = await self._analyze_text_metrics(response)
-            
-            # Sentiment and emotion analysis
-            evaluation["detailed_analysis"]["sentiment"] = await self._analyze_sentiment(response)
-            evaluation["detailed_analysis"]["emotion"] = await self._analyze_emotion(response)
-            
-            # Communication quality analysis
-            evaluation["detailed_analysis"]["communication"] = await self._evaluate_communication_quality(response)
-            
-            # Relevance analysis
-            evaluation["detailed_analysis"]["relevance"] = await self._evaluate_relevance(response, question)
+            # Lowercased once; every indicator scan reads the same string
+            response_lower = response.lower()
             
-            # Category-specific evaluation
-            if question.get("category") in ["technical", "problem_solving"]:
-                evaluation["detailed_analysis"]["technical"] = await self.technical_evaluator.evaluate(response, question)
+            # Independent analyses run concurrently: spaCy-based metrics in worker threads
+            # overlap the batched transformer pipelines and the category evaluator's LLM call
+            text_metrics, sentiment, emotion, communication, relevance, category = await asyncio.gather(
+                asyncio.to_thread(self._analyze_text_metrics, response, doc),
+                self._analyze_sentiment(response, response_lower),
+                self._analyze_emotion(response),
+                self._analyze_communication(response_lower, doc),
+                asyncio.to_thread(self._evaluate_relevance, response, question, response_lower),
+                self._evaluate_category(response, question)
+            )
             
-            if question.get("category") in ["behavioral", "cultural_fit"]:
-                evaluation["detailed_analysis"]["behavioral"] = await self.behavioral_evaluator.evaluate(response, question)
+            evaluation["detailed_analysis"]["text_metrics"] = text_metrics
+            evaluation["detailed_analysis"]["sentiment"] = sentiment
+            evaluation["detailed_analysis"]["emotion"] = emotion
+            evaluation["detailed_analysis"]["communication"] = communication
+            evaluation["detailed_analysis"]["relevance"] = relevance
+            evaluation["detailed_analysis"].update(category)
             
             # Calculate individual scores
-            evaluation["scores"] = await self._calculate_scores(evaluation["detailed_analysis"], question)
+            evaluation["scores"] = self._calculate_scores(evaluation["detailed_analysis"], question)
             
             # Calculate overall score
-            evaluation["overall_score"] = await self._calculate_overall_score(evaluation["scores"], question)
+            evaluation["overall_score"] = self._calculate_overall_score(evaluation["scores"], question)
             
             # Generate strengths and improvements
-            evaluation["strengths"], evaluation["improvements"] = await self._generate_feedback(evaluation)
+            evaluation["strengths"], evaluation["improvements"] = self._generate_feedback(evaluation)
             
             # Calculate confidence in evaluation
-            evaluation["confidence"] = await self._calculate_evaluation_confidence(evaluation)
+            evaluation["confidence"] = self._calculate_evaluation_confidence(evaluation)
             
             return evaluation
             
@@ -174,33 +417,53 @@ class EvaluationEngine:
             logger.error(f"Response evaluation error: {str(e)}")
             return {"overall_score": 0.0, "error": str(e)}
 
-    async def _analyze_text_metrics(self, response: str) -> Dict[str, Any]:
+    async def _analyze_communication(self, response_lower: str, doc) -> Dict[str, Any]:
+        """Embed sentences, then score communication quality in a worker thread"""
+        await self._embed_sentence_similarities(doc)
+        return await asyncio.to_thread(self._evaluate_communication_quality, response_lower, doc)
+
+    async def _evaluate_category(self, response: str, question: Dict[str, Any]) -> Dict[str, Any]:
+        """Category-specific evaluation, keyed by evaluator"""
+        category_analysis = {}
+        
+        if question.get("category") in TECHNICAL_CATEGORIES:
+            category_analysis["technical"] = await self.technical_evaluator.evaluate(response, question)
+        
+        if question.get("category") in BEHAVIORAL_CATEGORIES:
+            category_analysis["behavioral"] = await self.behavioral_evaluator.evaluate(response, question)
+        
+        return category_analysis
+
+    def _analyze_text_metrics(self, response: str, doc) -> Dict[str, Any]:
         """Analyze basic text metrics"""
         try:
-            doc = self.nlp(response)
+            tokens = self._token_array(doc)
+            alpha = tokens[:, COL_IS_ALPHA] == 1
             
             # Basic counts
-            words = [token.text for token in doc if not token.is_space]
-            sentences = list(doc.sents)
+            word_count = int((tokens[:, COL_IS_SPACE] == 0).sum())
+            sentence_count = len(self._sentence_lengths(doc))
             
             # Advanced metrics
-            unique_words = len(set(word.lower() for word in words if word.isalpha()))
-            avg_word_length = np.mean([len(word) for word in words if word.isalpha()])
-            avg_sentence_length = len(words) / max(len(sentences), 1)
+            first_tokens, word_freq, _ = self._word_frequencies(doc)
+            unique_words = int(word_freq.size)
+            avg_word_length = float(tokens[alpha, COL_LENGTH].mean()) if alpha.any() else 0.0
+            avg_sentence_length = word_count / max(sentence_count, 1)
             
             # Readability metrics
-            syllable_count = sum(self._count_syllables(word) for word in words if word.isalpha())
-            flesch_score = self._calculate_flesch_score(len(words), len(sentences), syllable_count)
+            syllable_count = sum(
+                self._count_syllables(doc[int(i)].lower_) * int(n) for i, n in zip(first_tokens, word_freq)
+            )
+            flesch_score = self._calculate_flesch_score(word_count, sentence_count, syllable_count)
             
             # Linguistic complexity
-            pos_tags = [token.pos_ for token in doc]
-            pos_diversity = len(set(pos_tags)) / max(len(pos_tags), 1)
+            pos_diversity = np.unique(tokens[:, COL_POS]).size / max(len(tokens), 1)
             
             return {
-                "word_count": len(words),
-                "sentence_count": len(sentences),
+                "word_count": word_count,
+                "sentence_count": sentence_count,
                 "unique_words": unique_words,
-                "vocabulary_richness": unique_words / max(len(words), 1),
+                "vocabulary_richness": unique_words / max(word_count, 1),
                 "avg_word_length": avg_word_length,
                 "avg_sentence_length": avg_sentence_length,
                 "flesch_readability": flesch_score,
@@ -213,24 +476,41 @@ class EvaluationEngine:
             logger.error(f"Text metrics analysis error: {str(e)}")
             return {}
 
+    def _token_array(self, doc) -> "np.ndarray":
+        """Token attribute matrix (TOKEN_ARRAY_ATTRS columns) for doc, built once per Doc"""
+        tokens = doc.user_data.get("token_array")
+        if tokens is None:
+            tokens = doc.to_array(TOKEN_ARRAY_ATTRS).reshape(len(doc), len(TOKEN_ARRAY_ATTRS))
+            doc.user_data["token_array"] = tokens
+        return tokens
+
+    def _word_frequencies(self, doc) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Frequency table of the lowercase alphabetic words in doc, built once per Doc.
+
+        Returns, per distinct word, the index of its first token, its count and its length.
+        """
+        table = doc.user_data.get("word_frequencies")
+        if table is None:
+            tokens = self._token_array(doc)
+            alpha_idx = np.flatnonzero(tokens[:, COL_IS_ALPHA] == 1)
+            _, first, counts = np.unique(tokens[alpha_idx, COL_LOWER], return_index=True, return_counts=True)
+            first_tokens = alpha_idx[first]
+            table = (first_tokens, counts, tokens[first_tokens, COL_LENGTH])
+            doc.user_data["word_frequencies"] = table
+        return table
+
+    def _sentence_lengths(self, doc) -> "np.ndarray":
+        """Token length of each sentence in doc, built once per Doc"""
+        lengths = doc.user_data.get("sentence_lengths")
+        if lengths is None:
+            lengths = np.fromiter((sent.end - sent.start for sent in doc.sents), dtype=np.int32)
+            doc.user_data["sentence_lengths"] = lengths
+        return lengths
+
     def _count_syllables(self, word: str) -> int:
-        """Count syllables in a word (simplified)"""
+        """Count syllables in a word (simplified): vowel groups, less a silent final e"""
         word = word.lower()
-        vowels = "aeiouy"
-        syllable_count = 0
-        prev_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not prev_was_vowel:
-                syllable_count += 1
-            prev_was_vowel = is_vowel
-        
-        # Handle silent e
-        if word.endswith('e') and syllable_count > 1:
-            syllable_count -= 1
-        
-        return max(syllable_count, 1)
+        return max(len(_VOWEL_GROUP.findall(word)) - word.endswith('e'), 1)
 
     def _calculate_flesch_score(self, words: int, sentences: int, syllables: int) -> float:
         """Calculate Flesch readability score"""
@@ -246,24 +526,14 @@ class EvaluationEngine:
     def _calculate_complexity_score(self, doc) -> float:
         """Calculate linguistic complexity score"""
         try:
-            # Count complex structures
-            complex_structures = 0
-            
-            for token in doc:
-                # Subordinate clauses
-                if token.dep_ in ["advcl", "acl", "relcl"]:
-                    complex_structures += 1
-                
-                # Passive voice
-                if token.dep_ == "auxpass":
-                    complex_structures += 1
-                
-                # Complex verb forms
-                if token.pos_ == "VERB" and len(token.text) > 6:
-                    complex_structures += 1
+            tokens = self._token_array(doc)
+            
+            # Subordinate clauses and passive voice, plus complex verb forms
+            complex_structures = int(np.isin(tokens[:, COL_DEP], self._complex_dep_ids).sum())
+            complex_structures += int(((tokens[:, COL_POS] == VERB) & (tokens[:, COL_LENGTH] > 6)).sum())
             
             # Normalize by sentence count
-            sentence_count = len(list(doc.sents))
+            sentence_count = len(self._sentence_lengths(doc))
             complexity_score = (complex_structures / max(sentence_count, 1)) * 20
             
             return min(complexity_score, 100.0)
@@ -272,106 +542,91 @@ class EvaluationEngine:
             logger.error(f"Complexity calculation error: {str(e)}")
             return 50.0
 
-    async def _analyze_sentiment(self, response: str) -> Dict[str, Any]:
+    async def _analyze_sentiment(self, response: str, response_lower: str) -> Dict[str, Any]:
         """Analyze sentiment with detailed breakdown"""
         try:
-            # Overall sentiment
-            sentiment_result = self.sentiment_analyzer(response)
-            
-            # Sentence-level sentiment
-            sentences = response.split('.')
-            sentence_sentiments = []
-            
-            for sentence in sentences[:5]:  # Limit to first 5 sentences
-                if sentence.strip():
-                    sent_result = self.sentiment_analyzer(sentence.strip())
-                    sentence_sentiments.append({
-                        "text": sentence.strip()[:100],
-                        "sentiment": sent_result[0]["label"],
-                        "score": sent_result[0]["score"]
-                    })
+            # Overall and sentence-level sentiment, submitted together so they share a batch
+            sentences = [s.strip() for s in response.split('.')[:SENTIMENT_MAX_SENTENCES] if s.strip()]
+            sentiment_result, *sent_results = await asyncio.gather(
+                *(self._sentiment_batcher.submit(text) for text in [response] + sentences)
+            )
+            
+            sentence_sentiments = [
+                {
+                    "text": sentence[:100],
+                    "sentiment": sent_result["label"],
+                    "score": sent_result["score"]
+                }
+                for sentence, sent_result in zip(sentences, sent_results)
+            ]
             
             # Calculate sentiment consistency
             sentiment_scores = [s["score"] for s in sentence_sentiments]
-            sentiment_consistency = 1.0 - np.std(sentiment_scores) if sentiment_scores else 1.0
+            sentiment_consistency = 1.0 - pstdev(sentiment_scores) if sentiment_scores else 1.0
             
             return {
-                "overall_sentiment": sentiment_result[0]["label"],
-                "overall_score": sentiment_result[0]["score"],
+                "overall_sentiment": sentiment_result["label"],
+                "overall_score": sentiment_result["score"],
                 "sentence_sentiments": sentence_sentiments,
                 "sentiment_consistency": sentiment_consistency,
-                "positive_indicators": self._count_positive_indicators(response),
-                "negative_indicators": self._count_negative_indicators(response)
+                "positive_indicators": self._count_positive_indicators(response_lower),
+                "negative_indicators": self._count_negative_indicators(response_lower)
             }
             
         except Exception as e:
             logger.error(f"Sentiment analysis error: {str(e)}")
             return {"overall_sentiment": "NEUTRAL", "overall_score": 0.5}
 
-    def _count_positive_indicators(self, response: str) -> int:
+    def _count_positive_indicators(self, response_lower: str) -> int:
         """Count positive language indicators"""
-        positive_words = [
-            "excellent", "great", "successful", "achieved", "improved", "effective",
-            "confident", "passionate", "excited", "love", "enjoy", "proud"
-        ]
-        response_lower = response.lower()
-        return sum(1 for word in positive_words if word in response_lower)
-
-    def _count_negative_indicators(self, response: str) -> int:
+        return len(_indicator_occurrences(response_lower)["positive"])
+
+    def _count_negative_indicators(self, response_lower: str) -> int:
         """Count negative language indicators"""
-        negative_words = [
-            "difficult", "challenging", "failed", "problem", "issue", "struggle",
-            "worried", "concerned", "frustrated", "disappointed"
-        ]
-        response_lower = response.lower()
-        return sum(1 for word in negative_words if word in response_lower)
+        return len(_indicator_occurrences(response_lower)["negative"])
 
     async def _analyze_emotion(self, response: str) -> Dict[str, Any]:
         """Analyze emotional content"""
         try:
-            emotion_result = self.emotion_classifier(response)
+            emotion_result = await self._emotion_batcher.submit(response)
             
-            # Get all emotion scores
-            all_emotions = {result["label"]: result["score"] for result in emotion_result}
+            # Scatter the per-label scores into the shared buffer (no await until it is read)
+            scores = self._emotion_buf
+            for result in emotion_result:
+                scores[self._emotion_label_index[result["label"]]] = result["score"]
             
             # Determine dominant emotion
-            dominant_emotion = max(all_emotions.items(), key=lambda x: x[1])
-            
-            # Calculate emotional intensity
-            emotion_scores = list(all_emotions.values())
-            emotional_intensity = max(emotion_scores) - min(emotion_scores)
+            dominant = int(scores.argmax())
             
             return {
-                "dominant_emotion": dominant_emotion[0],
-                "emotion_confidence": dominant_emotion[1],
-                "all_emotions": all_emotions,
-                "emotional_intensity": emotional_intensity,
-                "emotional_stability": 1.0 - np.std(emotion_scores)
+                "dominant_emotion": self._emotion_labels[dominant],
+                "emotion_confidence": float(scores[dominant]),
+                "all_emotions": dict(zip(self._emotion_labels, scores.tolist())),
+                "emotional_intensity": float(scores.max() - scores.min()),
+                "emotional_stability": 1.0 - float(scores.std())
             }
             
         except Exception as e:
             logger.error(f"Emotion analysis error: {str(e)}")
             return {"dominant_emotion": "neutral", "emotion_confidence": 0.5}
 
-    async def _evaluate_communication_quality(self, response: str) -> Dict[str, Any]:
-        """Evaluate communication quality comprehensively"""
+    def _evaluate_communication_quality(self, response_lower: str, doc) -> Dict[str, Any]:
+        """Evaluate communication quality comprehensively (CPU only, no awaits)"""
         try:
-            doc = self.nlp(response)
-            
             # Clarity assessment
-            clarity_score = await self._assess_clarity(response, doc)
+            clarity_score = self._assess_clarity(response_lower, doc)
             
             # Structure assessment
-            structure_score = await self._assess_structure(response, doc)
+            structure_score = self._assess_structure(response_lower, doc)
             
             # Articulation assessment
-            articulation_score = await self._assess_articulation(response, doc)
+            articulation_score = self._assess_articulation(response_lower, doc)
             
             # Vocabulary assessment
-            vocabulary_score = await self._assess_vocabulary(response, doc)
+            vocabulary_score = self._assess_vocabulary(response_lower, doc)
             
             # Coherence assessment
-            coherence_score = await self._assess_coherence(response, doc)
+            coherence_score = self._assess_coherence(response_lower, doc)
             
             # Overall communication score
             communication_scores = {
@@ -382,10 +637,9 @@ class EvaluationEngine:
                 "coherence": coherence_score
             }
             
-            weights = self.evaluation_criteria["communication"]["sub_criteria"]
-            overall_communication = sum(
-                score * weights.get(aspect, 0.2) 
-                for aspect, score in communication_scores.items()
+            overall_communication = float(
+                np.array([clarity_score, structure_score, articulation_score, vocabulary_score, coherence_score],
+                         dtype=np.float32) @ self._communication_weights
             )
             
             return {
@@ -398,7 +652,7 @@ class EvaluationEngine:
             logger.error(f"Communication quality evaluation error: {str(e)}")
             return {"overall_communication_score": 50.0}
 
-    async def _assess_clarity(self, response: str, doc) -> float:
+    def _assess_clarity(self, response_lower: str, doc) -> float:
         """Assess clarity of communication"""
         try:
             clarity_indicators = {
@@ -408,30 +662,21 @@ class EvaluationEngine:
                 "concrete_examples": 0
             }
             
-            # Check for filler words
-            filler_words = ["um", "uh", "like", "you know", "sort of", "kind of"]
-            response_lower = response.lower()
-            clarity_indicators["filler_words"] = sum(
-                response_lower.count(filler) for filler in filler_words
-            )
+            indicators = _indicator_occurrences(response_lower)
+            
+            # Check for filler words (every occurrence counts)
+            clarity_indicators["filler_words"] = sum(indicators["filler"].values())
             
             # Check for concrete examples
-            example_indicators = ["for example", "such as", "like when", "instance"]
-            clarity_indicators["concrete_examples"] = sum(
-                1 for indicator in example_indicators if indicator in response_lower
-            )
+            clarity_indicators["concrete_examples"] = len(indicators["example"])
             
-            # Check sentence clarity
-            sentences = list(doc.sents)
-            for sent in sentences:
-                # Simple heuristic: shorter sentences with clear structure
-                if 5 <= len(sent) <= 25:  # Reasonable sentence length
-                    clarity_indicators["clear_sentences"] += 1
-                elif len(sent) > 30:
-                    clarity_indicators["ambiguous_phrases"] += 1
+            # Check sentence clarity: shorter sentences with clear structure
+            sentence_lengths = self._sentence_lengths(doc)
+            clarity_indicators["clear_sentences"] = int(((sentence_lengths >= 5) & (sentence_lengths <= 25)).sum())
+            clarity_indicators["ambiguous_phrases"] = int((sentence_lengths > 30).sum())
             
             # Calculate clarity score
-            total_sentences = len(sentences)
+            total_sentences = len(sentence_lengths)
             if total_sentences == 0:
                 return 50.0
             
@@ -446,7 +691,7 @@ class EvaluationEngine:
             logger.error(f"Clarity assessment error: {str(e)}")
             return 50.0
 
-    async def _assess_structure(self, response: str, doc) -> float:
+    def _assess_structure(self, response_lower: str, doc) -> float:
         """Assess structural organization of response"""
         try:
             structure_indicators = {
@@ -457,32 +702,19 @@ class EvaluationEngine:
                 "organization": 0
             }
             
-            # Check for transition words
-            transition_words = [
-                "first", "second", "then", "next", "finally", "however", "therefore",
-                "because", "since", "although", "moreover", "furthermore", "in addition"
-            ]
+            indicators = _indicator_occurrences(response_lower)
             
-            response_lower = response.lower()
-            structure_indicators["transitions"] = sum(
-                1 for word in transition_words if word in response_lower
-            )
+            # Check for transition words
+            structure_indicators["transitions"] = len(indicators["transition"])
             
             # Check for introduction patterns
-            intro_patterns = ["let me start", "to begin", "first of all", "initially"]
-            structure_indicators["introduction"] = sum(
-                1 for pattern in intro_patterns if pattern in response_lower
-            )
+            structure_indicators["introduction"] = len(indicators["introduction"])
             
             # Check for conclusion patterns
-            conclusion_patterns = ["in conclusion", "to summarize", "finally", "overall"]
-            structure_indicators["conclusion"] = sum(
-                1 for pattern in conclusion_patterns if pattern in response_lower
-            )
+            structure_indicators["conclusion"] = len(indicators["conclusion"])
             
             # Check logical flow (simplified)
-            sentences = list(doc.sents)
-            if len(sentences) >= 3:
+            if len(self._sentence_lengths(doc)) >= 3:
                 # Check if sentences build upon each other
                 structure_indicators["logical_flow"] = 1
                 structure_indicators["organization"] = 1
@@ -501,27 +733,22 @@ class EvaluationEngine:
             logger.error(f"Structure assessment error: {str(e)}")
             return 50.0
 
-    async def _assess_articulation(self, response: str, doc) -> float:
+    def _assess_articulation(self, response_lower: str, doc) -> float:
         """Assess articulation quality"""
         try:
-            # Check for proper grammar and syntax
-            grammar_errors = 0
-            for token in doc:
-                # Simple grammar checks
-                if token.dep_ == "ROOT" and token.pos_ not in ["VERB", "AUX"]:
-                    grammar_errors += 1
+            tokens = self._token_array(doc)
+            pos = tokens[:, COL_POS]
             
-            # Check for repetitive language
-            words = [token.text.lower() for token in doc if token.is_alpha]
-            word_freq = {}
-            for word in words:
-                word_freq[word] = word_freq.get(word, 0) + 1
+            # Check for proper grammar and syntax: sentence roots that are not verbs
+            grammar_errors = int(((tokens[:, COL_DEP] == self._root_dep_id) & (pos != VERB) & (pos != AUX)).sum())
             
-            repetition_score = sum(1 for freq in word_freq.values() if freq > 3)
+            # Check for repetitive language: lowercase words used more than 3 times
+            _, word_freq, _ = self._word_frequencies(doc)
+            repetition_score = int((word_freq > 3).sum())
             
             # Check for varied sentence structures
-            sentence_lengths = [len(sent) for sent in doc.sents]
-            length_variety = np.std(sentence_lengths) if sentence_lengths else 0
+            sentence_lengths = self._sentence_lengths(doc)
+            length_variety = float(sentence_lengths.std()) if sentence_lengths.size else 0
             
             # Calculate articulation score
             base_score = 80
@@ -536,34 +763,26 @@ class EvaluationEngine:
             logger.error(f"Articulation assessment error: {str(e)}")
             return 50.0
 
-    async def _assess_vocabulary(self, response: str, doc) -> float:
+    def _assess_vocabulary(self, response_lower: str, doc) -> float:
         """Assess vocabulary richness and appropriateness"""
         try:
-            words = [token.text.lower() for token in doc if token.is_alpha and len(token.text) > 2]
+            # Words longer than two letters, from the shared frequency table
+            _, word_freq, word_lengths = self._word_frequencies(doc)
+            counted = word_lengths > 2
+            total_words = int(word_freq[counted].sum())
             
-            if not words:
+            if not total_words:
                 return 0.0
             
             # Vocabulary richness (Type-Token Ratio)
-            unique_words = len(set(words))
-            total_words = len(words)
+            unique_words = int(counted.sum())
             ttr = unique_words / total_words
             
-            # Advanced vocabulary indicators
-            advanced_words = 0
-            for token in doc:
-                if len(token.text) > 7 and token.is_alpha:  # Longer words often more sophisticated
-                    advanced_words += 1
+            # Advanced vocabulary indicators: longer words are often more sophisticated
+            advanced_words = int(word_freq[word_lengths > 7].sum())
             
             # Professional vocabulary
-            professional_terms = [
-                "implement", "analyze", "optimize", "collaborate", "facilitate",
-                "coordinate", "strategic", "innovative", "efficient", "comprehensive"
-            ]
-            
-            professional_count = sum(
-                1 for term in professional_terms if term in response.lower()
-            )
+            professional_count = len(_indicator_occurrences(response_lower)["professional"])
             
             # Calculate vocabulary score
             ttr_score = min(ttr * 150, 70)  # TTR typically 0.4-0.6 for good vocabulary
@@ -577,39 +796,64 @@ class EvaluationEngine:
             logger.error(f"Vocabulary assessment error: {str(e)}")
             return 50.0
 
-    async def _assess_coherence(self, response: str, doc) -> float:
+    def _sentence_texts(self, doc) -> List[str]:
+        """Stripped non-empty sentence texts of doc, built once per Doc"""
+        texts = doc.user_data.get("sentence_texts")
+        if texts is None:
+            texts = [text for text in (sent.text.strip() for sent in doc.sents) if text]
+            doc.user_data["sentence_texts"] = texts
+        return texts
+
+    async def _embed_sentence_similarities(self, doc):
+        """Cosine similarity of consecutive sentences from one batched embedding call, stored on doc"""
+        if self._embed_texts is None:
+            return
+        sentences = self._sentence_texts(doc)
+        if len(sentences) < 2:
+            return
+        try:
+            embeddings = np.asarray(await self._embed_texts(sentences), dtype=np.float32)
+            # A failed embedding call yields zero rows; keep the word-overlap fallback then
+            if embeddings.any(axis=1).all():
+                doc.user_data["sentence_similarities"] = (embeddings[:-1] * embeddings[1:]).sum(axis=1)
+        except Exception as e:
+            logger.error(f"Sentence embedding error: {str(e)}")
+
+    def _assess_coherence(self, response_lower: str, doc) -> float:
         """Assess coherence and logical flow"""
         try:
-            sentences = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+            sentences = self._sentence_texts(doc)
             
             if len(sentences) < 2:
                 return 70.0  # Single sentence responses are moderately coherent
             
-            # Calculate semantic similarity between consecutive sentences
-            similarities = []
-            
-            for i in range(len(sentences) - 1):
-                # Simple word overlap method (could be enhanced with embeddings)
-                words1 = set(sentences[i].lower().split())
-                words2 = set(sentences[i + 1].lower().split())
-                
-                overlap = len(words1 & words2)
-                union = len(words1 | words2)
-                
-                if union > 0:
-                    similarity = overlap / union
-                    similarities.append(similarity)
+            # Semantic similarity between consecutive sentences: embedding cosine when available
+            embedded = doc.user_data.get("sentence_similarities")
+            if embedded is not None:
+                similarities = embedded.tolist()
+            else:
+                # Word overlap fallback when no embedder is configured
+                similarities = []
+                for i in range(len(sentences) - 1):
+                    words1 = set(sentences[i].lower().split())
+                    words2 = set(sentences[i + 1].lower().split())
+                    
+                    overlap = len(words1 & words2)
+                    union = len(words1 | words2)
+                    
+                    if union > 0:
+                        similarity = overlap / union
+                        similarities.append(similarity)
             
             if not similarities:
                 return 50.0
             
             # Calculate coherence score
-            avg_similarity = np.mean(similarities)
+            avg_similarity = fmean(similarities)
             coherence_score = min(avg_similarity * 200, 100)  # Scale to 0-100
             
             # Bonus for logical connectors
-            connectors = ["because", "therefore", "however", "moreover", "furthermore"]
-            connector_count = sum(1 for conn in connectors if conn in response.lower())
+            connector_count = len(_indicator_occurrences(response_lower)["connector"])
             connector_bonus = min(connector_count * 5, 15)
             
             final_coherence = coherence_score + connector_bonus
@@ -632,28 +876,20 @@ class EvaluationEngine:
         else:
             return "poor"
 
-    async def _evaluate_relevance(self, response: str, question: Dict[str, Any]) -> Dict[str, Any]:
+    def _evaluate_relevance(self, response: str, question: Dict[str, Any], response_lower: str) -> Dict[str, Any]:
         """Evaluate response relevance to question"""
         try:
             question_text = question.get("text", "")
             question_keywords = question.get("keywords", [])
             
             # Keyword relevance
-            response_lower = response.lower()
             keyword_matches = sum(1 for keyword in question_keywords if keyword.lower() in response_lower)
             keyword_relevance = (keyword_matches / max(len(question_keywords), 1)) * 100
             
-            # Semantic relevance (simplified)
-            question_words = set(question_text.lower().split())
-            response_words = set(response.lower().split())
-            
-            # Remove stop words
-            stop_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"}
-            question_words -= stop_words
-            response_words -= stop_words
-            
-            word_overlap = len(question_words & response_words)
-            semantic_relevance = (word_overlap / max(len(question_words), 1)) * 100
+            # Semantic relevance: sparse cosine similarity of stop-word-filtered unigram/bigram vectors
+            question_vec = self._question_vector(question_text)
+            response_vec = self.relevance_vectorizer.transform([response])
+            semantic_relevance = float(cosine_similarity(question_vec, response_vec)[0, 0]) * 100
             
             # Completeness check
             expected_duration = question.get("expected_duration", 120)
@@ -682,6 +918,25 @@ class EvaluationEngine:
             logger.error(f"Relevance evaluation error: {str(e)}")
             return {"overall_relevance": 50.0, "relevance_category": "moderate"}
 
+    def _question_vector(self, question_text: str):
+        """Term vector of a question, cached since each question is asked of many candidates.
+        
+        Keyed by text: question ids are positional (q_1_technical) and repeat across sessions.
+        """
+        with self._question_vectors_lock:
+            vector = self._question_vectors.get(question_text)
+            if vector is not None:
+                self._question_vectors.move_to_end(question_text)
+                return vector
+        
+        # Transform outside the lock; a concurrent miss on the same key computes the same vector
+        vector = self.relevance_vectorizer.transform([question_text])
+        with self._question_vectors_lock:
+            self._question_vectors[question_text] = vector
+            if len(self._question_vectors) > QUESTION_VECTOR_CACHE_SIZE:
+                self._question_vectors.popitem(last=False)
+        return vector
+
     def _categorize_relevance(self, score: float) -> str:
         """Categorize relevance score"""
         if score >= 80:
@@ -693,7 +948,7 @@ class EvaluationEngine:
         else:
             return "low_relevance"
 
-    async def _calculate_scores(self, detailed_analysis: Dict[str, Any], question: Dict[str, Any]) -> Dict[str, float]:
+    def _calculate_scores(self, detailed_analysis: Dict[str, Any], question: Dict[str, Any]) -> Dict[str, float]:
         """Calculate individual aspect scores"""
         try:
             scores = {}
@@ -707,12 +962,12 @@ class EvaluationEngine:
             scores["relevance"] = relevance_data.get("overall_relevance", 50.0)
             
             # Technical competency (if applicable)
-            if question.get("category") in ["technical", "problem_solving"]:
+            if question.get("category") in TECHNICAL_CATEGORIES:
                 technical_data = detailed_analysis.get("technical", {})
                 scores["technical_competency"] = technical_data.get("overall_score", 50.0)
             
             # Behavioral competency (if applicable)
-            if question.get("category") in ["behavioral", "cultural_fit"]:
+            if question.get("category") in BEHAVIORAL_CATEGORIES:
                 behavioral_data = detailed_analysis.get("behavioral", {})
                 scores["behavioral_competency"] = behavioral_data.get("overall_score", 50.0)
             
@@ -741,7 +996,7 @@ class EvaluationEngine:
             logger.error(f"Score calculation error: {str(e)}")
             return {"overall": 50.0}
 
-    async def _calculate_overall_score(self, scores: Dict[str, float], question: Dict[str, Any]) -> float:
+    def _calculate_overall_score(self, scores: Dict[str, float], question: Dict[str, Any]) -> float:
         """Calculate weighted overall score"""
         try:
             if not scores:
@@ -749,40 +1004,26 @@ class EvaluationEngine:
             
             # Get weights based on question category
             question_category = question.get("category", "general")
+            aspects, normalized_weights = self._category_scorer(question_category)
             
-            # Adjust weights based on question type
-            if question_category in ["technical", "problem_solving"]:
-                weights = {
-                    "technical_competency": 0.5,
-                    "communication": 0.3,
-                    "relevance": 0.15,
-                    "cultural_fit": 0.05
-                }
-            elif question_category in ["behavioral", "cultural_fit"]:
-                weights = {
-                    "behavioral_competency": 0.4,
-                    "communication": 0.3,
-                    "cultural_fit": 0.2,
-                    "relevance": 0.1
-                }
-            else:
-                # Default weights
-                weights = self.evaluation_criteria
-                weights = {k: v["weight"] for k, v in weights.items()}
+            # Usual case: the category's aspects in order, against weights already normalized
+            if tuple(scores) == aspects:
+                score_vec = np.fromiter(scores.values(), dtype=np.float32, count=len(scores))
+                return max(0.0, min(100.0, float(score_vec @ normalized_weights)))
             
-            # Calculate weighted score
-            weighted_score = 0.0
-            total_weight = 0.0
+            weights = CATEGORY_SCORE_WEIGHTS.get(question_category, self._default_score_weights)
             
-            for aspect, score in scores.items():
-                weight = weights.get(aspect, 0.1)
-                weighted_score += score * weight
-                total_weight += weight
+            # Calculate weighted score
+            score_vec = np.fromiter(scores.values(), dtype=np.float32, count=len(scores))
+            weight_vec = np.fromiter(
+                (weights.get(aspect, DEFAULT_SCORE_WEIGHT) for aspect in scores), dtype=np.float32, count=len(scores)
+            )
+            total_weight = float(weight_vec.sum())
             
             if total_weight > 0:
-                overall_score = weighted_score / total_weight
+                overall_score = float(score_vec @ weight_vec) / total_weight
             else:
-                overall_score = sum(scores.values()) / len(scores)
+                overall_score = float(score_vec.mean())
             
             return max(0.0, min(100.0, overall_score))
             
@@ -790,7 +1031,18 @@ class EvaluationEngine:
             logger.error(f"Overall score calculation error: {str(e)}")
             return 50.0
 
-    async def _generate_feedback(self, evaluation: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    def _category_scorer(self, category: str) -> Tuple[Tuple[str, ...], "np.ndarray"]:
+        """Scored aspects of a category and their weights normalized to sum to 1, built once per category"""
+        scorer = self._category_scorers.get(category)
+        if scorer is None:
+            aspects = _scored_aspects(category)
+            weights = CATEGORY_SCORE_WEIGHTS.get(category, self._default_score_weights)
+            weight_vec = np.array([weights.get(aspect, DEFAULT_SCORE_WEIGHT) for aspect in aspects], dtype=np.float32)
+            scorer = (aspects, weight_vec / weight_vec.sum())
+            self._category_scorers[category] = scorer
+        return scorer
+
+    def _generate_feedback(self, evaluation: Dict[str, Any]) -> Tuple[List[str], List[str]]:
         """Generate strengths and improvement suggestions"""
         try:
             strengths = []
@@ -849,7 +1101,7 @@ class EvaluationEngine:
             logger.error(f"Feedback generation error: {str(e)}")
             return [], []
 
-    async def _calculate_evaluation_confidence(self, evaluation: Dict[str, Any]) -> float:
+    def _calculate_evaluation_confidence(self, evaluation: Dict[str, Any]) -> float:
         """Calculate confidence in the evaluation"""
         try:
             confidence_factors = []
@@ -879,7 +1131,7 @@ class EvaluationEngine:
             # Score consistency factor
             scores = list(evaluation.get("scores", {}).values())
             if scores:
-                score_std = np.std(scores)
+                score_std = pstdev(scores)
                 if score_std <= 15:  # Consistent scores
                     confidence_factors.append(0.9)
                 elif score_std <= 25:
@@ -888,7 +1140,7 @@ class EvaluationEngine:
                     confidence_factors.append(0.5)
             
             # Overall confidence
-            overall_confidence = np.mean(confidence_factors) if confidence_factors else 0.5
+            overall_confidence = fmean(confidence_factors) if confidence_factors else 0.5
             return overall_confidence
             
         except Exception as e:
@@ -900,13 +1152,18 @@ class EvaluationEngine:
         try:
             evaluations = []
             
+            # Parse all responses through the spaCy worker, which pipes them in batches
+            texts = [response_data.get("response", "") for response_data in responses]
+            docs = await asyncio.gather(*(self._nlp_batcher.submit(text) for text in texts))
+            
             # Process responses in parallel
             tasks = []
-            for response_data in responses:
+            for response_data, text, doc in zip(responses, texts, docs):
                 task = self.evaluate_response(
-                    response=response_data.get("response", ""),
+                    response=text,
                     question=response_data.get("question", {}),
-                    context=response_data.get("context", {})
+                    context=response_data.get("context", {}),
+                    doc=doc
                 )
                 tasks.append(task)
             
@@ -924,6 +1181,10 @@ class EvaluationEngine:
             logger.error(f"Batch evaluation error: {str(e)}")
             return [{"overall_score": 0.0, "error": str(e)} for _ in responses]
 
+    def _analyze_batch(self, responses: List[str]) -> list:
+        """Parse many responses with spaCy's batched pipeline"""
+        return list(self.nlp.pipe(responses, batch_size=SPACY_PIPE_BATCH_SIZE, n_process=1))
+
     def get_evaluation_statistics(self) -> Dict[str, Any]:
         """Get evaluation engine statistics"""
         try:
@@ -946,6 +1207,10 @@ class TechnicalEvaluator:
         self.is_initialized = False
         self.technical_keywords = {}
         self.complexity_patterns = {}
+        self.depth_indicators = {}
+        self.additional_practices = []
+        self.problem_solving_indicators = {}
+        self._matcher = None
     
     async def initialize(self):
         """Initialize technical evaluator"""
@@ -966,6 +1231,32 @@ class TechnicalEvaluator:
                 ]
             }
             
+            self.depth_indicators = {
+                "specific_examples": ["for example", "such as", "like when", "in my experience"],
+                "implementation_details": ["implement", "code", "function", "method", "class", "variable"],
+                "trade_offs": ["trade-off", "pros and cons", "advantage", "disadvantage", "however"]
+            }
+            
+            self.additional_practices = [
+                "clean code", "solid principles", "dry principle", "kiss principle",
+                "code smell", "refactoring", "design pattern", "architecture pattern"
+            ]
+            
+            self.problem_solving_indicators = {
+                "analysis": ["analyze", "identify", "understand", "break down"],
+                "approach": ["approach", "strategy", "method", "solution"],
+                "steps": ["first", "then", "next", "finally", "step"],
+                "alternatives": ["alternative", "option", "different way", "another approach"]
+            }
+            
+            # Every keyword list above, matched in one pass over the response
+            self._matcher = KeywordMatcher({
+                **{f"keywords:{k}": v for k, v in self.technical_keywords.items()},
+                **{f"depth:{k}": v for k, v in self.depth_indicators.items()},
+                "additional_practices": self.additional_practices,
+                **{f"problem_solving:{k}": v for k, v in self.problem_solving_indicators.items()}
+            })
+            
             self.is_initialized = True
             
         except Exception as e:
@@ -975,11 +1266,13 @@ class TechnicalEvaluator:
     async def evaluate(self, response: str, question: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate technical response"""
         try:
+            # Distinct keywords present per list, from one scan of the lowercased response
+            counts = self._matcher.count(response.lower())
             evaluation = {
                 "accuracy_score": await self._assess_technical_accuracy(response, question),
-                "depth_score": await self._assess_technical_depth(response),
-                "best_practices_score": await self._assess_best_practices(response),
-                "problem_solving_score": await self._assess_problem_solving(response),
+                "depth_score": self._assess_technical_depth(counts),
+                "best_practices_score": self._assess_best_practices(counts),
+                "problem_solving_score": self._assess_problem_solving(counts),
                 "overall_score": 0.0
             }
             
@@ -1031,43 +1324,14 @@ class TechnicalEvaluator:
             logger.error(f"Technical accuracy assessment error: {str(e)}")
             return 50.0
 
-    async def _assess_technical_depth(self, response: str) -> float:
+    def _assess_technical_depth(self, counts: Dict[str, int]) -> float:
         """Assess technical depth of response"""
         try:
-            response_lower = response.lower()
-            depth_indicators = {
-                "specific_examples": 0,
-                "technical_terms": 0,
-                "implementation_details": 0,
-                "trade_offs": 0
-            }
-            
-            # Check for specific examples
-            example_phrases = ["for example", "such as", "like when", "in my experience"]
-            depth_indicators["specific_examples"] = sum(
-                1 for phrase in example_phrases if phrase in response_lower
-            )
+            # Specific examples, implementation details and trade-off discussions
+            depth_indicators = {k: counts[f"depth:{k}"] for k in self.depth_indicators}
             
             # Count technical terms
-            all_technical_terms = []
-            for category_terms in self.technical_keywords.values():
-                all_technical_terms.extend(category_terms)
-            
-            depth_indicators["technical_terms"] = sum(
-                1 for term in all_technical_terms if term in response_lower
-            )
-            
-            # Check for implementation details
-            implementation_words = ["implement", "code", "function", "method", "class", "variable"]
-            depth_indicators["implementation_details"] = sum(
-                1 for word in implementation_words if word in response_lower
-            )
-            
-            # Check for trade-off discussions
-            tradeoff_words = ["trade-off", "pros and cons", "advantage", "disadvantage", "however"]
-            depth_indicators["trade_offs"] = sum(
-                1 for word in tradeoff_words if word in response_lower
-            )
+            depth_indicators["technical_terms"] = sum(counts[f"keywords:{k}"] for k in self.technical_keywords)
             
             # Calculate depth score
             base_score = 40
@@ -1083,25 +1347,13 @@ class TechnicalEvaluator:
             logger.error(f"Technical depth assessment error: {str(e)}")
             return 50.0
 
-    async def _assess_best_practices(self, response: str) -> float:
+    def _assess_best_practices(self, counts: Dict[str, int]) -> float:
         """Assess mention of best practices"""
         try:
-            response_lower = response.lower()
-            best_practice_terms = self.technical_keywords.get("best_practices", [])
-            
-            mentioned_practices = sum(
-                1 for practice in best_practice_terms if practice in response_lower
-            )
+            mentioned_practices = counts.get("keywords:best_practices", 0)
             
             # Additional best practice indicators
-            additional_practices = [
-                "clean code", "solid principles", "dry principle", "kiss principle",
-                "code smell", "refactoring", "design pattern", "architecture pattern"
-            ]
-            
-            additional_mentions = sum(
-                1 for practice in additional_practices if practice in response_lower
-            )
+            additional_mentions = counts["additional_practices"]
             
             total_mentions = mentioned_practices + additional_mentions
             best_practices_score = min(total_mentions * 20, 100)
@@ -1112,20 +1364,12 @@ class TechnicalEvaluator:
             logger.error(f"Best practices assessment error: {str(e)}")
             return 50.0
 
-    async def _assess_problem_solving(self, response: str) -> float:
+    def _assess_problem_solving(self, counts: Dict[str, int]) -> float:
         """Assess problem-solving approach"""
         try:
-            response_lower = response.lower()
-            problem_solving_indicators = {
-                "analysis": ["analyze", "identify", "understand", "break down"],
-                "approach": ["approach", "strategy", "method", "solution"],
-                "steps": ["first", "then", "next", "finally", "step"],
-                "alternatives": ["alternative", "option", "different way", "another approach"]
-            }
-            
             scores = {}
-            for category, indicators in problem_solving_indicators.items():
-                score = sum(1 for indicator in indicators if indicator in response_lower)
+            for category in self.problem_solving_indicators:
+                score = counts[f"problem_solving:{category}"]
                 scores[category] = min(score * 25, 100)
             
             # Calculate overall problem-solving score
@@ -1144,6 +1388,9 @@ class BehavioralEvaluator:
         self.is_initialized = False
         self.star_indicators = {}
         self.leadership_indicators = {}
+        self.teamwork_indicators = []
+        self.adaptability_indicators = []
+        self._matcher = None
     
     async def initialize(self):
         """Initialize behavioral evaluator"""
@@ -1160,6 +1407,24 @@ class BehavioralEvaluator:
                 "motivated", "inspired", "delegated", "supervised", "directed"
             ]
             
+            self.teamwork_indicators = [
+                "team", "collaborated", "worked together", "coordinated", "communicated",
+                "shared", "supported", "helped", "cooperation", "partnership"
+            ]
+            
+            self.adaptability_indicators = [
+                "adapt", "change", "flexible", "adjust", "learn", "new",
+                "different", "challenge", "overcome", "pivot", "evolve"
+            ]
+            
+            # Every indicator list above, matched in one pass over the response
+            self._matcher = KeywordMatcher({
+                **{f"star:{k}": v for k, v in self.star_indicators.items()},
+                "leadership": self.leadership_indicators,
+                "teamwork": self.teamwork_indicators,
+                "adaptability": self.adaptability_indicators
+            })
+            
             self.is_initialized = True
             
         except Exception as e:
@@ -1169,11 +1434,13 @@ class BehavioralEvaluator:
     async def evaluate(self, response: str, question: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate behavioral response"""
         try:
+            # Distinct indicators present per list, from one scan of the lowercased response
+            counts = self._matcher.count(response.lower())
             evaluation = {
-                "star_completeness": await self._assess_star_method(response),
-                "leadership_score": await self._assess_leadership(response),
-                "teamwork_score": await self._assess_teamwork(response),
-                "adaptability_score": await self._assess_adaptability(response),
+                "star_completeness": self._assess_star_method(counts),
+                "leadership_score": self._assess_leadership(counts),
+                "teamwork_score": self._assess_teamwork(counts),
+                "adaptability_score": self._assess_adaptability(counts),
                 "overall_score": 0.0
             }
             
@@ -1190,14 +1457,13 @@ class BehavioralEvaluator:
             logger.error(f"Behavioral evaluation error: {str(e)}")
             return {"overall_score": 50.0}
 
-    async def _assess_star_method(self, response: str) -> float:
+    def _assess_star_method(self, counts: Dict[str, int]) -> float:
         """Assess STAR method completeness"""
         try:
-            response_lower = response.lower()
             star_scores = {}
             
-            for component, indicators in self.star_indicators.items():
-                score = sum(1 for indicator in indicators if indicator in response_lower)
+            for component in self.star_indicators:
+                score = counts[f"star:{component}"]
                 star_scores[component] = min(score * 25, 100)
             
             # Calculate completeness
@@ -1208,13 +1474,10 @@ class BehavioralEvaluator:
             logger.error(f"STAR method assessment error: {str(e)}")
             return 50.0
 
-    async def _assess_leadership(self, response: str) -> float:
+    def _assess_leadership(self, counts: Dict[str, int]) -> float:
         """Assess leadership indicators"""
         try:
-            response_lower = response.lower()
-            leadership_mentions = sum(
-                1 for indicator in self.leadership_indicators if indicator in response_lower
-            )
+            leadership_mentions = counts["leadership"]
             
             leadership_score = min(leadership_mentions * 20, 100)
             return max(leadership_score, 30.0)
@@ -1223,18 +1486,10 @@ class BehavioralEvaluator:
             logger.error(f"Leadership assessment error: {str(e)}")
             return 50.0
 
-    async def _assess_teamwork(self, response: str) -> float:
+    def _assess_teamwork(self, counts: Dict[str, int]) -> float:
         """Assess teamwork indicators"""
         try:
-            response_lower = response.lower()
-            teamwork_indicators = [
-                "team", "collaborated", "worked together", "coordinated", "communicated",
-                "shared", "supported", "helped", "cooperation", "partnership"
-            ]
-            
-            teamwork_mentions = sum(
-                1 for indicator in teamwork_indicators if indicator in response_lower
-            )
+            teamwork_mentions = counts["teamwork"]
             
             teamwork_score = min(teamwork_mentions * 15, 100)
             return max(teamwork_score, 30.0)
@@ -1243,18 +1498,10 @@ class BehavioralEvaluator:
             logger.error(f"Teamwork assessment error: {str(e)}")
             return 50.0
 
-    async def _assess_adaptability(self, response: str) -> float:
+    def _assess_adaptability(self, counts: Dict[str, int]) -> float:
         """Assess adaptability indicators"""
         try:
-            response_lower = response.lower()
-            adaptability_indicators = [
-                "adapt", "change", "flexible", "adjust", "learn", "new",
-                "different", "challenge", "overcome", "pivot", "evolve"
-            ]
-            
-            adaptability_mentions = sum(
-                1 for indicator in adaptability_indicators if indicator in response_lower
-            )
+            adaptability_mentions = counts["adaptability"]
             
             adaptability_score = min(adaptability_mentions * 12, 100)
             return max(adaptability_score, 30.0)
@@ -22,9 +22,8 @@ sync_database = None
 
 async def connect_to_mongo():
     """Connect to MongoDB"""
-    global async_client, async_database
-    async_client = AsyncIOMotorClient(MONGO_URL)
-    async_database = async_client[DATABASE_NAME]
+    global async_database
+    async_database = get_async_mongo_client()[DATABASE_NAME]
     
     # Create indexes
     await create_indexes()
@@ -35,6 +34,13 @@ async def close_mongo_connection():
     if async_client:
         async_client.close()
 
+def get_async_mongo_client():
+    """Get async (Motor) MongoDB client, created on first use"""
+    global async_client
+    if not async_client:
+        async_client = AsyncIOMotorClient(MONGO_URL)
+    return async_client
+
 def get_mongo_client():
     """Get sync MongoDB client"""
     global sync_client, sync_database
@@ -58,7 +64,7 @@ async def create_indexes():
         await async_database.resume_analyses.create_index("analyzed_at")
         
         # Interview sessions indexes
-        await async_database.interview_sessions.create_index("id")
+        await async_database.interview_sessions.create_index("id", unique=True)
         await async_database.interview_sessions.create_index("candidate_id")
         await async_database.interview_sessions.create_index("job_id")
         await async_database.interview_sessions.create_index("started_at")
@@ -66,6 +72,7 @@ async def create_indexes():
         # Interview messages indexes
         await async_database.interview_messages.create_index("session_id")
         await async_database.interview_messages.create_index("timestamp")
+        await async_database.interview_messages.create_index([("session_id", 1), ("timestamp", -1)])
         
         # Call logs indexes
         await async_database.call_logs.create_index("user_id")
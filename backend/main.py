@@ -111,6 +111,12 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down HR Agent System...")
+    
+    # Persist any buffered interview sessions and messages
+    if interview_agent is not None:
+        await interview_agent.flush_sessions()
+        await interview_agent.flush_messages()
+        await interview_agent.close()
 
 # Schema models
 from pydantic import BaseModel
@@ -144,7 +150,7 @@ class StartInterviewRequest(BaseModel):
 class InterviewSessionResponse(BaseModel):
     session_id: str
     status: str
-    started_at: str
+    started_at: datetime
 
 class InterviewMessageRequest(BaseModel):
     content: str
@@ -159,6 +165,9 @@ class InterviewEvaluationResponse(BaseModel):
     overall_score: float
     feedback: str
 
+class BulkInterviewEvaluationRequest(BaseModel):
+    session_ids: List[str]
+
 class VoiceSynthesisRequest(BaseModel):
     text: str
     voice: str = "default"
@@ -365,6 +374,18 @@ async def get_interview_evaluation(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/interviews/evaluations")
+async def get_interview_evaluations(
+    request: BulkInterviewEvaluationRequest,
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get evaluations for several interviews at once; unknown sessions map to an empty result"""
+    try:
+        return await interview_agent.get_evaluations_bulk(request.session_ids, db)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 # Voice processing endpoints
 @app.post("/voice/synthesize")
 async def synthesize_speech(
@@ -0,0 +1,24 @@
+"""
+Shared test fixtures
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+AGENTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "agents")
+
+
+@pytest.fixture(scope="session")
+def evaluation_engine_module():
+    """backend/agents/interview_agent/evaluation_engine.py, loaded by path.
+
+    The interview_agent.py module shadows the interview_agent package, so the
+    engine cannot be imported by its dotted name.
+    """
+    path = os.path.join(AGENTS_DIR, "interview_agent", "evaluation_engine.py")
+    spec = importlib.util.spec_from_file_location("evaluation_engine", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
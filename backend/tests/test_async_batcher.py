@@ -0,0 +1,92 @@
+"""
+Tests for the async micro-batcher
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from backend.utils.async_batcher import AsyncBatcher
+
+
+def test_results_follow_submission_order():
+    batches = []
+
+    def double(items):
+        batches.append(list(items))
+        return [item * 2 for item in items]
+
+    async def scenario():
+        batcher = AsyncBatcher(double, max_batch_size=4, max_wait_ms=50)
+        try:
+            return await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+        finally:
+            await batcher.close()
+
+    assert asyncio.run(scenario()) == [i * 2 for i in range(10)]
+    assert all(len(batch) <= 4 for batch in batches)
+    assert len(batches) < 10
+
+
+def test_batch_error_is_raised_to_every_caller():
+    def fail(items):
+        raise ValueError("model failed")
+
+    async def scenario():
+        batcher = AsyncBatcher(fail)
+        try:
+            return await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+        finally:
+            await batcher.close()
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_result_count_mismatch_fails_the_batch():
+    async def scenario():
+        batcher = AsyncBatcher(lambda items: items[:1], max_wait_ms=50)
+        try:
+            return await asyncio.wait_for(
+                asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True), 1
+            )
+        finally:
+            await batcher.close()
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_close_fails_in_flight_and_queued_requests():
+    release = threading.Event()
+
+    def blocking(items):
+        release.wait(1)
+        return items
+
+    async def scenario():
+        batcher = AsyncBatcher(blocking, max_batch_size=1, max_wait_ms=0)
+        tasks = [asyncio.create_task(batcher.submit(i)) for i in range(3)]
+        await asyncio.sleep(0.05)
+        await batcher.close()
+        release.set()
+        return await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), 1)
+
+    results = asyncio.run(scenario())
+    assert len(results) == 3
+    for result in results:
+        assert isinstance(result, RuntimeError)
+        assert "closed" in str(result)
+
+
+def test_batcher_restarts_after_close():
+    async def scenario():
+        batcher = AsyncBatcher(lambda items: [item + 1 for item in items])
+        first = await batcher.submit(1)
+        await batcher.close()
+        second = await batcher.submit(2)
+        await batcher.close()
+        return first, second
+
+    assert asyncio.run(scenario()) == (2, 3)
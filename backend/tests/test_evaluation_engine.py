@@ -0,0 +1,104 @@
+"""
+Tests for the evaluation engine's text metrics
+"""
+
+import numpy as np
+import pytest
+
+RESPONSES = [
+    "I led a team of five engineers. We redesigned the caching layer, which was slowing down every request.",
+    "The database was migrated gradually, and the old schema was retired once traffic had been moved over.",
+    "Yes.",
+    "Honestly, I think communication matters more than tooling when deadlines are tight and requirements keep changing.",
+]
+
+
+def _count_syllables_reference(word):
+    word = word.lower()
+    vowels = "aeiouy"
+    syllable_count = 0
+    prev_was_vowel = False
+    for char in word:
+        is_vowel = char in vowels
+        if is_vowel and not prev_was_vowel:
+            syllable_count += 1
+        prev_was_vowel = is_vowel
+    if word.endswith('e') and syllable_count > 1:
+        syllable_count -= 1
+    return max(syllable_count, 1)
+
+
+def _text_metrics_reference(engine, response, doc):
+    words = [token.text for token in doc if not token.is_space]
+    sentences = list(doc.sents)
+    unique_words = len(set(word.lower() for word in words if word.isalpha()))
+    syllable_count = sum(_count_syllables_reference(word) for word in words if word.isalpha())
+    pos_tags = [token.pos_ for token in doc]
+
+    complex_structures = 0
+    for token in doc:
+        if token.dep_ in ["advcl", "acl", "relcl"]:
+            complex_structures += 1
+        if token.dep_ == "auxpass":
+            complex_structures += 1
+        if token.pos_ == "VERB" and len(token.text) > 6:
+            complex_structures += 1
+
+    return {
+        "word_count": len(words),
+        "sentence_count": len(sentences),
+        "unique_words": unique_words,
+        "vocabulary_richness": unique_words / max(len(words), 1),
+        "avg_word_length": float(np.mean([len(word) for word in words if word.isalpha()])),
+        "avg_sentence_length": len(words) / max(len(sentences), 1),
+        "flesch_readability": engine._calculate_flesch_score(len(words), len(sentences), syllable_count),
+        "pos_diversity": len(set(pos_tags)) / max(len(pos_tags), 1),
+        "character_count": len(response),
+        "complexity_score": min((complex_structures / max(len(sentences), 1)) * 20, 100.0),
+    }
+
+
+@pytest.mark.parametrize("word", [
+    "a", "the", "table", "engine", "rhythm", "queue", "beautiful", "see", "be", "algorithm", "xyz", "eye", "",
+])
+def test_count_syllables_matches_character_loop(evaluation_engine_module, word):
+    engine = evaluation_engine_module.EvaluationEngine.__new__(evaluation_engine_module.EvaluationEngine)
+    assert engine._count_syllables(word) == _count_syllables_reference(word)
+
+
+def test_text_metrics_match_token_loop(evaluation_engine_module):
+    spacy = pytest.importorskip("spacy")
+    try:
+        nlp = spacy.load(evaluation_engine_module.SPACY_CPU_MODEL)
+    except OSError:
+        pytest.skip(f"{evaluation_engine_module.SPACY_CPU_MODEL} is not installed")
+
+    engine = evaluation_engine_module.EvaluationEngine.__new__(evaluation_engine_module.EvaluationEngine)
+    strings = nlp.vocab.strings
+    engine._complex_dep_ids = np.array(
+        [strings.add(label) for label in evaluation_engine_module.COMPLEX_DEP_LABELS], dtype=np.uint64
+    )
+
+    for response in RESPONSES:
+        doc = nlp(response)
+        metrics = engine._analyze_text_metrics(response, doc)
+        expected = _text_metrics_reference(engine, response, doc)
+        assert metrics.keys() == expected.keys()
+        for key, value in expected.items():
+            assert metrics[key] == pytest.approx(value), key
+
+
+def test_question_vectors_are_cached_by_text(evaluation_engine_module):
+    class CountingVectorizer:
+        calls = 0
+
+        def transform(self, texts):
+            self.calls += 1
+            return texts[0]
+
+    engine = evaluation_engine_module.EvaluationEngine()
+    engine.relevance_vectorizer = CountingVectorizer()
+    assert engine._question_vector("Describe a REST API.") == "Describe a REST API."
+    assert engine._question_vector("Explain database indexing.") == "Explain database indexing."
+    assert engine._question_vector("Describe a REST API.") == "Describe a REST API."
+    assert engine.relevance_vectorizer.calls == 2
@@ -0,0 +1,337 @@
+"""
+Behavioral tests for the chat interview agent
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+import backend.agents.interview_agent as interview_agent_module
+from backend.agents.interview_agent import InterviewAgent
+
+
+class FakeCollection:
+    """Async stand-in for a Motor collection that fails the first ``failures`` writes"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.bulk_writes = []
+        self.inserted = []
+
+    async def bulk_write(self, requests, ordered=True):
+        self.bulk_writes.append(list(requests))
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("mongo unavailable")
+
+    async def insert_many(self, documents, ordered=True):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("mongo unavailable")
+        self.inserted.extend(documents)
+
+
+async def _wait_for(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture
+def fast_flush(monkeypatch):
+    monkeypatch.setattr(interview_agent_module, "SESSION_FLUSH_DELAY", 0.01)
+
+
+def test_failed_session_write_is_retried_without_new_changes(fast_flush):
+    async def scenario():
+        agent = InterviewAgent()
+        agent._sessions_col = FakeCollection(failures=1)
+        session = {"id": "s1", "status": "active"}
+        await agent._update_session_data("s1", {"status": "active"}, session)
+        
+        # Only the failure itself may wake the writer for the retry
+        await _wait_for(lambda: len(agent._sessions_col.bulk_writes) == 2)
+        await agent.flush_sessions()
+        return agent
+
+    agent = asyncio.run(scenario())
+    expected = [UpdateOne({"id": "s1"}, {"$set": {"status": "active"}})]
+    assert agent._sessions_col.bulk_writes == [expected, expected]
+    assert agent._pending == {}
+    assert "s1" not in agent._session_docs
+
+
+def test_requeued_session_delta_keeps_newer_values():
+    async def scenario():
+        agent = InterviewAgent()
+        agent._sessions_col = FakeCollection(failures=1)
+        agent._pending = {"s1": {"status": "active", "current_question_index": 1}}
+        assert await agent._write_pending_sessions() is False
+        agent._pending["s1"]["current_question_index"] = 2
+        assert await agent._write_pending_sessions() is True
+        return agent
+
+    agent = asyncio.run(scenario())
+    assert agent._sessions_col.bulk_writes[-1] == [
+        UpdateOne({"id": "s1"}, {"$set": {"status": "active", "current_question_index": 2}})
+    ]
+
+
+class FakeSessionStore(FakeCollection):
+    """FakeCollection that also serves find_one from a dict of documents"""
+
+    def __init__(self, documents, failures=0):
+        super().__init__(failures)
+        self.documents = documents
+
+    async def find_one(self, query, projection=None):
+        document = self.documents.get(query["id"])
+        return dict(document, evaluation=dict(document["evaluation"])) if document else None
+
+
+def _legacy_session():
+    # Stored before running totals: one list entry per scored message
+    return {
+        "id": "legacy",
+        "status": "active",
+        "evaluation": {
+            "scores": {"communication": [70, 90], "technical_competency": [60]},
+            "overall_score": 95.0
+        }
+    }
+
+
+def test_legacy_list_scores_are_converted_on_read():
+    async def scenario():
+        agent = InterviewAgent()
+        agent._sessions_col = FakeSessionStore({"legacy": _legacy_session()})
+        return await agent._get_session_data("legacy")
+
+    session = asyncio.run(scenario())
+    assert session["evaluation"]["scores"] == {
+        "communication": {"sum": 160.0, "count": 2},
+        "technical_competency": {"sum": 60.0, "count": 1}
+    }
+
+
+def test_legacy_session_keeps_scoring_and_reporting():
+    async def no_summary(session_data, messages):
+        return {}
+
+    async def scenario():
+        agent = InterviewAgent()
+        agent._sessions_col = FakeSessionStore({"legacy": _legacy_session()})
+        session = await agent._get_session_data("legacy")
+        agent._generate_ai_evaluation_summary = no_summary
+        agent._record_score(session, "communication", 80)
+        await agent._calculate_overall_score(session)
+        return agent, session, await agent._generate_comprehensive_evaluation(session, [])
+
+    agent, session, evaluation = asyncio.run(scenario())
+    assert session["evaluation"]["scores"]["communication"] == {"sum": 240.0, "count": 3}
+    assert agent._average_scores(session["evaluation"]["scores"]) == {
+        "communication": 80.0, "technical_competency": 60.0
+    }
+    assert evaluation["detailed_scores"] == {"communication": 80.0, "technical_competency": 60.0}
+    assert evaluation["areas_for_improvement"] == []
+    assert evaluation["strengths"] == ["Strong communication"]
+
+
+def test_aggregate_scores_flags_strengths_and_improvements():
+    sums = np.array([170.0, 110.0, 0.0, 140.0])
+    counts = np.array([2, 2, 0, 2], dtype=np.int64)
+    means, strong, weak = interview_agent_module._aggregate_scores(
+        sums, counts, interview_agent_module.STRENGTH_THRESHOLD, interview_agent_module.IMPROVEMENT_THRESHOLD
+    )
+    assert means.tolist() == [85.0, 55.0, 0.0, 70.0]
+    assert strong.tolist() == [True, False, False, False]
+    assert weak.tolist() == [False, True, False, False]
+
+
+def test_overall_score_is_weighted_mean_of_scored_criteria():
+    agent = InterviewAgent()
+    session = {"id": "s1", "evaluation": {"scores": {}, "overall_score": 0.0}}
+    agent._record_score(session, "communication", 80)
+    agent._record_score(session, "communication", 60)
+    agent._record_score(session, "technical_competency", 90)
+    asyncio.run(agent._calculate_overall_score(session))
+
+    weights = {c: config["weight"] for c, config in agent.evaluation_criteria.items()}
+    expected = (70 * weights["communication"] + 90 * weights["technical_competency"]) / (
+        weights["communication"] + weights["technical_competency"]
+    )
+    assert session["evaluation"]["overall_score"] == pytest.approx(expected)
+
+
+def test_stored_messages_are_inserted_through_the_cached_collection():
+    async def scenario():
+        agent = InterviewAgent()
+        agent._messages_col = FakeCollection()
+        await agent.store_message("s1", "hello", {"session_status": "completed"}, mongo_db=None)
+        return agent
+
+    agent = asyncio.run(scenario())
+    assert [doc["user_message"] for doc in agent._messages_col.inserted] == ["hello"]
+    assert agent._msg_buffered == 0
+
+
+class PartialInsertCollection:
+    """Collection whose insert_many reports per-document write errors by index and code"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        self.attempts = []
+
+    async def insert_many(self, documents, ordered=True):
+        self.attempts.append(list(documents))
+        raise BulkWriteError({
+            "writeErrors": [{"index": index, "code": code, "errmsg": "rejected"} for index, code in self.errors]
+        })
+
+
+def _message(session_id, text):
+    return {"session_id": session_id, "user_message": text}
+
+
+def test_failed_message_insert_is_requeued_ahead_of_newer_messages(monkeypatch):
+    monkeypatch.setattr(interview_agent_module, "MESSAGE_FLUSH_INTERVAL", 60)
+
+    async def scenario():
+        agent = InterviewAgent()
+        agent._messages_col = FakeCollection(failures=1)
+        agent._msg_buffers = {"s1": [_message("s1", "a"), _message("s1", "b")]}
+        agent._msg_buffered = 2
+        await agent.flush_messages()
+        agent._msg_buffers["s1"].append(_message("s1", "c"))
+        agent._msg_buffered += 1
+        await agent.flush_messages()
+        agent._msg_flush_task.cancel()
+        return agent
+
+    agent = asyncio.run(scenario())
+    assert [doc["user_message"] for doc in agent._messages_col.inserted] == ["a", "b", "c"]
+    assert agent._msg_buffered == 0
+
+
+def test_partially_inserted_batch_requeues_only_rejected_documents(monkeypatch):
+    monkeypatch.setattr(interview_agent_module, "MESSAGE_FLUSH_INTERVAL", 60)
+
+    async def scenario():
+        agent = InterviewAgent()
+        # Document 1 failed validation; document 2 was already stored by an earlier attempt
+        agent._messages_col = PartialInsertCollection([(1, 121), (2, interview_agent_module.DUPLICATE_KEY_ERROR)])
+        agent._msg_buffers = {"s1": [_message("s1", "a"), _message("s1", "b"), _message("s1", "c")]}
+        agent._msg_buffered = 3
+        await agent.flush_messages()
+        agent._msg_flush_task.cancel()
+        return agent
+
+    agent = asyncio.run(scenario())
+    assert [doc["user_message"] for doc in agent._msg_buffers["s1"]] == ["b"]
+    assert agent._msg_buffered == 1
+
+
+def test_canned_response_is_stable_per_question():
+    canned = interview_agent_module._canned_response
+    reply = canned("q-1", "positive", "strong")
+    assert reply in interview_agent_module._CANNED_RESPONSES["strong"]
+    assert canned("q-1", "positive", "strong") == reply
+    assert canned("q-1", "neutral", "brief") in interview_agent_module._CANNED_RESPONSES["brief"]
+
+
+def test_canned_response_defers_to_the_model_when_unclear():
+    canned = interview_agent_module._canned_response
+    assert canned("q-1", "negative", "strong") is None
+    assert canned("q-1", "positive", "mixed") is None
+
+
+def test_brief_answer_gets_a_canned_reply_without_calling_the_model():
+    async def fail_llm_call(*args, **kwargs):
+        raise AssertionError("the model should not be called")
+
+    agent = InterviewAgent()
+    agent._llm_call = fail_llm_call
+    session = {"current_question": {"id": "q-7", "text": "Tell me about a project."}}
+    analysis = {"communication_quality": {"word_count": 2}, "sentiment": {"label": "NEUTRAL"}}
+    reply = asyncio.run(agent._generate_ai_response("Not much.", session, analysis))
+    assert reply == interview_agent_module._canned_response("q-7", "neutral", "brief")
+
+
+class FakeOpenAI:
+    """Chat completion client that counts calls and can hold them until released"""
+
+    def __init__(self, error=None):
+        self.calls = 0
+        self.error = error
+        self.release = asyncio.Event()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, messages, **kwargs):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        reply = f" reply to {messages[-1]['content']} "
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+
+
+def test_identical_llm_calls_share_one_request_and_the_cache():
+    async def scenario():
+        agent = InterviewAgent()
+        client = agent._openai_client = FakeOpenAI()
+        calls = [asyncio.create_task(agent._llm_call("same", "sys")) for _ in range(3)]
+        await asyncio.sleep(0)
+        client.release.set()
+        results = await asyncio.gather(*calls)
+        cached = await agent._llm_call("same", "sys")
+        other = await agent._llm_call("other", "sys")
+        return client, results, cached, other
+
+    client, results, cached, other = asyncio.run(scenario())
+    assert results == ["reply to same"] * 3
+    assert cached == "reply to same"
+    assert other == "reply to other"
+    assert client.calls == 2
+
+
+def test_llm_error_reaches_every_waiter_and_is_not_cached():
+    async def scenario():
+        agent = InterviewAgent()
+        client = agent._openai_client = FakeOpenAI(error=RuntimeError("rate limited"))
+        calls = [asyncio.create_task(agent._llm_call("same", "sys")) for _ in range(2)]
+        await asyncio.sleep(0)
+        client.release.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        client.error = None
+        retried = await agent._llm_call("same", "sys")
+        return client, results, retried, agent
+
+    client, results, retried, agent = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert retried == "reply to same"
+    assert client.calls == 2
+    assert agent._llm_inflight == {}
+
+
+def test_waiter_recovers_when_the_owning_llm_call_is_cancelled():
+    async def scenario():
+        agent = InterviewAgent()
+        client = agent._openai_client = FakeOpenAI()
+        owner = asyncio.create_task(agent._llm_call("same", "sys"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(agent._llm_call("same", "sys"))
+        await asyncio.sleep(0)
+        owner.cancel()
+        await asyncio.sleep(0)
+        client.release.set()
+        return await asyncio.wait_for(waiter, 1), owner.cancelled(), client.calls
+
+    result, owner_cancelled, calls = asyncio.run(scenario())
+    assert result == "reply to same"
+    assert owner_cancelled
+    assert calls == 2
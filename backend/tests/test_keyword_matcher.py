@@ -0,0 +1,66 @@
+"""
+Tests for the Aho-Corasick keyword matcher
+"""
+
+import random
+
+import pytest
+
+from backend.utils.keyword_matcher import KeywordMatcher
+
+GROUPS = {
+    "technical": ["algorithm", "data structure", "api", "rapid", "database", "data"],
+    "behavioral": ["team", "led", "data", "steam", "learned"],
+}
+
+TEXTS = [
+    "",
+    "i led the team that rebuilt the database api",
+    "rapid api rapid api data data data",
+    "we learned about the steam engine and a data structure",
+    "nothing relevant here",
+]
+
+
+def _random_texts(count=200, seed=7):
+    rng = random.Random(seed)
+    vocabulary = [kw for keywords in GROUPS.values() for kw in keywords] + ["the", "a", "x", " ", "s"]
+    return ["".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 12))) for _ in range(count)]
+
+
+@pytest.fixture(params=["automaton", "fallback"])
+def matcher(request):
+    matcher = KeywordMatcher(GROUPS)
+    if request.param == "automaton":
+        if matcher._automaton is None:
+            pytest.skip("pyahocorasick is not installed")
+    else:
+        matcher._automaton = None
+    return matcher
+
+
+def test_count_matches_substring_membership(matcher):
+    for text in TEXTS + _random_texts():
+        expected = {group: sum(1 for kw in keywords if kw in text) for group, keywords in GROUPS.items()}
+        assert matcher.count(text) == expected
+
+
+def test_find_keeps_declaration_order(matcher):
+    for text in TEXTS + _random_texts():
+        expected = {group: [kw for kw in keywords if kw in text] for group, keywords in GROUPS.items()}
+        assert matcher.find(text) == expected
+
+
+def test_keyword_in_several_groups_is_reported_in_each(matcher):
+    found = matcher.find("data")
+    assert found["technical"] == ["data"]
+    assert found["behavioral"] == ["data"]
+
+
+def test_occurrences_match_str_count(matcher):
+    for text in TEXTS:
+        expected = {
+            group: {kw: text.count(kw) for kw in keywords if kw in text}
+            for group, keywords in GROUPS.items()
+        }
+        assert matcher.occurrences(text) == expected
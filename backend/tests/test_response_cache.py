@@ -0,0 +1,29 @@
+"""
+Tests for the LLM response cache
+"""
+
+from backend.utils.response_cache import ResponseCache
+
+
+def test_exact_key_depends_on_model_and_prompt():
+    assert ResponseCache.exact_key("m", "prompt") == ResponseCache.exact_key("m", "prompt")
+    assert ResponseCache.exact_key("m", "prompt") != ResponseCache.exact_key("n", "prompt")
+    assert ResponseCache.exact_key("m", "prompt") != ResponseCache.exact_key("m", "prompt ")
+
+
+def test_evicts_least_recently_used():
+    cache = ResponseCache(max_size=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get_exact("a") == "A"
+    cache.put("c", "C")
+    assert cache.get_exact("b") is None
+    assert cache.get_exact("a") == "A"
+    assert cache.get_exact("c") == "C"
+
+
+def test_put_replaces_existing_value():
+    cache = ResponseCache(max_size=2)
+    cache.put("a", "A")
+    cache.put("a", "A2")
+    assert cache.get_exact("a") == "A2"
@@ -0,0 +1,53 @@
+"""
+Tests for packed score histories and hiring bands
+"""
+
+import numpy as np
+
+from backend.utils.scoring import hire_band, pack_scores, unpack_scores
+
+
+def _hire_band_reference(overall_score):
+    if overall_score >= 85:
+        return "Strong Hire", "High"
+    elif overall_score >= 75:
+        return "Hire", "Medium-High"
+    elif overall_score >= 60:
+        return "Maybe", "Medium"
+    return "No Hire", "High"
+
+
+def test_pack_round_trips_integer_scores():
+    scores = [0, 1, 42, 99, 100]
+    packed = pack_scores(scores)
+    assert isinstance(packed, bytes)
+    assert len(packed) == len(scores)
+    assert unpack_scores(packed).tolist() == scores
+
+
+def test_pack_rounds_and_clips():
+    assert unpack_scores(pack_scores([72.4, 72.6, -5, 130])).tolist() == [72, 73, 0, 100]
+
+
+def test_pack_returns_packed_input_unchanged():
+    packed = pack_scores([10, 20])
+    assert pack_scores(packed) is packed
+
+
+def test_packed_histories_concatenate():
+    history = pack_scores(b"") + pack_scores([50])
+    history = pack_scores(history) + pack_scores([70])
+    assert unpack_scores(history).tolist() == [50, 70]
+
+
+def test_unpack_accepts_legacy_lists():
+    values = unpack_scores([55.5, 80])
+    assert values.dtype == np.float32
+    assert values.tolist() == [55.5, 80]
+
+
+def test_hire_band_matches_threshold_cascade():
+    scores = [-10, 0, 59.99, 60, 60.01, 74.9, 75, 84.999, 85, 90, 100, 120]
+    scores += np.linspace(0, 100, 1001).tolist()
+    for score in scores:
+        assert hire_band(score) == _hire_band_reference(score), score
@@ -0,0 +1,110 @@
+"""
+Async micro-batching utilities
+Coalesces concurrent single-item requests into one batched model call
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBatcher:
+    """Collects items submitted by concurrent coroutines and runs them as batches.
+
+    ``batch_fn`` receives a list of items and must return one result per item,
+    in order. It is a blocking callable (e.g. a Hugging Face pipeline) and runs
+    in ``executor`` so the event loop stays responsive.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], max_batch_size: int = 8,
+                 max_wait_ms: float = 20, executor=None):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.executor = executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batch: List[Any] = []
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its result"""
+        loop = asyncio.get_running_loop()
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+        future = loop.create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _run(self):
+        """Drain the queue in batches of up to max_batch_size, waiting at most max_wait"""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await self._run_batch(loop)
+        except asyncio.CancelledError:
+            self._fail_pending(RuntimeError("batcher closed"))
+            raise
+
+    async def _run_batch(self, loop):
+        """Collect and run a single batch, resolving every future in it"""
+        self._batch = batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            results = await loop.run_in_executor(self.executor, self.batch_fn, [item for item, _ in batch])
+        except Exception as e:
+            logger.error(f"Batched call failed for {len(batch)} item(s): {str(e)}")
+            results, error = None, e
+        else:
+            error = None
+            if results is None or len(results) != len(batch):
+                count = "no" if results is None else len(results)
+                error = RuntimeError(f"Batched call returned {count} result(s) for {len(batch)} item(s)")
+                logger.error(str(error))
+
+        self._batch = []
+        if error is not None:
+            self._set_exception(batch, error)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _set_exception(batch: List[Any], error: BaseException):
+        """Fail every unresolved future in the batch"""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def _fail_pending(self, error: BaseException):
+        """Fail the in-flight batch and everything still queued"""
+        self._set_exception(self._batch, error)
+        self._batch = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._set_exception([self._queue.get_nowait()], error)
+
+    async def close(self):
+        """Stop the background batching task, failing any requests still waiting on it"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
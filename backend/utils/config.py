@@ -12,6 +12,10 @@ class Settings(BaseSettings):
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./hr_system.db")
     MONGO_URL: str = os.getenv("MONGO_URL", "mongodb://localhost:27017")
 
+    # Cache - optional; enables the interview session read cache when REDIS_URL is set
+    REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
+    SESSION_CACHE_TTL_SECONDS: int = 3600
+
     # API Keys
     OPENAI_API_KEY: Optional[str] = None
     ANTHROPIC_API_KEY: Optional[str] = None
@@ -61,6 +65,29 @@ class Settings(BaseSettings):
     AUTO_HIRE_MATCH_SCORE: int = 90
     REQUIRE_HUMAN_APPROVAL_FOR_FINAL_OFFER: bool = True
 
+    # Max concurrent OpenAI requests (and pooled connections) per agent
+    OPENAI_CONCURRENCY: int = 8
+
+    # Interview scoring
+    TECH_ACCURACY_HEAD_PATH: Optional[str] = os.getenv("TECH_ACCURACY_HEAD_PATH")
+    TECH_ACCURACY_SCORER_PATH: Optional[str] = os.getenv("TECH_ACCURACY_SCORER_PATH")
+    TECH_ACCURACY_LLM_FALLBACK: bool = True
+    # Skip the feedback LLM call for clearly strong/weak answers
+    ENABLE_STATIC_FEEDBACK: bool = False
+    # Opt-in: torch.compile the interview embedder and scorer and warm them up at startup (slow first start)
+    TORCH_COMPILE_MODELS: bool = False
+    # Opt-in: swap the sentiment/emotion pipelines to BetterTransformer fused attention at load (needs optimum)
+    PIPELINE_BETTERTRANSFORMER: bool = False
+    # CPU-only: run interview models in a process pool, this many torch threads per process
+    INFERENCE_PROCESS_POOL: bool = False
+    INFERENCE_THREADS_PER_PROCESS: int = 4
+    # Opt-in, CPU-only: serve the MiniLM embedder as an int8 ONNX Runtime model (needs optimum)
+    EMBEDDING_ONNX_INT8: bool = False
+    EMBEDDING_ONNX_DIR: str = os.getenv("EMBEDDING_ONNX_DIR", "models/onnx/all-MiniLM-L6-v2-int8")
+    # Opt-in, CPU-only: serve the evaluation engine's sentiment/emotion classifiers as int8 ONNX Runtime models
+    PIPELINE_ONNX_INT8: bool = False
+    PIPELINE_ONNX_DIR: str = os.getenv("PIPELINE_ONNX_DIR", "models/onnx")
+
     @property
     def cors_origins(self) -> List[str]:
         return [o.strip() for o in self.BACKEND_CORS_ORIGINS.split(",") if o.strip()]
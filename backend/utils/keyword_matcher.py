@@ -0,0 +1,74 @@
+"""
+Keyword matching utilities
+Finds many fixed keywords in a text with a single Aho-Corasick pass
+"""
+
+from typing import Dict, Iterable, List
+
+try:
+    import ahocorasick
+    _ahocorasick_available = True
+except ImportError:
+    _ahocorasick_available = False
+
+
+class KeywordMatcher:
+    """Multi-keyword substring matcher grouped by category.
+
+    Matching follows ``keyword in text`` semantics: each keyword is reported
+    at most once per text no matter how often it occurs.
+    """
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        self.groups = {group: tuple(keywords) for group, keywords in groups.items()}
+        self._automaton = None
+
+        if _ahocorasick_available:
+            automaton = ahocorasick.Automaton()
+            for group, keywords in self.groups.items():
+                for keyword in keywords:
+                    # The same keyword may be listed under several groups
+                    payload = automaton.get(keyword, ())
+                    automaton.add_word(keyword, payload + ((group, keyword),))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def find(self, text: str) -> Dict[str, List[str]]:
+        """Return the keywords present in text, per group, in declaration order"""
+        if self._automaton is None:
+            return {
+                group: [kw for kw in keywords if kw in text]
+                for group, keywords in self.groups.items()
+            }
+
+        hits = set()
+        for _, payload in self._automaton.iter(text):
+            hits.update(payload)
+
+        return {
+            group: [kw for kw in keywords if (group, kw) in hits]
+            for group, keywords in self.groups.items()
+        }
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Return the number of distinct keywords present in text, per group"""
+        return {group: len(found) for group, found in self.find(text).items()}
+
+    def occurrences(self, text: str) -> Dict[str, Dict[str, int]]:
+        """Return how many times each present keyword occurs in text, per group.
+
+        Follows ``text.count(keyword)`` except that overlapping occurrences of
+        a self-overlapping keyword (e.g. "aa" in "aaa") are all counted.
+        """
+        if self._automaton is None:
+            counts = {}
+            for group, keywords in self.groups.items():
+                group_counts = {kw: text.count(kw) for kw in keywords}
+                counts[group] = {kw: n for kw, n in group_counts.items() if n}
+            return counts
+
+        counts = {group: {} for group in self.groups}
+        for _, payload in self._automaton.iter(text):
+            for group, keyword in payload:
+                counts[group][keyword] = counts[group].get(keyword, 0) + 1
+        return counts
@@ -0,0 +1,34 @@
+"""
+LLM response cache
+LRU cache of chat completions keyed by a hash of the model and exact prompt
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+
+class ResponseCache:
+    """LRU exact-match cache of completion texts"""
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._exact: "OrderedDict[str, str]" = OrderedDict()
+
+    @staticmethod
+    def exact_key(model: str, prompt: str) -> str:
+        """Hash of the model and full prompt"""
+        return hashlib.sha256((model + prompt).encode()).hexdigest()
+
+    def get_exact(self, key: str) -> Optional[str]:
+        """Cached value for an exact key, refreshing its LRU position"""
+        value = self._exact.get(key)
+        if value is not None:
+            self._exact.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: str):
+        """Store value under an exact key, evicting the least recently used entry when full"""
+        self._exact[key] = value
+        if len(self._exact) > self.max_size:
+            self._exact.popitem(last=False)
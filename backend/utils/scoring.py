@@ -0,0 +1,32 @@
+"""
+Score storage and banding utilities
+Compact 0-100 score histories and hiring recommendation bands
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+# Hiring recommendation bands, highest first; negated for np.searchsorted
+HIRE_THRESHOLDS = np.array([85, 75, 60, 0], dtype=np.float32)
+HIRE_BANDS = (("Strong Hire", "High"), ("Hire", "Medium-High"), ("Maybe", "Medium"), ("No Hire", "High"))
+
+
+def pack_scores(scores) -> bytes:
+    """0-100 scores as one uint8 each (stored as BSON binary); already-packed input is returned as is"""
+    if isinstance(scores, bytes):
+        return scores
+    return np.clip(np.rint(np.asarray(scores, dtype=np.float32)), 0, 100).astype(np.uint8).tobytes()
+
+
+def unpack_scores(scores) -> np.ndarray:
+    """float32 view of a packed score column; older sessions store plain lists"""
+    if isinstance(scores, bytes):
+        return np.frombuffer(scores, dtype=np.uint8).astype(np.float32)
+    return np.asarray(scores, dtype=np.float32)
+
+
+def hire_band(overall_score: float) -> Tuple[str, str]:
+    """Recommendation and confidence of the first band whose threshold the score meets"""
+    band = int(np.searchsorted(-HIRE_THRESHOLDS, -overall_score))
+    return HIRE_BANDS[min(band, len(HIRE_BANDS) - 1)]